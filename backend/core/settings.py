@@ -12,6 +12,7 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.staticfiles",
     "django.contrib.sessions",
+    "django.contrib.postgres",
     "corsheaders",
     "ucap_backend",
     "rest_framework",
@@ -27,9 +28,11 @@ REST_FRAMEWORK = {
 }
 
 MIDDLEWARE = [
+    "ucap_backend.middleware.QueryInstrumentationMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "ucap_backend.middleware.SessionRefreshMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -44,6 +47,7 @@ AUTH_USER_MODEL = "ucap_backend.User"
 
 ROOT_URLCONF = "core.urls"
 WSGI_APPLICATION = "core.wsgi.application"
+ASGI_APPLICATION = "core.asgi.application"
 
 SESSION_COOKIE_SAMESITE = "Lax"
 SESSION_COOKIE_SECURE = True
@@ -56,8 +60,13 @@ CSRF_COOKIE_HTTPONLY = False
 USE_X_FORWARDED_HOST = True
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
+# "django.contrib.sessions.backends.cached_db" serves session reads from CACHES.
+SESSION_ENGINE = os.environ.get("SESSION_ENGINE", "django.contrib.sessions.backends.db")
 SESSION_COOKIE_AGE = 900
-SESSION_SAVE_EVERY_REQUEST = True
+# Sliding expiry is kept by SessionRefreshMiddleware, which re-saves the session at most once per
+# SESSION_REFRESH_SECONDS; 0 restores a write on every request.
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_REFRESH_SECONDS = int(os.environ.get("SESSION_REFRESH_SECONDS", "60"))
 
 DATABASES = {
     "default": {
@@ -70,5 +79,52 @@ DATABASES = {
     }
 }
 
+# Set CACHE_BACKEND/CACHE_LOCATION to a shared cache (Redis, Memcached) when running several workers;
+# gunicorn.conf.py refuses to start more than one worker on the per-process default.
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "ucap"),
+    }
+}
+DASHBOARD_CACHE_SECONDS = int(os.environ.get("DASHBOARD_CACHE_SECONDS", "300"))
+USER_CONTEXT_CACHE_SECONDS = int(os.environ.get("USER_CONTEXT_CACHE_SECONDS", "900"))
+
+# Per-request query count and DB/app time as Server-Timing headers and "ucap_backend.instrumentation" logs.
+REQUEST_INSTRUMENTATION = os.environ.get("REQUEST_INSTRUMENTATION", "False") == "True"
+REQUEST_QUERY_BUDGET = int(os.environ.get("REQUEST_QUERY_BUDGET", "50"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "ucap_backend": {
+            "handlers": ["console"],
+            "level": os.environ.get("UCAP_LOG_LEVEL", "INFO"),
+        },
+    },
+}
+
+# "background" builds new sections' class records on a worker thread after commit, "sync" builds them on commit.
+CLASS_RECORD_PROVISIONING = os.environ.get("CLASS_RECORD_PROVISIONING", "background")
+CLASS_RECORD_MAX_WORKERS = int(os.environ.get("CLASS_RECORD_MAX_WORKERS", "2"))
+# Sections still provisioning after this long are re-queued when their class record is opened.
+CLASS_RECORD_STALE_SECONDS = int(os.environ.get("CLASS_RECORD_STALE_SECONDS", "300"))
+
 STATIC_URL = "/static/"
-STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
\ No newline at end of file
+STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
+# "remote" calls the Hugging Face Space, "local" scores CO/PO text in-process with TF-IDF.
+NLP_OUTCOME_MAPPING_ENGINE = os.environ.get("NLP_OUTCOME_MAPPING_ENGINE", "remote")
+NLP_LOCAL_MIN_SIMILARITY = float(os.environ.get("NLP_LOCAL_MIN_SIMILARITY", "0.15"))
+NLP_REMOTE_SPACE = os.environ.get("NLP_REMOTE_SPACE", "jestoniandales25/BERT_nlp")
+NLP_REMOTE_TIMEOUT_SECONDS = float(os.environ.get("NLP_REMOTE_TIMEOUT_SECONDS", "60"))
+NLP_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("NLP_CIRCUIT_FAILURE_THRESHOLD", "3"))
+NLP_CIRCUIT_RESET_SECONDS = float(os.environ.get("NLP_CIRCUIT_RESET_SECONDS", "120"))
+NLP_MAX_WORKERS = int(os.environ.get("NLP_MAX_WORKERS", "4"))
+NLP_JOB_STALE_SECONDS = int(os.environ.get("NLP_JOB_STALE_SECONDS", "300"))
+# Upper bound for ?wait= on the NLP endpoints, which hold the request open until the job finishes.
+NLP_LONG_POLL_MAX_SECONDS = float(os.environ.get("NLP_LONG_POLL_MAX_SECONDS", "25"))
+NLP_LONG_POLL_INTERVAL_SECONDS = float(os.environ.get("NLP_LONG_POLL_INTERVAL_SECONDS", "0.5"))
@@ -0,0 +1,35 @@
+import multiprocessing
+import os
+
+# Serves core.asgi through uvicorn workers: each worker runs an event loop, so the async
+# views (NLP long-polling, search) wait on I/O without holding the worker.
+# Set GUNICORN_WORKER_CLASS=sync and run core.wsgi:application to fall back to WSGI.
+wsgi_app = os.environ.get("GUNICORN_APP", "core.asgi:application")
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "uvicorn_worker.UvicornWorker")
+# Must stay above NLP_LONG_POLL_MAX_SECONDS so long-polls are not killed mid-wait.
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+accesslog = "-"
+errorlog = "-"
+
+# Dashboard and user-context invalidation bump versioned keys in CACHES. With the
+# default per-process LocMemCache only the worker that handled a write would see
+# the bump, and every other worker would keep serving stale entries.
+PER_PROCESS_CACHE = os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache").endswith(
+    ".LocMemCache"
+)
+# One worker until CACHES points at a shared backend. Several workers also split
+# the in-process job pools (NLP mapping, class record provisioning); jobs lost
+# when a worker is recycled are picked up again once they go stale.
+workers = int(os.environ.get("WEB_CONCURRENCY", 1 if PER_PROCESS_CACHE else multiprocessing.cpu_count() * 2 + 1))
+
+def on_starting(server):
+    if server.cfg.workers > 1 and PER_PROCESS_CACHE:
+        raise RuntimeError(
+            f"{server.cfg.workers} workers need a shared cache: set CACHE_BACKEND/CACHE_LOCATION "
+            "(Redis, Memcached) or run a single worker."
+        )
@@ -0,0 +1,282 @@
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+from ucap_backend.models import Campus, RawScore, Section, Student, User, UserRole
+from ucap_backend.services.synthetic_data import USER_ID_BASE, generate_synthetic_data
+from ucap_backend.services.user_context import get_user_context
+
+BASELINE_PATH = Path(__file__).resolve().parent / "endpoints_baseline.json"
+
+# Small enough to build in well under a minute, large enough that a missing
+# prefetch shows up as extra queries in every dashboard.
+DATASET = {
+    "seed": 0,
+    "campuses": 2,
+    "colleges_per_campus": 2,
+    "departments_per_college": 2,
+    "programs_per_department": 1,
+    "courses_per_program": 8,
+    "academic_years": 2,
+    "sections_per_course": 2,
+    "instructors_per_department": 6,
+    "course_outcomes": 4,
+    "program_outcomes": 8,
+}
+
+# Absolute slack so millisecond-scale endpoints do not fail on timer noise.
+TIME_SLACK_SECONDS = 0.01
+
+# Samples clear the cache, so the run gets a private in-process one rather
+# than whatever CACHES points at (possibly a cache the app servers share).
+BENCHMARK_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ucap-benchmark",
+    }
+}
+
+# ====================================================
+# Fixture
+# ====================================================
+def build_dataset(dataset=DATASET, section_filter=None):
+    generate_synthetic_data(**dataset)
+
+    section = (
+        Section.objects
+        .filter(loaded_course__course__course_code__startswith="SYN", **(section_filter or {}))
+        .select_related("loaded_course__course__program__department__college__campus", "instructor_assigned")
+        .order_by("section_id")
+        .first()
+    )
+    department = section.loaded_course.course.program.department
+    student = Student.objects.filter(section=section).order_by("student_id").first()
+    assessment = RawScore.objects.filter(student=student).order_by("assessment_id").first().assessment
+
+    vpaa = User.objects.filter(user_role__user_role_type="Vice President for Academic Affairs").first()
+    if vpaa is None:
+        vpaa = User.objects.create_user(
+            user_id=USER_ID_BASE - 1,
+            last_name="Benchmark",
+            email="vpaa.benchmark@synthetic.example.edu",
+            user_role=UserRole.objects.get(user_role_type="Vice President for Academic Affairs"),
+        )
+
+    return {
+        "section": section,
+        "loaded_course": section.loaded_course,
+        "instructor": section.instructor_assigned,
+        "student": student,
+        "assessment": assessment,
+        "department": department,
+        "college": department.college,
+        "campus": Campus.objects.get(pk=department.campus_id),
+        "chair": User.objects.get(chair_department=department),
+        "dean": User.objects.get(dean_college=department.college),
+        "vcaa": User.objects.get(vcaa_campus_id=department.campus_id),
+        "vpaa": vpaa,
+    }
+
+def _roster_csv(section):
+    lines = ["Student No,Full Name"]
+    for index, student in enumerate(Student.objects.filter(section=section).order_by("student_id")):
+        lines.append(f"{student.id_number or 2100000000 + index},{student.student_name or f'Student {index + 1}'}")
+    return "\n".join(lines).encode("utf-8")
+
+# ====================================================
+# Endpoints
+# ====================================================
+def endpoint_cases(data):
+    section = data["section"]
+    roster = _roster_csv(section)
+
+    return {
+        "class_record_retrieve": (
+            data["instructor"], "get", f"/instructor/class_record/{section.pk}/", {},
+        ),
+        "assessment_page": (
+            data["instructor"], "get", f"/assessments/{section.pk}/", {},
+        ),
+        "raw_score_update": (
+            data["instructor"], "patch",
+            f"/instructor/rawscores/{data['student'].pk}/{data['assessment'].pk}/",
+            {"data": {"value": 7}, "format": "json"},
+        ),
+        "import_students": (
+            data["instructor"], "post",
+            f"/instructor/students/import/?section={section.pk}&mode=override",
+            {"data": lambda: {"file": SimpleUploadedFile("roster.csv", roster, content_type="text/csv")}, "format": "multipart"},
+        ),
+        "outcome_mapping": (
+            data["instructor"], "get", f"/instructor/outcome_mapping_management/{data['loaded_course'].pk}/", {},
+        ),
+        # The role dashboards the frontend opens: each role's loaded course list.
+        "department_chair_loaded_courses": (
+            data["chair"], "get", f"/department_chair/department_course_management/{data['department'].pk}/", {},
+        ),
+        "dean_loaded_courses": (
+            data["dean"], "get", f"/dean/{data['college'].pk}/", {},
+        ),
+        "vcaa_loaded_courses": (
+            data["vcaa"], "get", f"/campus/{data['campus'].pk}/", {},
+        ),
+        "vpaa_loaded_courses": (
+            data["vpaa"], "get", "/university/", {},
+        ),
+        "department_chair_summary": (
+            data["chair"], "get", f"/department_chair/summary/{data['department'].pk}/", {},
+        ),
+        "dean_summary": (
+            data["dean"], "get", f"/dean/{data['college'].pk}/summary/", {},
+        ),
+        "vcaa_summary": (
+            data["vcaa"], "get", f"/campus/{data['campus'].pk}/summary/", {},
+        ),
+        "vpaa_summary": (
+            data["vpaa"], "get", "/university/summary/", {},
+        ),
+    }
+
+# ====================================================
+# Benchmark Runner
+# ====================================================
+def _call(client, method, url, kwargs):
+    kwargs = {key: value() if callable(value) else value for key, value in kwargs.items()}
+    return getattr(client, method)(url, **kwargs)
+
+def _time_endpoint(user, method, url, kwargs, repeats):
+    client = APIClient()
+    client.force_authenticate(user)
+
+    # One untimed call so lazy imports and first-use setup are not measured.
+    _call(client, method, url, kwargs)
+
+    samples = []
+    queries = []
+    status_code = None
+    for _ in range(repeats):
+        # Dashboards are cached; clearing the (private) cache bypasses them so
+        # every sample measures the uncached path, with a warm user context.
+        cache.clear()
+        get_user_context(user)
+
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = _call(client, method, url, kwargs)
+            samples.append(time.perf_counter() - start)
+        queries.append(len(captured.captured_queries))
+        status_code = response.status_code
+
+    return {
+        "status": status_code,
+        "median_seconds": statistics.median(samples),
+        "max_seconds": max(samples),
+        "queries": max(queries),
+    }
+
+@override_settings(CACHES=BENCHMARK_CACHES)
+def _cpu_model():
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+def benchmark_environment():
+    # Latencies are only comparable on the same hardware and database version.
+    return {
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "database_version": ".".join(str(part) for part in connection.get_database_version()),
+    }
+
+def run_benchmark(repeats=5, names=None):
+    started = time.perf_counter()
+    data = build_dataset()
+    build_seconds = time.perf_counter() - started
+
+    cases = endpoint_cases(data)
+    if names:
+        cases = {name: case for name, case in cases.items() if name in names}
+
+    endpoints = {
+        name: _time_endpoint(user, method, url, kwargs, repeats)
+        for name, (user, method, url, kwargs) in cases.items()
+    }
+
+    return {
+        "database": connection.vendor,
+        "environment": benchmark_environment(),
+        "repeats": repeats,
+        "dataset": DATASET,
+        "dataset_build_seconds": build_seconds,
+        "endpoints": endpoints,
+    }
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def write_baseline(report, path=BASELINE_PATH):
+    baseline = {
+        "database": report["database"],
+        "environment": report["environment"],
+        "dataset": report["dataset"],
+        "endpoints": {
+            name: {"median_seconds": endpoint["median_seconds"], "queries": endpoint["queries"]}
+            for name, endpoint in report["endpoints"].items()
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+def same_environment(report, baseline):
+    return baseline.get("environment") == report["environment"]
+
+def compare_to_baseline(report, baseline, time_tolerance=0.25, query_tolerance=0, compare_times=True):
+    failures = []
+
+    for name, endpoint in report["endpoints"].items():
+        if not 200 <= endpoint["status"] < 300:
+            failures.append(f"{name}: responded {endpoint['status']}")
+
+    if baseline.get("database") != report["database"]:
+        failures.append(
+            f"baseline was recorded on {baseline.get('database')}, this run used {report['database']}; "
+            "re-record it with --update-baseline"
+        )
+        return failures
+    if baseline.get("dataset") != report["dataset"]:
+        failures.append("baseline was recorded against a different dataset; re-record it with --update-baseline")
+        return failures
+
+    for name, endpoint in report["endpoints"].items():
+        reference = baseline.get("endpoints", {}).get(name)
+        if reference is None:
+            continue
+
+        allowed = reference["median_seconds"]
+        if compare_times and endpoint["median_seconds"] > allowed * (1 + time_tolerance) + TIME_SLACK_SECONDS:
+            failures.append(
+                f"{name}: median {endpoint['median_seconds'] * 1000:.1f}ms, baseline {allowed * 1000:.1f}ms "
+                f"(+{time_tolerance:.0%} allowed)"
+            )
+
+        if endpoint["queries"] > reference["queries"] + query_tolerance:
+            failures.append(f"{name}: {endpoint['queries']} queries, baseline {reference['queries']}")
+
+    return failures
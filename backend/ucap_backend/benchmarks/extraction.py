@@ -0,0 +1,306 @@
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+import fitz
+from ucap_backend.services.data_extraction import extract_co_descriptions, extract_co_po, extract_po_mapping
+
+CORPUS_DIR = Path(__file__).resolve().parent / "syllabi"
+BASELINE_PATH = CORPUS_DIR / "baseline.json"
+
+STAGES = {
+    "extract_po_mapping": extract_po_mapping,
+    "extract_co_descriptions": extract_co_descriptions,
+    "extract_co_po": extract_co_po,
+}
+
+ACCURACY_METRICS = ["co_precision", "co_recall", "description_accuracy", "mapping_f1"]
+
+# Absolute slack so millisecond-scale stages do not fail on timer noise.
+TIME_SLACK_SECONDS = 0.05
+
+# ====================================================
+# Synthetic Syllabus Corpus
+# ====================================================
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 936
+MARGIN = 36
+FONT_SIZE = 8
+LINE_HEIGHT = 10
+HEADER = (
+    "Document Code No. FM-USTP-ACAD-01   Rev. No. 00   "
+    "Effective Date: 03.17.2023   Page No. {page} of {total}"
+)
+
+def load_corpus():
+    corpus = {}
+    for path in sorted(CORPUS_DIR.glob("*.json")):
+        if path == BASELINE_PATH:
+            continue
+        with open(path, encoding="utf-8") as f:
+            corpus[path.stem] = json.load(f)
+    return corpus
+
+def _wrap(text, width, fontsize=FONT_SIZE):
+    lines = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if current and fitz.get_text_length(candidate, fontsize=fontsize) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+def _cell(page, rect, lines):
+    page.draw_rect(rect, color=(0, 0, 0), width=0.7)
+    y = rect.y0 + 3 + FONT_SIZE
+    for line in lines:
+        page.insert_text((rect.x0 + 3, y), line, fontsize=FONT_SIZE)
+        y += LINE_HEIGHT
+
+def _co_label(code, style):
+    if style == "spaced":
+        return code.replace("CO", "CO ")
+    return code
+
+def render_syllabus(spec, path):
+    letters = spec["program_outcome_letters"]
+    outline = spec["course_outline"]
+    weeks_per_page = 6
+    outline_pages = max(1, -(-len(outline) // weeks_per_page))
+    total_pages = 2 + outline_pages
+
+    doc = fitz.open()
+
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_text((MARGIN, 30), HEADER.format(page=1, total=total_pages), fontsize=7)
+    page.insert_text((MARGIN, 70), "UNIVERSITY OF SCIENCE AND TECHNOLOGY OF SOUTHERN PHILIPPINES", fontsize=11)
+    page.insert_text((MARGIN, 90), "COURSE SYLLABUS", fontsize=11)
+    page.insert_text((MARGIN, 120), "I. Course Information", fontsize=10)
+    page.insert_text((MARGIN, 140), f"Course Code: {spec['course_code']}", fontsize=FONT_SIZE)
+    page.insert_text((MARGIN, 152), f"Course Title: {spec['course_title']}", fontsize=FONT_SIZE)
+    page.insert_text((MARGIN, 180), "Program Outcomes:", fontsize=10)
+    y = 196
+    for letter in letters:
+        page.insert_text((MARGIN, y), f"{letter}. Program outcome statement {letter.upper()}", fontsize=FONT_SIZE)
+        y += LINE_HEIGHT + 2
+
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_text((MARGIN, 30), HEADER.format(page=2, total=total_pages), fontsize=7)
+    page.insert_text((MARGIN, 60), "II. Course Outcomes and Relationship to Program Outcomes", fontsize=10)
+
+    first_width = 300
+    po_width = (PAGE_WIDTH - 2 * MARGIN - first_width) / len(letters)
+    y = 80
+
+    def po_rect(i, top, height):
+        x0 = MARGIN + first_width + i * po_width
+        return fitz.Rect(x0, top, x0 + po_width, top + height)
+
+    _cell(page, fitz.Rect(MARGIN, y, MARGIN + first_width, y + 20), ["Course Outcomes"])
+    for i, letter in enumerate(letters):
+        _cell(page, po_rect(i, y, 20), [letter])
+    y += 20
+
+    for co in spec["expected"]:
+        label = _co_label(co["course_outcome_code"], spec.get("code_style"))
+        lines = _wrap(f"{label}: {co['course_outcome_description']}", first_width - 6)
+        height = len(lines) * LINE_HEIGHT + 8
+        _cell(page, fitz.Rect(MARGIN, y, MARGIN + first_width, y + height), lines)
+        for i, letter in enumerate(letters):
+            level = co["outcome_mapping"].get(f"PO-{letter}", "")
+            _cell(page, po_rect(i, y, height), [level] if level else [])
+        y += height
+
+    page.insert_text((MARGIN, y + 30), "III. Course Outline", fontsize=10)
+
+    for page_index in range(outline_pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        page.insert_text((MARGIN, 30), HEADER.format(page=3 + page_index, total=total_pages), fontsize=7)
+        y = 60
+        _cell(page, fitz.Rect(MARGIN, y, MARGIN + 80, y + 20), ["Week"])
+        _cell(page, fitz.Rect(MARGIN + 80, y, PAGE_WIDTH - MARGIN, y + 20), ["Topics and Learning Activities"])
+        y += 20
+        start = page_index * weeks_per_page
+        for week, topic in enumerate(outline[start:start + weeks_per_page], start=start + 1):
+            _cell(page, fitz.Rect(MARGIN, y, MARGIN + 80, y + 40), [f"Week {week}"])
+            _cell(page, fitz.Rect(MARGIN + 80, y, PAGE_WIDTH - MARGIN, y + 40), [topic])
+            y += 40
+
+    doc.save(path)
+    doc.close()
+    return path
+
+# ====================================================
+# Accuracy Scoring
+# ====================================================
+def _ratio(numerator, denominator):
+    return numerator / denominator if denominator else 1.0
+
+def score(expected, actual):
+    expected_by_code = {item["course_outcome_code"]: item for item in expected}
+    actual_by_code = {item["course_outcome_code"]: item for item in actual}
+    matched = set(expected_by_code) & set(actual_by_code)
+
+    description_hits = sum(
+        1 for code in matched
+        if " ".join(expected_by_code[code]["course_outcome_description"].split())
+        == " ".join((actual_by_code[code]["course_outcome_description"] or "").split())
+    )
+
+    expected_cells = {
+        (code, po, level)
+        for code, item in expected_by_code.items()
+        for po, level in item["outcome_mapping"].items()
+    }
+    actual_cells = {
+        (code, po, level)
+        for code, item in actual_by_code.items()
+        for po, level in (item.get("outcome_mapping") or {}).items()
+    }
+    cell_hits = len(expected_cells & actual_cells)
+
+    return {
+        "expected_cos": len(expected_by_code),
+        "actual_cos": len(actual_by_code),
+        "matched_cos": len(matched),
+        "description_hits": description_hits,
+        "expected_cells": len(expected_cells),
+        "actual_cells": len(actual_cells),
+        "cell_hits": cell_hits,
+    }
+
+def summarize_accuracy(counts):
+    totals = {key: sum(c[key] for c in counts) for key in counts[0]} if counts else {}
+    precision = _ratio(totals.get("cell_hits", 0), totals.get("actual_cells", 0))
+    recall = _ratio(totals.get("cell_hits", 0), totals.get("expected_cells", 0))
+    return {
+        "co_precision": _ratio(totals.get("matched_cos", 0), totals.get("actual_cos", 0)),
+        "co_recall": _ratio(totals.get("matched_cos", 0), totals.get("expected_cos", 0)),
+        "description_accuracy": _ratio(totals.get("description_hits", 0), totals.get("expected_cos", 0)),
+        "mapping_f1": 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+    }
+
+# ====================================================
+# Benchmark Runner
+# ====================================================
+def _time_stage(func, filepath, repeats):
+    samples = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(filepath)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+def _peak_memory(func, filepath):
+    tracemalloc.start()
+    try:
+        func(filepath)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def run_benchmark(workdir, repeats=3, names=None):
+    corpus = load_corpus()
+    if names:
+        corpus = {name: spec for name, spec in corpus.items() if name in names}
+
+    documents = {}
+    stage_totals = {stage: 0.0 for stage in STAGES}
+    peak_memory = 0
+    counts = []
+
+    for name, spec in corpus.items():
+        filepath = render_syllabus(spec, os.path.join(workdir, f"{name}.pdf"))
+
+        timings = {}
+        output = None
+        for stage, func in STAGES.items():
+            timings[stage], result = _time_stage(func, filepath, repeats)
+            stage_totals[stage] += timings[stage]
+            if stage == "extract_co_po":
+                output = result
+
+        memory = _peak_memory(extract_co_po, filepath)
+        peak_memory = max(peak_memory, memory)
+
+        doc_counts = score(spec["expected"], output)
+        counts.append(doc_counts)
+
+        documents[name] = {
+            "timings": timings,
+            "peak_memory_bytes": memory,
+            "accuracy": summarize_accuracy([doc_counts]),
+        }
+
+    return {
+        "repeats": repeats,
+        "documents": documents,
+        "timings": stage_totals,
+        "peak_memory_bytes": peak_memory,
+        "accuracy": summarize_accuracy(counts),
+    }
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def write_baseline(report, path=BASELINE_PATH):
+    baseline = {
+        "timings": report["timings"],
+        "peak_memory_bytes": report["peak_memory_bytes"],
+        "accuracy": report["accuracy"],
+        "documents": {
+            name: {"timings": doc["timings"], "peak_memory_bytes": doc["peak_memory_bytes"]}
+            for name, doc in report["documents"].items()
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+def compare_to_baseline(report, baseline, time_tolerance=0.25, memory_tolerance=0.25):
+    failures = []
+    baseline_documents = baseline.get("documents", {})
+
+    for name, doc in report["documents"].items():
+        reference = baseline_documents.get(name)
+        if reference is None:
+            continue
+
+        for stage, allowed in reference["timings"].items():
+            measured = doc["timings"].get(stage)
+            if measured is not None and measured > allowed * (1 + time_tolerance) + TIME_SLACK_SECONDS:
+                failures.append(
+                    f"{name}: {stage} took {measured:.3f}s, baseline {allowed:.3f}s (+{time_tolerance:.0%} allowed)"
+                )
+
+        allowed_memory = reference.get("peak_memory_bytes")
+        if allowed_memory and doc["peak_memory_bytes"] > allowed_memory * (1 + memory_tolerance):
+            failures.append(
+                f"{name}: peak memory {doc['peak_memory_bytes']} bytes, baseline {allowed_memory} bytes "
+                f"(+{memory_tolerance:.0%} allowed)"
+            )
+
+    for metric in ACCURACY_METRICS:
+        expected = baseline.get("accuracy", {}).get(metric)
+        measured = report["accuracy"].get(metric)
+        if expected is not None and measured is not None and measured + 1e-9 < expected:
+            failures.append(f"{metric} dropped to {measured:.3f}, baseline {expected:.3f}")
+
+    for name, doc in report["documents"].items():
+        for metric in ACCURACY_METRICS:
+            if doc["accuracy"][metric] + 1e-9 < 1.0:
+                failures.append(f"{name}: {metric} is {doc['accuracy'][metric]:.3f}, golden output not matched")
+
+    return failures
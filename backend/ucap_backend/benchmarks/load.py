@@ -0,0 +1,288 @@
+import json
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit
+from django.conf import settings
+from ucap_backend.models import Section, User
+from ucap_backend.services.synthetic_data import COURSE_CODE_PREFIX, EMAIL_DOMAIN
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+PERCENTILES = [50, 90, 95, 99]
+
+# ====================================================
+# Accounts
+# ====================================================
+# Only generated users are driven: the run writes raw scores, so it must not
+# touch real class records (see generate_synthetic_data).
+def instructor_accounts():
+    sections = defaultdict(list)
+    rows = (
+        Section.objects
+        .filter(
+            loaded_course__course__course_code__startswith=COURSE_CODE_PREFIX,
+            instructor_assigned__email__endswith=f"@{EMAIL_DOMAIN}",
+            provisioning_status=Section.PROVISIONING_READY,
+        )
+        .order_by("instructor_assigned_id", "section_id")
+        .values_list("instructor_assigned_id", "section_id")
+    )
+    for user_id, section_id in rows:
+        sections[user_id].append(section_id)
+    return [{"user_id": user_id, "sections": section_ids} for user_id, section_ids in sections.items()]
+
+def oversight_accounts():
+    users = (
+        User.objects
+        .filter(email__endswith=f"@{EMAIL_DOMAIN}")
+        .exclude(chair_department__isnull=True, dean_college__isnull=True, vcaa_campus__isnull=True)
+        .order_by("user_id")
+        .values("user_id", "chair_department_id", "dean_college_id", "vcaa_campus_id")
+    )
+
+    by_role = defaultdict(list)
+    for user in users:
+        if user["dean_college_id"]:
+            college = user["dean_college_id"]
+            by_role["dean"].append({"user_id": user["user_id"], "pages": [
+                ("dean_summary", f"/dean/{college}/summary/"),
+                ("dean_loaded_courses", f"/dean/{college}/"),
+            ]})
+        elif user["vcaa_campus_id"]:
+            campus = user["vcaa_campus_id"]
+            by_role["vcaa"].append({"user_id": user["user_id"], "pages": [
+                ("vcaa_summary", f"/campus/{campus}/summary/"),
+                ("vcaa_loaded_courses", f"/campus/{campus}/"),
+            ]})
+        else:
+            department = user["chair_department_id"]
+            by_role["chair"].append({"user_id": user["user_id"], "pages": [
+                ("department_chair_summary", f"/department_chair/summary/{department}/"),
+                ("department_chair_loaded_courses", f"/department_chair/department_course_management/{department}/"),
+            ]})
+
+    # Deans first, then VCAAs and chairs, so small runs still mix all three.
+    accounts = []
+    queues = [by_role["dean"], by_role["vcaa"], by_role["chair"]]
+    while any(queues):
+        for queue in queues:
+            if queue:
+                accounts.append(queue.pop(0))
+    return accounts
+
+# ====================================================
+# Client
+# ====================================================
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+
+    def record(self, name, seconds, status):
+        with self._lock:
+            self.samples[name].append(seconds)
+            self.statuses[name][status if status is not None else "connection error"] += 1
+
+class Client:
+    # One keep-alive connection and cookie store per simulated browser. Cookies
+    # are kept by hand: the session and CSRF cookies are marked Secure, which a
+    # cookie jar would refuse to send to a plain-HTTP local server.
+    def __init__(self, base_url, recorder, timeout=30):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.referer = f"{parts.scheme}://{parts.netloc}/"
+        self.recorder = recorder
+        self.timeout = timeout
+        self.cookies = {}
+        self.connection = None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _store_cookies(self, headers):
+        for header in headers:
+            cookie = SimpleCookie()
+            cookie.load(header)
+            for name, morsel in cookie.items():
+                if morsel.value and morsel["max-age"] != "0":
+                    self.cookies[name] = morsel.value
+                else:
+                    self.cookies.pop(name, None)
+
+    def request(self, name, method, path, body=None):
+        headers = {"Accept": "application/json", "Referer": self.referer}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{key}={value}" for key, value in self.cookies.items())
+        if method not in SAFE_METHODS and settings.CSRF_COOKIE_NAME in self.cookies:
+            headers["X-CSRFToken"] = self.cookies[settings.CSRF_COOKIE_NAME]
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        status, data = None, b""
+        started = time.perf_counter()
+        try:
+            if self.connection is None:
+                connection_class = HTTPSConnection if self.https else HTTPConnection
+                self.connection = connection_class(self.host, self.port, timeout=self.timeout)
+            self.connection.request(method, self.prefix + path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+            status = response.status
+            self._store_cookies(response.headers.get_all("Set-Cookie") or [])
+        except (OSError, HTTPException):
+            self.close()
+        self.recorder.record(name, time.perf_counter() - started, status)
+        return status, data
+
+    def login(self, user_id, password):
+        self.request("csrf", "GET", "/csrf/")
+        status, _ = self.request("login", "POST", "/login/", {"user_id": user_id, "password": password})
+        return status == 200
+
+def ping(base_url, timeout=5):
+    client = Client(base_url, Recorder(), timeout=timeout)
+    try:
+        status, _ = client.request("heartbeat", "GET", "/heartbeat/")
+    finally:
+        client.close()
+    return status == 200
+
+# ====================================================
+# Sessions
+# ====================================================
+def _think(rng, options, stop_at):
+    if options["think_time"] > 0:
+        time.sleep(min(rng.uniform(0, 2 * options["think_time"]), max(stop_at - time.monotonic(), 0)))
+
+def _score_cells(data):
+    try:
+        class_record = json.loads(data)
+    except ValueError:
+        return []
+    return [
+        (student["student_id"], score["assessment_id"])
+        for student in class_record.get("students", [])
+        for score in student.get("scores", [])
+    ]
+
+def instructor_session(client, account, options, rng, stop_at):
+    # Grade-encoding pattern: open a class record, enter bursts of scores, then
+    # check the outcome attainment page before moving to another section.
+    while time.monotonic() < stop_at:
+        section_id = rng.choice(account["sections"])
+        status, data = client.request("class_record", "GET", f"/instructor/class_record/{section_id}/")
+        cells = _score_cells(data) if status == 200 else []
+
+        for _ in range(options["bursts"]):
+            if not cells or time.monotonic() >= stop_at:
+                break
+            for student_id, assessment_id in rng.sample(cells, min(options["edits_per_burst"], len(cells))):
+                client.request(
+                    "raw_score_update",
+                    "PATCH",
+                    f"/instructor/rawscores/{student_id}/{assessment_id}/",
+                    {"value": rng.randint(0, options["max_score"])},
+                )
+            _think(rng, options, stop_at)
+
+        if time.monotonic() < stop_at:
+            client.request("assessment_page", "GET", f"/assessments/{section_id}/")
+            _think(rng, options, stop_at)
+
+def oversight_session(client, account, options, rng, stop_at):
+    while time.monotonic() < stop_at:
+        for name, path in account["pages"]:
+            if time.monotonic() >= stop_at:
+                break
+            client.request(name, "GET", path)
+            _think(rng, options, stop_at)
+
+# ====================================================
+# Runner
+# ====================================================
+def _percentile(ordered, percent):
+    # Nearest-rank, so small samples report a latency that was actually observed.
+    index = max(0, min(len(ordered) - 1, -(-percent * len(ordered) // 100) - 1))
+    return ordered[index]
+
+def summarize(recorder, elapsed):
+    endpoints = {}
+    for name in sorted(recorder.samples):
+        ordered = sorted(recorder.samples[name])
+        statuses = recorder.statuses[name]
+        errors = sum(count for status, count in statuses.items() if not isinstance(status, int) or status >= 400)
+        endpoints[name] = {
+            "requests": len(ordered),
+            "errors": errors,
+            "error_rate": errors / len(ordered),
+            "throughput": len(ordered) / elapsed if elapsed else 0.0,
+            **{f"p{percent}_ms": _percentile(ordered, percent) * 1000 for percent in PERCENTILES},
+            "max_ms": ordered[-1] * 1000,
+            "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+        }
+
+    total = sum(endpoint["requests"] for endpoint in endpoints.values())
+    errors = sum(endpoint["errors"] for endpoint in endpoints.values())
+    return {
+        "elapsed_seconds": elapsed,
+        "requests": total,
+        "errors": errors,
+        "error_rate": errors / total if total else 0.0,
+        "throughput": total / elapsed if elapsed else 0.0,
+        "endpoints": endpoints,
+    }
+
+def run_load_test(base_url, instructors, oversight, options, instructor_pool, oversight_pool):
+    recorder = Recorder()
+    failed_logins = []
+    lock = threading.Lock()
+
+    users = [(instructor_session, instructor_pool[i % len(instructor_pool)]) for i in range(instructors)]
+    users += [(oversight_session, oversight_pool[i % len(oversight_pool)]) for i in range(oversight)]
+    ramp_step = options["ramp_up"] / len(users) if users else 0
+
+    started = time.monotonic()
+    stop_at = started + options["ramp_up"] + options["duration"]
+
+    def simulate(index, session, account):
+        rng = random.Random(options["seed"] * 1000003 + index)
+        time.sleep(index * ramp_step)
+        client = Client(base_url, recorder, timeout=options["timeout"])
+        try:
+            if not client.login(account["user_id"], options["password"]):
+                with lock:
+                    failed_logins.append(account["user_id"])
+                return
+            session(client, account, options, rng, stop_at)
+        finally:
+            client.close()
+
+    threads = [
+        threading.Thread(target=simulate, args=(index, session, account), name=f"load-user-{index}", daemon=True)
+        for index, (session, account) in enumerate(users)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = summarize(recorder, time.monotonic() - started)
+    report.update({
+        "base_url": base_url,
+        "instructors": instructors,
+        "oversight": oversight,
+        "options": {key: value for key, value in options.items() if key != "password"},
+        "failed_logins": sorted(set(failed_logins)),
+    })
+    return report
@@ -0,0 +1,82 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.runner import DiscoverRunner
+from ucap_backend.benchmarks.endpoints import compare_to_baseline, load_baseline, run_benchmark, same_environment, write_baseline
+
+class Command(BaseCommand):
+    help = (
+        "Time the hot endpoints (class record, assessment page, raw score update, student import, outcome mapping, "
+        "role dashboards and summaries) through the DRF test client against a generated dataset in a throwaway test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeats", type=int, default=5)
+        parser.add_argument("--only", nargs="*", help="Endpoints to run (defaults to all).")
+        parser.add_argument("--time-tolerance", type=float, default=0.25)
+        parser.add_argument("--query-tolerance", type=int, default=0)
+        parser.add_argument("--output", help="Write the full JSON report to this path.")
+        parser.add_argument("--update-baseline", action="store_true")
+        parser.add_argument("--keepdb", action="store_true", help="Reuse the test database between runs.")
+        parser.add_argument(
+            "--any-database",
+            action="store_true",
+            help="Allow a non-PostgreSQL database (numbers are not comparable to a PostgreSQL baseline).",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql" and not options["any_database"]:
+            raise CommandError(f"The benchmark expects PostgreSQL, not {connection.vendor}; pass --any-database to run anyway.")
+
+        runner = DiscoverRunner(verbosity=0, keepdb=options["keepdb"], interactive=False)
+        runner.setup_test_environment()
+        old_config = runner.setup_databases()
+        try:
+            report = run_benchmark(repeats=options["repeats"], names=options["only"])
+        finally:
+            runner.teardown_databases(old_config)
+            runner.teardown_test_environment()
+
+        environment = report["environment"]
+        self.stdout.write(
+            f"dataset built in {report['dataset_build_seconds']:.1f}s on {report['database']} "
+            f"{environment['database_version']} ({environment['cpu']}, {environment['cpu_count']} CPUs)"
+        )
+        for name, endpoint in report["endpoints"].items():
+            self.stdout.write(
+                f"{name}: median={endpoint['median_seconds'] * 1000:.1f}ms  max={endpoint['max_seconds'] * 1000:.1f}ms  "
+                f"queries={endpoint['queries']}  status={endpoint['status']}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+        if options["update_baseline"]:
+            write_baseline(report)
+            self.stdout.write(self.style.SUCCESS("Baseline updated."))
+            return
+
+        baseline = load_baseline()
+        if baseline is None:
+            self.stdout.write(self.style.WARNING("No baseline recorded; run with --update-baseline."))
+            return
+
+        compare_times = same_environment(report, baseline)
+        if not compare_times:
+            self.stdout.write(self.style.WARNING(
+                f"Baseline latencies were recorded on {baseline.get('environment')}; comparing query counts only. "
+                "Re-record the baseline on this machine (--update-baseline) to check latencies."
+            ))
+
+        failures = compare_to_baseline(
+            report,
+            baseline,
+            time_tolerance=options["time_tolerance"],
+            query_tolerance=options["query_tolerance"],
+            compare_times=compare_times,
+        )
+        if failures:
+            raise CommandError("Endpoint benchmark regressed:\n" + "\n".join(failures))
+
+        self.stdout.write(self.style.SUCCESS("Endpoint benchmark within baseline."))
@@ -0,0 +1,51 @@
+import json
+import tempfile
+from django.core.management.base import BaseCommand, CommandError
+from ucap_backend.benchmarks.extraction import compare_to_baseline, load_baseline, run_benchmark, write_baseline
+
+class Command(BaseCommand):
+    help = "Benchmark syllabus CO-PO extraction against the synthetic corpus and golden outputs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeats", type=int, default=3)
+        parser.add_argument("--only", nargs="*", help="Corpus entries to run (defaults to all).")
+        parser.add_argument("--time-tolerance", type=float, default=0.25)
+        parser.add_argument("--memory-tolerance", type=float, default=0.25)
+        parser.add_argument("--output", help="Write the full JSON report to this path.")
+        parser.add_argument("--update-baseline", action="store_true")
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as workdir:
+            report = run_benchmark(workdir, repeats=options["repeats"], names=options["only"])
+
+        for name, doc in report["documents"].items():
+            timings = "  ".join(f"{stage}={seconds:.3f}s" for stage, seconds in doc["timings"].items())
+            self.stdout.write(f"{name}: {timings}  peak={doc['peak_memory_bytes'] / 1024:.0f}KiB")
+
+        self.stdout.write("totals: " + "  ".join(f"{stage}={seconds:.3f}s" for stage, seconds in report["timings"].items()))
+        self.stdout.write("accuracy: " + "  ".join(f"{metric}={value:.3f}" for metric, value in report["accuracy"].items()))
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+        if options["update_baseline"]:
+            write_baseline(report)
+            self.stdout.write(self.style.SUCCESS("Baseline updated."))
+            return
+
+        baseline = load_baseline()
+        if baseline is None:
+            self.stdout.write(self.style.WARNING("No baseline recorded; run with --update-baseline."))
+            return
+
+        failures = compare_to_baseline(
+            report,
+            baseline,
+            time_tolerance=options["time_tolerance"],
+            memory_tolerance=options["memory_tolerance"],
+        )
+        if failures:
+            raise CommandError("Extraction benchmark regressed:\n" + "\n".join(failures))
+
+        self.stdout.write(self.style.SUCCESS("Extraction benchmark within baseline."))
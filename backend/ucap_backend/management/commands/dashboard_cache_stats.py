@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from ucap_backend.services.dashboard_cache import dashboard_cache_stats, reset_dashboard_cache_stats
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters of the oversight dashboard response cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing them.")
+
+    def handle(self, *args, **options):
+        for scope, counts in dashboard_cache_stats().items():
+            total = counts["hit"] + counts["miss"]
+            ratio = counts["hit"] / total if total else 0.0
+            self.stdout.write(f"{scope}: hits={counts['hit']} misses={counts['miss']} hit_ratio={ratio:.1%}")
+
+        if options["reset"]:
+            reset_dashboard_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
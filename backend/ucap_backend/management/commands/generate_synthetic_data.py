@@ -0,0 +1,46 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from ucap_backend.services.synthetic_data import DEFAULT_COUNTS, delete_synthetic_data, generate_synthetic_data
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic university (hierarchy, faculty, courses, loaded courses, sections, "
+        "class records with scores, COs/POs and mappings) with bulk inserts, for performance work."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0, help="Same seed and counts give the same data.")
+        for name, default in DEFAULT_COUNTS.items():
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+        parser.add_argument("--fill-rate", type=float, default=0.85, help="Fraction of raw scores that are encoded.")
+        parser.add_argument("--password", default="synthetic", help="Shared password for every generated user.")
+        parser.add_argument("--reset", action="store_true", help="Delete previously generated data first.")
+        parser.add_argument("--reset-only", action="store_true", help="Delete previously generated data and exit.")
+
+    def handle(self, *args, **options):
+        if options["reset"] or options["reset_only"]:
+            started = time.perf_counter()
+            deleted = delete_synthetic_data()
+            self.stdout.write(f"Removed synthetic data ({deleted} hierarchy rows) in {time.perf_counter() - started:.1f}s.")
+            if options["reset_only"]:
+                return
+
+        def progress(done, total):
+            self.stdout.write(f"  class records: {done}/{total} sections", ending="\r")
+
+        started = time.perf_counter()
+        try:
+            created = generate_synthetic_data(
+                seed=options["seed"],
+                fill_rate=options["fill_rate"],
+                password=options["password"],
+                progress=progress,
+                **{name: options[name] for name in DEFAULT_COUNTS},
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write("")
+        for name, count in created.items():
+            self.stdout.write(f"  {name}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Generated synthetic data in {time.perf_counter() - started:.1f}s."))
@@ -0,0 +1,32 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from ucap_backend.services.faculty_import import HASH_WORKERS, import_faculty, read_faculty_csv
+
+class Command(BaseCommand):
+    help = "Create faculty accounts in bulk from a CSV file (user_id, first_name, middle_name, last_name, suffix, email, user_role, departments, chair_department, dean_college, vcaa_campus)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path")
+        parser.add_argument("--dry-run", action="store_true", help="Validate the file without creating anyone.")
+        parser.add_argument("--workers", type=int, default=HASH_WORKERS, help="Threads used for password hashing.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            with open(options["csv_path"], "rb") as file:
+                rows = read_faculty_csv(file)
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        result = import_faculty(rows, dry_run=options["dry_run"], workers=options["workers"])
+        elapsed = time.perf_counter() - started
+
+        for error in result["errors"]:
+            self.stderr.write(f"Row {error['row']} [{error['field']}]: {error['message']}")
+        if result["errors"]:
+            raise CommandError(f"{len(result['errors'])} validation error(s); nothing was imported.")
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Validated {result['validated']} faculty rows in {elapsed:.2f}s."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Imported {result['created']} faculty in {elapsed:.2f}s."))
@@ -0,0 +1,89 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from ucap_backend.benchmarks.load import PERCENTILES, instructor_accounts, oversight_accounts, ping, run_load_test
+
+class Command(BaseCommand):
+    help = (
+        "Closed-loop load test against a running server: instructor sessions (login, class record, bursts of raw "
+        "score edits, assessment page) and oversight sessions (chair, dean and VCAA dashboards) at a set "
+        "concurrency, reporting throughput, latency percentiles and error rates per endpoint. Drives the users "
+        "created by generate_synthetic_data and writes raw scores through the API."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--instructors", type=int, default=20, help="Concurrent instructor sessions.")
+        parser.add_argument("--oversight", type=int, default=5, help="Concurrent chair/dean/VCAA sessions.")
+        parser.add_argument("--duration", type=float, default=60, help="Seconds of full load after ramp-up.")
+        parser.add_argument("--ramp-up", type=float, default=5, help="Seconds over which sessions are started.")
+        parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between actions, in seconds.")
+        parser.add_argument("--bursts", type=int, default=3, help="Score-edit bursts per class record visit.")
+        parser.add_argument("--edits-per-burst", type=int, default=10)
+        parser.add_argument("--max-score", type=int, default=10)
+        parser.add_argument("--password", default="synthetic", help="Password the synthetic users were generated with.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout, in seconds.")
+        parser.add_argument("--output", help="Write the full JSON report to this path.")
+        parser.add_argument("--max-error-rate", type=float, help="Fail if the overall error rate is above this fraction.")
+
+    def handle(self, *args, **options):
+        base_url = options["base_url"].rstrip("/")
+        if options["instructors"] < 0 or options["oversight"] < 0 or options["instructors"] + options["oversight"] == 0:
+            raise CommandError("Run at least one instructor or oversight session.")
+
+        instructor_pool = instructor_accounts() if options["instructors"] else []
+        oversight_pool = oversight_accounts() if options["oversight"] else []
+        if options["instructors"] and not instructor_pool:
+            raise CommandError("No synthetic instructors with provisioned sections; run generate_synthetic_data first.")
+        if options["oversight"] and not oversight_pool:
+            raise CommandError("No synthetic chairs, deans or VCAAs; run generate_synthetic_data first.")
+
+        if not ping(base_url):
+            raise CommandError(f"No server answering {base_url}/heartbeat/.")
+
+        self.stdout.write(
+            f"{options['instructors']} instructor and {options['oversight']} oversight sessions against {base_url} "
+            f"for {options['duration']:g}s (+{options['ramp_up']:g}s ramp-up)"
+        )
+        report = run_load_test(
+            base_url,
+            options["instructors"],
+            options["oversight"],
+            {
+                key: options[key]
+                for key in (
+                    "duration", "ramp_up", "think_time", "bursts", "edits_per_burst",
+                    "max_score", "password", "seed", "timeout",
+                )
+            },
+            instructor_pool,
+            oversight_pool,
+        )
+
+        header = f"{'endpoint':<34}{'requests':>9}{'req/s':>8}{'errors':>8}" + "".join(f"{f'p{p}':>9}" for p in PERCENTILES) + f"{'max':>9}"
+        self.stdout.write(header)
+        for name, endpoint in report["endpoints"].items():
+            self.stdout.write(
+                f"{name:<34}{endpoint['requests']:>9}{endpoint['throughput']:>8.1f}{endpoint['error_rate']:>8.1%}"
+                + "".join(f"{endpoint[f'p{p}_ms']:>7.0f}ms" for p in PERCENTILES)
+                + f"{endpoint['max_ms']:>7.0f}ms"
+            )
+        self.stdout.write(
+            f"total: {report['requests']} requests, {report['throughput']:.1f} req/s, "
+            f"{report['error_rate']:.1%} errors in {report['elapsed_seconds']:.1f}s"
+        )
+
+        for name, endpoint in report["endpoints"].items():
+            if endpoint["errors"]:
+                self.stdout.write(self.style.WARNING(f"{name} statuses: {endpoint['statuses']}"))
+        if report["failed_logins"]:
+            self.stdout.write(self.style.WARNING(f"Login failed for users {report['failed_logins']}; check --password."))
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+        if options["max_error_rate"] is not None and report["error_rate"] > options["max_error_rate"]:
+            raise CommandError(
+                f"Error rate {report['error_rate']:.1%} is above the allowed {options['max_error_rate']:.1%}."
+            )
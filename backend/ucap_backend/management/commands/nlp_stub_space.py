@@ -0,0 +1,46 @@
+import json
+import random
+import time
+from django.core.management.base import BaseCommand, CommandError
+from ucap_backend.services.nlp_outcome_mapping import local_outcome_mapping
+
+class Command(BaseCommand):
+    help = (
+        "Serve a local stand-in for the NLP Hugging Face Space (/process_json) backed by the "
+        "TF-IDF engine. Point NLP_REMOTE_SPACE at it to exercise timeouts and the circuit breaker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=7860)
+        parser.add_argument("--delay", type=float, default=0.0, help="Seconds to sleep before answering.")
+        parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of calls that raise.")
+
+    def handle(self, *args, **options):
+        try:
+            import gradio as gr
+        except ImportError:
+            raise CommandError("gradio is required for the stand-in Space: pip install -r requirements-dev.txt")
+
+        delay = options["delay"]
+        failure_rate = options["failure_rate"]
+
+        def process_json(file_obj):
+            path = file_obj if isinstance(file_obj, str) else file_obj.name
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+
+            if delay:
+                time.sleep(delay)
+            if failure_rate and random.random() < failure_rate:
+                raise gr.Error("Stand-in Space failure")
+
+            return local_outcome_mapping(payload)
+
+        demo = gr.Interface(
+            fn=process_json,
+            inputs=gr.File(type="filepath"),
+            outputs=gr.JSON(),
+            api_name="process_json",
+        )
+        demo.launch(server_name=options["host"], server_port=options["port"])
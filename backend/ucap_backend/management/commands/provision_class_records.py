@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from ucap_backend.models import Section
+from ucap_backend.services.section_provisioning import provision_sections
+
+class Command(BaseCommand):
+    help = "Build class records for sections still provisioning or whose provisioning failed (e.g. after a restart)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        section_ids = list(
+            Section.objects
+            .exclude(provisioning_status=Section.PROVISIONING_READY)
+            .order_by("section_id")
+            .values_list("section_id", flat=True)
+        )
+
+        provisioned = 0
+        for start in range(0, len(section_ids), options["batch_size"]):
+            provisioned += provision_sections(section_ids[start:start + options["batch_size"]])
+
+        self.stdout.write(self.style.SUCCESS(f"Provisioned {provisioned} of {len(section_ids)} pending section(s)."))
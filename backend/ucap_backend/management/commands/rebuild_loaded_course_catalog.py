@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from ucap_backend.services.loaded_course_catalog import rebuild_catalog
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized loaded-course catalog from LoadedCourse and its hierarchy."
+
+    def handle(self, *args, **options):
+        count = rebuild_catalog()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} loaded-course catalog entries."))
@@ -0,0 +1,162 @@
+import contextvars
+import json
+import logging
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("ucap_backend.instrumentation")
+
+# ====================================================
+# Session Refresh
+# ====================================================
+SESSION_REFRESHED_AT_KEY = "_refreshed_at"
+
+class SessionRefreshMiddleware:
+    # Keeps sliding expiry without SESSION_SAVE_EVERY_REQUEST: the session is
+    # only re-saved (and its cookie re-issued) once SESSION_REFRESH_SECONDS
+    # have passed since the last save, instead of on every request.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        response = self.get_response(request)
+        session = getattr(request, "session", None)
+        if session is not None and not session.is_empty():
+            now = int(time.time())
+            if self._due(session, session.get(SESSION_REFRESHED_AT_KEY, 0), now):
+                session[SESSION_REFRESHED_AT_KEY] = now
+        return response
+
+    async def __acall__(self, request):
+        # Reading a session nothing loaded yet hits the database, so it runs
+        # off the event loop (as SessionMiddleware's own response hook does).
+        response = await self.get_response(request)
+        session = getattr(request, "session", None)
+        if session is not None and not session.is_empty():
+            now = int(time.time())
+            if self._due(session, await sync_to_async(session.get)(SESSION_REFRESHED_AT_KEY, 0), now):
+                session[SESSION_REFRESHED_AT_KEY] = now
+        return response
+
+    def _due(self, session, refreshed_at, now):
+        return session.modified or now - refreshed_at >= settings.SESSION_REFRESH_SECONDS
+
+# ====================================================
+# Query Instrumentation
+# ====================================================
+class _QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.db_seconds = 0.0
+
+# A context variable rather than a thread-local: async views run their ORM
+# calls on sync_to_async threads, which inherit the request's context.
+_current_stats = contextvars.ContextVar("request_query_stats", default=None)
+
+def _record_query(execute, sql, params, many, context):
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.count += 1
+        stats.db_seconds += time.perf_counter() - start
+
+def _install_wrapper(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+def _install_on_thread_connections():
+    for connection in connections.all():
+        _install_wrapper(connection)
+
+class QueryInstrumentationMiddleware:
+    # Opt-in with REQUEST_INSTRUMENTATION=True. Adds a Server-Timing header
+    # (db, app, total) and one JSON log line per request, and warns when a
+    # view runs more than REQUEST_QUERY_BUDGET queries.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_INSTRUMENTATION:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+        connection_created.connect(_install_wrapper, dispatch_uid="ucap_query_instrumentation")
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats, token, start = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self._finish(request, response, stats, start)
+
+    async def __acall__(self, request):
+        stats, token, start = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self._finish(request, response, stats, start)
+
+    def _start(self):
+        _install_on_thread_connections()
+        stats = _QueryStats()
+        return stats, _current_stats.set(stats), time.perf_counter()
+
+    def _finish(self, request, response, stats, start):
+        total_ms = (time.perf_counter() - start) * 1000
+        db_ms = stats.db_seconds * 1000
+        app_ms = max(total_ms - db_ms, 0.0)
+
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else None
+
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={db_ms:.1f};desc="{stats.count} queries"',
+            f"app;dur={app_ms:.1f}",
+            f"total;dur={total_ms:.1f}",
+        ])
+
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "view": view,
+            "status": response.status_code,
+            "queries": stats.count,
+            "db_ms": round(db_ms, 1),
+            "app_ms": round(app_ms, 1),
+            "total_ms": round(total_ms, 1),
+        }
+        logger.info(json.dumps(record), extra={"request_metrics": record})
+
+        if stats.count > settings.REQUEST_QUERY_BUDGET:
+            logger.warning(
+                "%s ran %d queries (budget %d) for %s %s",
+                view, stats.count, settings.REQUEST_QUERY_BUDGET, request.method, request.path,
+                extra={"request_metrics": record},
+            )
+
+        return response
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.7 on 2026-10-19 10:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ucap_backend', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NlpOutcomeMappingResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('outcomes_hash', models.CharField(max_length=64)),
+                ('result', models.JSONField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('instructor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='nlp_outcome_mapping_results', to=settings.AUTH_USER_MODEL)),
+                ('loaded_course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='ucap_backend.loadedcourse')),
+            ],
+            options={
+                'unique_together': {('loaded_course', 'instructor')},
+            },
+        ),
+    ]
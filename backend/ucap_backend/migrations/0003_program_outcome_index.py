@@ -0,0 +1,26 @@
+# Generated by Django 5.0.7 on 2026-10-19 10:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ucap_backend', '0002_nlp_outcome_mapping_result'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramOutcomeIndex',
+            fields=[
+                ('program', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='outcome_index', serialize=False, to='ucap_backend.program')),
+                ('program_outcome_codes', models.JSONField()),
+                ('vocabulary', models.JSONField()),
+                ('idf', models.BinaryField()),
+                ('oov_idf', models.FloatField()),
+                ('vectors', models.BinaryField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.7 on 2026-10-19 10:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ucap_backend', '0003_program_outcome_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nlpoutcomemappingresult',
+            name='error',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='nlpoutcomemappingresult',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], default='done', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='nlpoutcomemappingresult',
+            name='result',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
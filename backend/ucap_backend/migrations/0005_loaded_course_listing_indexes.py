@@ -0,0 +1,25 @@
+# Generated by Django 5.0.7 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ucap_backend', '0004_nlp_outcome_mapping_job_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['program', 'semester'], name='course_program_semester_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loadedcourse',
+            index=models.Index(fields=['course', 'loaded_course_id'], name='loaded_course_cursor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loadedcourse',
+            index=models.Index(fields=['academic_year', 'course', 'loaded_course_id'], name='loaded_course_year_course_idx'),
+        ),
+    ]
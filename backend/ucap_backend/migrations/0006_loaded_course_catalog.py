@@ -0,0 +1,81 @@
+# Generated by Django 5.0.7 on 2026-10-19 11:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_catalog(apps, schema_editor):
+    LoadedCourse = apps.get_model("ucap_backend", "LoadedCourse")
+    LoadedCourseCatalog = apps.get_model("ucap_backend", "LoadedCourseCatalog")
+
+    entries = []
+    loaded_courses = LoadedCourse.objects.select_related(
+        "course__program__department__college",
+        "course__program__department__campus",
+        "course__semester",
+        "course__year_level",
+        "academic_year",
+    )
+    for loaded_course in loaded_courses.iterator(chunk_size=1000):
+        course = loaded_course.course
+        department = course.program.department
+        college = department.college
+        entries.append(LoadedCourseCatalog(
+            loaded_course_id=loaded_course.loaded_course_id,
+            course_code=course.course_code,
+            course_title=course.course_title,
+            program_id=course.program.program_id,
+            program_name=course.program.program_name,
+            department_id=department.department_id,
+            department_name=department.department_name,
+            college_id=college.college_id if college else None,
+            college_name=college.college_name if college else None,
+            campus_id=department.campus.campus_id,
+            campus_name=department.campus.campus_name,
+            academic_year_id=loaded_course.academic_year.academic_year_id,
+            academic_year_start=loaded_course.academic_year.academic_year_start,
+            academic_year_end=loaded_course.academic_year.academic_year_end,
+            semester_id=course.semester.semester_id,
+            semester_type=course.semester.semester_type,
+            year_level_id=course.year_level.year_level_id,
+            year_level_type=course.year_level.year_level_type,
+        ))
+
+    LoadedCourseCatalog.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ucap_backend', '0005_loaded_course_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LoadedCourseCatalog',
+            fields=[
+                ('loaded_course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='catalog_entry', serialize=False, to='ucap_backend.loadedcourse')),
+                ('course_code', models.CharField(max_length=255)),
+                ('course_title', models.CharField(max_length=255)),
+                ('program_id', models.IntegerField()),
+                ('program_name', models.CharField(max_length=255)),
+                ('department_id', models.IntegerField()),
+                ('department_name', models.CharField(max_length=255)),
+                ('college_id', models.IntegerField(blank=True, null=True)),
+                ('college_name', models.CharField(blank=True, max_length=225, null=True)),
+                ('campus_id', models.IntegerField()),
+                ('campus_name', models.CharField(max_length=225)),
+                ('academic_year_id', models.IntegerField()),
+                ('academic_year_start', models.IntegerField()),
+                ('academic_year_end', models.IntegerField()),
+                ('semester_id', models.IntegerField()),
+                ('semester_type', models.CharField(max_length=255)),
+                ('year_level_id', models.IntegerField()),
+                ('year_level_type', models.CharField(max_length=255)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['course_code', 'loaded_course'], name='catalog_cursor_idx'), models.Index(fields=['department_id', 'academic_year_id'], name='catalog_department_year_idx'), models.Index(fields=['college_id', 'academic_year_id'], name='catalog_college_year_idx'), models.Index(fields=['campus_id', 'academic_year_id'], name='catalog_campus_year_idx'), models.Index(fields=['academic_year_id', 'course_code'], name='catalog_year_code_idx')],
+            },
+        ),
+        migrations.RunPython(populate_catalog, migrations.RunPython.noop),
+    ]
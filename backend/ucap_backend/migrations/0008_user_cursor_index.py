@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-19 11:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('ucap_backend', '0007_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['last_name', 'user_id'], name='user_cursor_idx'),
+        ),
+    ]
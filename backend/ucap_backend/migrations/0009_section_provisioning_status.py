@@ -0,0 +1,33 @@
+# Generated by Django 5.0.7 on 2026-10-19 11:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ucap_backend', '0008_user_cursor_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='section',
+            name='provisioning_error',
+            field=models.TextField(blank=True, null=True),
+        ),
+        # Existing sections already have their class records, so they start out ready.
+        migrations.AddField(
+            model_name='section',
+            name='provisioning_status',
+            field=models.CharField(choices=[('provisioning', 'Provisioning'), ('ready', 'Ready'), ('failed', 'Failed')], default='ready', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='section',
+            name='provisioning_status',
+            field=models.CharField(choices=[('provisioning', 'Provisioning'), ('ready', 'Ready'), ('failed', 'Failed')], default='provisioning', max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='section',
+            index=models.Index(fields=['provisioning_status'], name='section_provisioning_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-19 12:15
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ucap_backend', '0009_section_provisioning_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='section',
+            name='provisioning_requested_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
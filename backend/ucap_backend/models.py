@@ -1,4 +1,7 @@
 from django.db import models
+from django.utils import timezone
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 
 # ====================================================
@@ -45,6 +48,13 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     USERNAME_FIELD = "user_id"
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["first_name"], opclasses=["gin_trgm_ops"], name="user_first_name_trgm_idx"),
+            GinIndex(fields=["last_name"], opclasses=["gin_trgm_ops"], name="user_last_name_trgm_idx"),
+            models.Index(fields=["last_name", "user_id"], name="user_cursor_idx"),
+        ]
+
 class UserRole(models.Model):
     user_role_id = models.AutoField(primary_key=True)
     user_role_type = models.CharField(max_length=255)
@@ -104,6 +114,14 @@ class Course(models.Model):
     credit = models.ForeignKey("Credit", on_delete=models.PROTECT)
     course_title = models.CharField(max_length=255)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["program", "semester"], name="course_program_semester_idx"),
+            GinIndex(fields=["course_code"], opclasses=["gin_trgm_ops"], name="course_code_trgm_idx"),
+            GinIndex(fields=["course_title"], opclasses=["gin_trgm_ops"], name="course_title_trgm_idx"),
+            GinIndex(SearchVector("course_title", config="english"), name="course_title_search_idx"),
+        ]
+
 # ====================================================
 # Loaded Course Information
 # ====================================================
@@ -117,16 +135,69 @@ class LoadedCourse(models.Model):
     course = models.ForeignKey("Course", on_delete=models.CASCADE)
     academic_year = models.ForeignKey("AcademicYear", on_delete=models.PROTECT)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["course", "loaded_course_id"], name="loaded_course_cursor_idx"),
+            models.Index(fields=["academic_year", "course", "loaded_course_id"], name="loaded_course_year_course_idx"),
+        ]
+
+class LoadedCourseCatalog(models.Model):
+    loaded_course = models.OneToOneField("LoadedCourse", on_delete=models.CASCADE, primary_key=True, related_name="catalog_entry")
+    course_code = models.CharField(max_length=255)
+    course_title = models.CharField(max_length=255)
+    program_id = models.IntegerField()
+    program_name = models.CharField(max_length=255)
+    department_id = models.IntegerField()
+    department_name = models.CharField(max_length=255)
+    college_id = models.IntegerField(null=True, blank=True)
+    college_name = models.CharField(max_length=225, null=True, blank=True)
+    campus_id = models.IntegerField()
+    campus_name = models.CharField(max_length=225)
+    academic_year_id = models.IntegerField()
+    academic_year_start = models.IntegerField()
+    academic_year_end = models.IntegerField()
+    semester_id = models.IntegerField()
+    semester_type = models.CharField(max_length=255)
+    year_level_id = models.IntegerField()
+    year_level_type = models.CharField(max_length=255)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["course_code", "loaded_course"], name="catalog_cursor_idx"),
+            models.Index(fields=["department_id", "academic_year_id"], name="catalog_department_year_idx"),
+            models.Index(fields=["college_id", "academic_year_id"], name="catalog_college_year_idx"),
+            models.Index(fields=["campus_id", "academic_year_id"], name="catalog_campus_year_idx"),
+            models.Index(fields=["academic_year_id", "course_code"], name="catalog_year_code_idx"),
+        ]
+
 # ====================================================
 # Section Information
 # ====================================================
 class Section(models.Model):
+    PROVISIONING_PENDING = "provisioning"
+    PROVISIONING_READY = "ready"
+    PROVISIONING_FAILED = "failed"
+    PROVISIONING_CHOICES = [
+        (PROVISIONING_PENDING, "Provisioning"),
+        (PROVISIONING_READY, "Ready"),
+        (PROVISIONING_FAILED, "Failed"),
+    ]
+
     section_id = models.AutoField(primary_key=True)
     loaded_course = models.ForeignKey("LoadedCourse", on_delete=models.CASCADE)
     instructor_assigned = models.ForeignKey("User", on_delete=models.SET_NULL, null=True, blank=True)
     year_and_section = models.CharField(max_length=225)
     result_sheet_remarks = models.CharField(max_length=225, blank=True, null=True)
     result_sheet_status = models.CharField(max_length=225, blank=True, null=True)
+    provisioning_status = models.CharField(max_length=16, choices=PROVISIONING_CHOICES, default=PROVISIONING_PENDING)
+    provisioning_error = models.TextField(null=True, blank=True)
+    provisioning_requested_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["year_and_section"], opclasses=["gin_trgm_ops"], name="section_name_trgm_idx"),
+            models.Index(fields=["provisioning_status"], name="section_provisioning_idx"),
+        ]
 
 class Student(models.Model):
     student_id = models.AutoField(primary_key=True)
@@ -136,6 +207,10 @@ class Student(models.Model):
     remarks = models.CharField(max_length=225, blank=True, null=True)
     class Meta:
         unique_together = ("student_id", "section")
+        indexes = [
+            models.Index(fields=["id_number"], name="student_id_number_idx"),
+            GinIndex(fields=["student_name"], opclasses=["gin_trgm_ops"], name="student_name_trgm_idx"),
+        ]
 
 # ====================================================
 # Class Record Template
@@ -222,4 +297,34 @@ class OutcomeMapping(models.Model):
     outcome_mapping = models.CharField(max_length=255, null=True, blank=True)
 
     class Meta:
-        unique_together = ("program_outcome", "course_outcome")
\ No newline at end of file
+        unique_together = ("program_outcome", "course_outcome")
+
+class ProgramOutcomeIndex(models.Model):
+    program = models.OneToOneField("Program", on_delete=models.CASCADE, primary_key=True, related_name="outcome_index")
+    program_outcome_codes = models.JSONField()
+    vocabulary = models.JSONField()
+    idf = models.BinaryField()
+    oov_idf = models.FloatField()
+    vectors = models.BinaryField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+class NlpOutcomeMappingResult(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    loaded_course = models.ForeignKey("LoadedCourse", on_delete=models.CASCADE)
+    instructor = models.ForeignKey("User", on_delete=models.CASCADE, related_name="nlp_outcome_mapping_results")
+    outcomes_hash = models.CharField(max_length=64)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_DONE)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("loaded_course", "instructor")
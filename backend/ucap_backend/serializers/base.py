@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from ucap_backend.models import AcademicYear, Campus, College, Credit, Department, LoadedCourse, Program, Section, Semester, User, UserRole, YearLevel
+from ucap_backend.models import AcademicYear, Campus, College, Credit, Department, LoadedCourse, LoadedCourseCatalog, Program, Section, Semester, User, UserRole, YearLevel
+from ucap_backend.services.dashboard_stats import section_completeness
 
 # ====================================================
 # Reusable Serializers
@@ -28,6 +29,22 @@ class BaseLoadedCourseSerializer(serializers.ModelSerializer):
             "year_level_type",
         ]
 
+class BaseLoadedCourseCatalogSerializer(serializers.ModelSerializer):
+    loaded_course_id = serializers.IntegerField(read_only=True)
+    section_count = serializers.IntegerField(read_only=True)
+    student_count = serializers.IntegerField(read_only=True)
+    instructor_count = serializers.IntegerField(read_only=True)
+    sections_with_result_sheet = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = LoadedCourseCatalog
+        fields = BaseLoadedCourseSerializer.Meta.fields + [
+            "section_count",
+            "student_count",
+            "instructor_count",
+            "sections_with_result_sheet",
+        ]
+
 class BaseSectionSerializer(serializers.ModelSerializer):
     instructor_id = serializers.IntegerField(
         source="instructor_assigned.user_id",
@@ -49,6 +66,22 @@ class BaseSectionSerializer(serializers.ModelSerializer):
             "instructor_id",
         ]
 
+class BaseSectionCompletenessSerializer(BaseSectionSerializer):
+    completeness = serializers.SerializerMethodField()
+
+    def get_completeness(self, obj):
+        return section_completeness(obj)
+
+    class Meta(BaseSectionSerializer.Meta):
+        fields = [
+            "section_id",
+            "year_and_section",
+            "instructor_assigned",
+            "instructor_id",
+            "provisioning_status",
+            "completeness",
+        ]
+
 class BaseCourseDetailsSerializer(serializers.ModelSerializer):
     course_title = serializers.CharField(source="loaded_course.course.course_title", read_only=True)
     academic_year = serializers.SerializerMethodField()
@@ -1,6 +1,6 @@
 from rest_framework import serializers
-from .base import BaseCourseDetailsSerializer, BaseLoadedCourseSerializer, BaseSectionSerializer
-from ucap_backend.models import Course, Credit, LoadedCourse, Program, Section, Semester, User, YearLevel
+from .base import BaseCourseDetailsSerializer, BaseLoadedCourseCatalogSerializer, BaseSectionCompletenessSerializer
+from ucap_backend.models import Course, Credit, LoadedCourse, NlpOutcomeMappingResult, Program, Section, Semester, User, YearLevel
 
 # ====================================================
 # Department Chair
@@ -25,7 +25,7 @@ class DepartmentCourseSerializer(serializers.ModelSerializer):
             "credit_unit",
         ]
 
-class DepartmentLoadedCourseSerializer(BaseLoadedCourseSerializer):
+class DepartmentLoadedCourseSerializer(BaseLoadedCourseCatalogSerializer):
     pass
 
 class CreateDepartmentLoadedCourseSerializer(serializers.ModelSerializer):
@@ -48,15 +48,10 @@ class CreateDepartmentLoadedCourseSerializer(serializers.ModelSerializer):
 
         return attrs
 
-class DepartmentChairSectionSerializer(BaseSectionSerializer):
-    class Meta(BaseSectionSerializer.Meta):
+class DepartmentChairSectionSerializer(BaseSectionCompletenessSerializer):
+    class Meta(BaseSectionCompletenessSerializer.Meta):
         model = Section
-        fields = [
-            "section_id",
-            "year_and_section",
-            "instructor_assigned",
-            "instructor_id",
-        ]
+        fields = BaseSectionCompletenessSerializer.Meta.fields
 
 class DepartmentChairCourseDetailsSerializer(BaseCourseDetailsSerializer):
     class Meta(BaseCourseDetailsSerializer.Meta):
@@ -91,6 +86,62 @@ class SectionCreateUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("A section with these details already exists.")
         return attrs
     
+class BulkSectionEntrySerializer(serializers.Serializer):
+    year_and_section = serializers.CharField(max_length=225)
+    instructor_assigned = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(), required=False, allow_null=True
+    )
+
+class BulkSectionCreateSerializer(serializers.Serializer):
+    sections = BulkSectionEntrySerializer(many=True, allow_empty=False)
+
+    def validate_sections(self, sections):
+        loaded_course = self.context["loaded_course"]
+
+        keys = [(s["year_and_section"], getattr(s.get("instructor_assigned"), "pk", None)) for s in sections]
+        if len(set(keys)) != len(keys):
+            raise serializers.ValidationError("The same section is listed more than once.")
+
+        existing = set(
+            Section.objects
+            .filter(loaded_course=loaded_course, year_and_section__in=[key[0] for key in keys])
+            .values_list("year_and_section", "instructor_assigned_id")
+        )
+        duplicates = sorted({key[0] for key in keys if key in existing})
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Section(s) already exist: {', '.join(duplicates)}."
+            )
+        return sections
+
+# ====================================================
+# Program NLP Outcome Mapping
+# ====================================================
+class ProgramNlpOutcomeMappingSerializer(serializers.ModelSerializer):
+    loaded_course_id = serializers.IntegerField(source="loaded_course.loaded_course_id", read_only=True)
+    course_code = serializers.CharField(source="loaded_course.course.course_code", read_only=True)
+    course_title = serializers.CharField(source="loaded_course.course.course_title", read_only=True)
+    instructor_id = serializers.IntegerField(source="instructor.user_id", read_only=True)
+    instructor_assigned = serializers.SerializerMethodField()
+
+    def get_instructor_assigned(self, obj):
+        ins = obj.instructor
+        return f"{ins.first_name} {ins.last_name}".strip()
+
+    class Meta:
+        model = NlpOutcomeMappingResult
+        fields = [
+            "loaded_course_id",
+            "course_code",
+            "course_title",
+            "instructor_id",
+            "instructor_assigned",
+            "status",
+            "result",
+            "error",
+            "updated_at",
+        ]
+
 # ====================================================
 # Course Management
 # ====================================================
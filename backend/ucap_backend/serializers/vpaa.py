@@ -1,22 +1,17 @@
 from ucap_backend.models import Section
-from .base import BaseCourseDetailsSerializer, BaseLoadedCourseSerializer, BaseSectionSerializer
+from .base import BaseCourseDetailsSerializer, BaseLoadedCourseCatalogSerializer, BaseSectionCompletenessSerializer
 
 # ====================================================
 # VPAA
 # ====================================================
-class VpaaLoadedCourseSerializer(BaseLoadedCourseSerializer):
-    class Meta(BaseLoadedCourseSerializer.Meta):
-        fields = BaseLoadedCourseSerializer.Meta.fields
+class VpaaLoadedCourseSerializer(BaseLoadedCourseCatalogSerializer):
+    class Meta(BaseLoadedCourseCatalogSerializer.Meta):
+        fields = BaseLoadedCourseCatalogSerializer.Meta.fields
 
-class VpaaSectionSerializer(BaseSectionSerializer):
-    class Meta(BaseSectionSerializer.Meta):
+class VpaaSectionSerializer(BaseSectionCompletenessSerializer):
+    class Meta(BaseSectionCompletenessSerializer.Meta):
         model = Section
-        fields = [
-            "section_id",
-            "year_and_section",
-            "instructor_assigned",
-            "instructor_id",
-        ]
+        fields = BaseSectionCompletenessSerializer.Meta.fields
 
 class VpaaCourseDetailsSerializer(BaseCourseDetailsSerializer):
     class Meta(BaseCourseDetailsSerializer.Meta):
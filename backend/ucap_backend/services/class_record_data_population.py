@@ -1,10 +1,30 @@
+from collections import defaultdict
 from ucap_backend.models import Assessment, CourseComponent, CourseTerm, CourseUnit, RawScore, Student
 
-def create_class_record_service(section):
-    loaded_course = section.loaded_course
-    course = loaded_course.course
-    credit = course.credit
+STUDENTS_PER_SECTION = 40
+COURSE_TERMS = ["Midterm", "Final"]
+BATCH_SIZE = 2000
+BLANK_STUDENT = {"id_number": None, "student_name": None, "remarks": None}
+
+def _lecture_components(term_type):
+    return [
+        ("Class Standing Performance Items", 10, 5, None),
+        ("Quiz/Prelim Performance Item" if term_type == "Midterm" else "Quiz/Pre-final Performance Item", 40, 4,
+         "Prelim Exam" if term_type == "Midterm" else "SFinal Exam"),
+        ("Midterm Exam" if term_type == "Midterm" else "Final Exam", 30, 0,
+         "Mid Written Exam" if term_type == "Midterm" else "Fin Written Exam"),
+        ("Per Inno Task", 20, 2, None),
+    ]
 
+def _lab_components(term_type):
+    return [
+        ("Lab Exercises/Reports", 30, 5, None),
+        ("Hands on Exercises", 30, 3, None),
+        ("Lab Major Exam", 40, 0,
+         "Mid Lab Exam" if term_type == "Midterm" else "Fin Lab Exam"),
+    ]
+
+def _units_for(credit):
     lecture_units = credit.lecture_unit
     lab_units = credit.laboratory_unit
     total_units = lecture_units + lab_units
@@ -12,86 +32,99 @@ def create_class_record_service(section):
     lecture_pct = round((lecture_units / total_units) * 100) if lecture_units > 0 else 0
     lab_pct = 100 - lecture_pct if lab_units > 0 else 0
 
-    course_terms = ["Midterm", "Final"]
-
-    for _ in range(40):
-        Student.objects.create(
-            section=section,
-            id_number=None,
-            student_name=None,
-            remarks=None
-        )
-
-    students = Student.objects.filter(section=section)
-
-    for term_type in course_terms:
-        term = CourseTerm.objects.create(
-            section=section,
-            course_term_type=term_type
-        )
-
-        if lecture_units > 0:
-            lecture_unit = CourseUnit.objects.create(
-                course_term=term,
-                course_unit_type="Lecture",
-                course_unit_percentage=lecture_pct
-            )
-            lecture_components = [
-                ("Class Standing Performance Items", 10, 5, None),
-                ("Quiz/Prelim Performance Item" if term_type == "Midterm" else "Quiz/Pre-final Performance Item", 40, 4,
-                 "Prelim Exam" if term_type == "Midterm" else "SFinal Exam"),
-                ("Midterm Exam" if term_type == "Midterm" else "Final Exam", 30, 0,
-                 "Mid Written Exam" if term_type == "Midterm" else "Fin Written Exam"),
-                ("Per Inno Task", 20, 2, None),
-            ]
-            for comp_name, comp_percentage, empty_assessments, special_assessment in lecture_components:
-                comp = CourseComponent.objects.create(
-                    course_unit=lecture_unit,
-                    course_component_type=comp_name,
-                    course_component_percentage=comp_percentage
-                )
-                titles = [None] * empty_assessments
-                if special_assessment:
-                    titles.append(special_assessment)
-
-                for title in titles:
-                    assessment = Assessment.objects.create(
-                        course_component=comp,
-                        assessment_title=title
-                    )
-                    RawScore.objects.bulk_create([
-                        RawScore(student=student, assessment=assessment)
-                        for student in students
-                    ])
-
-        if lab_units > 0:
-            lab_unit = CourseUnit.objects.create(
-                course_term=term,
-                course_unit_type="Laboratory",
-                course_unit_percentage=lab_pct
+    units = []
+    if lecture_units > 0:
+        units.append(("Lecture", lecture_pct, _lecture_components))
+    if lab_units > 0:
+        units.append(("Laboratory", lab_pct, _lab_components))
+    return units
+
+def create_class_records_service(sections, student_fields=None, assessment_fields=None, raw_score=None):
+    # The optional callables fill in values for generated data (see
+    # synthetic_data); by default every row is created blank.
+    sections = list(sections)
+    if not sections:
+        return 0
+
+    credits = {}
+    for section in sections:
+        if section.loaded_course_id not in credits:
+            credits[section.loaded_course_id] = section.loaded_course.course.credit
+
+    students = Student.objects.bulk_create(
+        [
+            Student(section=section, **(student_fields(section, index) if student_fields else BLANK_STUDENT))
+            for section in sections
+            for index in range(STUDENTS_PER_SECTION)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    students_by_section = defaultdict(list)
+    for student in students:
+        students_by_section[student.section_id].append(student)
+
+    terms = CourseTerm.objects.bulk_create(
+        [
+            CourseTerm(section=section, course_term_type=term_type)
+            for section in sections
+            for term_type in COURSE_TERMS
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    unit_specs = [
+        (term, unit_type, percentage, components)
+        for term, section in zip(terms, [s for s in sections for _ in COURSE_TERMS])
+        for unit_type, percentage, components in _units_for(credits[section.loaded_course_id])
+    ]
+    units = CourseUnit.objects.bulk_create(
+        [
+            CourseUnit(course_term=term, course_unit_type=unit_type, course_unit_percentage=percentage)
+            for term, unit_type, percentage, _ in unit_specs
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    component_specs = [
+        (unit, term, spec)
+        for unit, (term, _, _, components) in zip(units, unit_specs)
+        for spec in components(term.course_term_type)
+    ]
+    components = CourseComponent.objects.bulk_create(
+        [
+            CourseComponent(course_unit=unit, course_component_type=name, course_component_percentage=percentage)
+            for unit, _, (name, percentage, _, _) in component_specs
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    assessment_sections = []
+    assessment_rows = []
+    for component, (_, term, (_, _, empty_assessments, special_assessment)) in zip(components, component_specs):
+        titles = [None] * empty_assessments
+        if special_assessment:
+            titles.append(special_assessment)
+        for title in titles:
+            fields = assessment_fields(term.section_id, title) if assessment_fields else {}
+            assessment_rows.append(Assessment(course_component=component, assessment_title=title, **fields))
+            assessment_sections.append(term.section_id)
+
+    assessments = Assessment.objects.bulk_create(assessment_rows, batch_size=BATCH_SIZE)
+
+    RawScore.objects.bulk_create(
+        [
+            RawScore(
+                student=student,
+                assessment=assessment,
+                raw_score=raw_score(student, assessment) if raw_score else None,
             )
-            lab_components = [
-                ("Lab Exercises/Reports", 30, 5, None),
-                ("Hands on Exercises", 30, 3, None),
-                ("Lab Major Exam", 40, 0,
-                 "Mid Lab Exam" if term_type == "Midterm" else "Fin Lab Exam"),
-            ]
-            for comp_name, comp_percentage, empty_assessments, special_assessment in lab_components:
-                comp = CourseComponent.objects.create(
-                    course_unit=lab_unit,
-                    course_component_type=comp_name,
-                    course_component_percentage=comp_percentage
-                )
-                titles = [None] * empty_assessments
-                if special_assessment:
-                    titles.append(special_assessment)
-
-                for title in titles:
-                    assessment = Assessment.objects.create(
-                        course_component=comp,
-                        assessment_title=title
-                    )
-                    RawScore.objects.bulk_create([
-                        RawScore(student=student, assessment=assessment)
-                        for student in students
-                    ])
\ No newline at end of file
+            for assessment, section_id in zip(assessments, assessment_sections)
+            for student in students_by_section[section_id]
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    return len(sections)
+
+def create_class_record_service(section):
+    return create_class_records_service([section])
@@ -0,0 +1,146 @@
+import hashlib
+import threading
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+from ucap_backend.models import Course, LoadedCourseCatalog, Section
+
+# ====================================================
+# Dashboard Response Cache
+# ====================================================
+CACHE_PREFIX = "dashboard"
+SCOPES = ["department", "college", "campus", "university"]
+STAT_OUTCOMES = ["hit", "miss"]
+
+def _version_key(scope, scope_id=None):
+    return f"{CACHE_PREFIX}:version:{scope}:{scope_id or 0}"
+
+def _get_version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, None)
+        version = cache.get(key, 1)
+    return version
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 2, None)
+
+def dashboard_cache_key(scope, scope_id, view_name, params):
+    query = "&".join(f"{key}={value}" for key, values in sorted(params.lists()) for value in values)
+    digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+    versions = f"{_get_version(_version_key('all'))}.{_get_version(_version_key(scope, scope_id))}"
+    return f"{CACHE_PREFIX}:{scope}:{scope_id or 0}:{versions}:{view_name}:{digest}"
+
+def _record(scope, outcome):
+    key = f"{CACHE_PREFIX}:stats:{scope}:{outcome}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+def cached_dashboard_response(request, scope, scope_id, view_name, build):
+    key = dashboard_cache_key(scope, scope_id, view_name, request.query_params)
+    data = cache.get(key)
+    outcome = "hit"
+
+    if data is None:
+        outcome = "miss"
+        data = build()
+        cache.set(key, data, settings.DASHBOARD_CACHE_SECONDS)
+
+    _record(scope, outcome)
+    response = Response(data, status=status.HTTP_200_OK)
+    response["X-Dashboard-Cache"] = outcome
+    return response
+
+def dashboard_cache_stats():
+    keys = [f"{CACHE_PREFIX}:stats:{scope}:{outcome}" for scope in SCOPES for outcome in STAT_OUTCOMES]
+    values = cache.get_many(keys)
+    return {
+        scope: {outcome: values.get(f"{CACHE_PREFIX}:stats:{scope}:{outcome}", 0) for outcome in STAT_OUTCOMES}
+        for scope in SCOPES
+    }
+
+def reset_dashboard_cache_stats():
+    cache.delete_many([f"{CACHE_PREFIX}:stats:{scope}:{outcome}" for scope in SCOPES for outcome in STAT_OUTCOMES])
+
+def invalidate_dashboard_scopes(department_id=None, college_id=None, campus_id=None):
+    # Versioned keys make old entries unreachable; they expire on their own.
+    if department_id is None and campus_id is None:
+        invalidate_all_dashboards()
+        return
+
+    _bump_version(_version_key("university"))
+    for scope, scope_id in (("department", department_id), ("college", college_id), ("campus", campus_id)):
+        if scope_id is not None:
+            _bump_version(_version_key(scope, scope_id))
+
+def invalidate_course_dashboards(course_id):
+    scope_ids = (
+        Course.objects
+        .filter(pk=course_id)
+        .values("program__department_id", "program__department__college_id", "program__department__campus_id")
+        .first()
+    )
+    if scope_ids is None:
+        invalidate_all_dashboards()
+        return
+
+    invalidate_dashboard_scopes(
+        department_id=scope_ids["program__department_id"],
+        college_id=scope_ids["program__department__college_id"],
+        campus_id=scope_ids["program__department__campus_id"],
+    )
+
+# Sections, students and assessments change a row at a time (and in cascades),
+# so their invalidations are queued and resolved to dashboard scopes with one
+# lookup when the transaction commits.
+_pending = threading.local()
+
+def _pending_invalidations():
+    if not hasattr(_pending, "loaded_courses"):
+        _pending.loaded_courses = set()
+        _pending.sections = set()
+    return _pending
+
+def _flush_dashboard_invalidations():
+    pending = _pending_invalidations()
+    loaded_course_ids, section_ids = pending.loaded_courses, pending.sections
+    pending.loaded_courses, pending.sections = set(), set()
+
+    if section_ids:
+        loaded_course_ids |= set(
+            Section.objects.filter(pk__in=section_ids).values_list("loaded_course_id", flat=True)
+        )
+    if not loaded_course_ids:
+        return
+
+    rows = list(
+        LoadedCourseCatalog.objects
+        .filter(pk__in=loaded_course_ids)
+        .values_list("department_id", "college_id", "campus_id")
+    )
+    if len(rows) < len(loaded_course_ids):
+        invalidate_all_dashboards()
+        return
+
+    for department_id, college_id, campus_id in set(rows):
+        invalidate_dashboard_scopes(department_id=department_id, college_id=college_id, campus_id=campus_id)
+
+def invalidate_loaded_course_dashboards(loaded_course_id):
+    _pending_invalidations().loaded_courses.add(loaded_course_id)
+    transaction.on_commit(_flush_dashboard_invalidations)
+
+def invalidate_section_dashboards(section_id):
+    # Student and assessment counts are part of the cached payloads.
+    _pending_invalidations().sections.add(section_id)
+    transaction.on_commit(_flush_dashboard_invalidations)
+
+def invalidate_all_dashboards():
+    _bump_version(_version_key("all"))
@@ -0,0 +1,144 @@
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from ucap_backend.models import Assessment, RawScore, Section, Student
+
+# ====================================================
+# Dashboard Statistics
+# ====================================================
+SECTION_STAT_FIELDS = [
+    "section_count",
+    "student_count",
+    "instructor_count",
+    "unassigned_section_count",
+    "sections_with_students",
+    "sections_with_assessments",
+    "sections_with_result_sheet",
+]
+
+def _annotate_section_flags(sections):
+    return sections.annotate(
+        enrolled_count=_count_subquery(Student.objects.filter(section_id=OuterRef("section_id")), "section_id"),
+        has_assessments=Exists(
+            Assessment.objects.filter(course_component__course_unit__course_term__section_id=OuterRef("section_id"))
+        ),
+    )
+
+def _section_aggregates():
+    # Students are counted per section by subquery and summed, so the
+    # aggregate stays one row per section and never joins Student.
+    submitted = Q(result_sheet_status__isnull=False) & ~Q(result_sheet_status="")
+    return {
+        "section_count": Count("section_id"),
+        "student_count": Coalesce(Sum("enrolled_count"), Value(0)),
+        "instructor_count": Count("instructor_assigned", distinct=True),
+        "unassigned_section_count": Count("section_id", filter=Q(instructor_assigned__isnull=True)),
+        "sections_with_students": Count("section_id", filter=Q(enrolled_count__gt=0)),
+        "sections_with_assessments": Count("section_id", filter=Q(has_assessments=True)),
+        "sections_with_result_sheet": Count("section_id", filter=submitted),
+    }
+
+def _completion(stats):
+    sections = stats["section_count"]
+    stats["class_record_completion"] = round(stats["sections_with_result_sheet"] / sections, 4) if sections else 0.0
+    return stats
+
+def _count_subquery(queryset, field):
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(field).annotate(total=Count("pk")).values("total"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+def annotate_loaded_course_stats(queryset):
+    return queryset.annotate(
+        section_count=_count_subquery(Section.objects.filter(loaded_course_id=OuterRef("pk")), "loaded_course_id"),
+        student_count=_count_subquery(
+            Student.objects.filter(section__loaded_course_id=OuterRef("pk")), "section__loaded_course_id"
+        ),
+        instructor_count=Coalesce(
+            Subquery(
+                Section.objects.filter(loaded_course_id=OuterRef("pk"), instructor_assigned__isnull=False)
+                .order_by()
+                .values("loaded_course_id")
+                .annotate(total=Count("instructor_assigned", distinct=True))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        ),
+        sections_with_result_sheet=_count_subquery(
+            Section.objects.filter(loaded_course_id=OuterRef("pk"), result_sheet_status__isnull=False)
+            .exclude(result_sheet_status=""),
+            "loaded_course_id",
+        ),
+    )
+
+def scope_summary(loaded_courses):
+    loaded_courses = loaded_courses.order_by()
+    sections = _annotate_section_flags(
+        Section.objects.filter(loaded_course__in=loaded_courses.values("loaded_course_id")).order_by()
+    )
+
+    totals = sections.aggregate(**_section_aggregates())
+    totals["loaded_course_count"] = loaded_courses.count()
+
+    programs = {
+        row["program_id"]: {**row, **{field: 0 for field in SECTION_STAT_FIELDS}}
+        for row in loaded_courses
+        .values(program_id=F("course__program_id"), program_name=F("course__program__program_name"))
+        .annotate(loaded_course_count=Count("loaded_course_id"))
+    }
+
+    for row in (
+        sections
+        .values(program_id=F("loaded_course__course__program_id"))
+        .annotate(**_section_aggregates())
+    ):
+        programs[row["program_id"]].update(row)
+
+    return {
+        "totals": _completion(totals),
+        "programs": [
+            _completion(program)
+            for program in sorted(programs.values(), key=lambda p: p["program_name"] or "")
+        ],
+    }
+
+# ====================================================
+# Section Completeness
+# ====================================================
+SECTION_ASSESSMENT_LOOKUP = "course_component__course_unit__course_term__section_id"
+
+def annotate_section_completeness(sections):
+    assessments = Assessment.objects.filter(**{SECTION_ASSESSMENT_LOOKUP: OuterRef("section_id")})
+    return sections.annotate(
+        enrolled_count=_count_subquery(Student.objects.filter(section_id=OuterRef("section_id")), "section_id"),
+        assessment_count=_count_subquery(assessments, SECTION_ASSESSMENT_LOOKUP),
+        assessments_missing_highest_score=_count_subquery(
+            assessments.filter(assessment_highest_score__isnull=True), SECTION_ASSESSMENT_LOOKUP
+        ),
+        assessments_without_outcome=_count_subquery(
+            assessments.filter(course_outcome__isnull=True), SECTION_ASSESSMENT_LOOKUP
+        ),
+        filled_score_count=_count_subquery(
+            RawScore.objects.filter(student__section_id=OuterRef("section_id"), raw_score__isnull=False),
+            "student__section_id",
+        ),
+    )
+
+def section_completeness(section):
+    assessments = section.assessment_count
+    score_cells = section.enrolled_count * assessments
+    filled = min(section.filled_score_count, score_cells)
+    return {
+        "student_count": section.enrolled_count,
+        "assessment_count": assessments,
+        "assessments_missing_highest_score": section.assessments_missing_highest_score,
+        "assessments_without_outcome": section.assessments_without_outcome,
+        "score_cell_count": score_cells,
+        "filled_score_count": filled,
+        "score_fill_rate": round(filled / score_cells, 4) if score_cells else 0.0,
+        "outcomes_mapped": assessments > 0 and section.assessments_without_outcome == 0,
+    }
@@ -0,0 +1,72 @@
+from django.db.models import Prefetch, Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from ucap_backend.models import Department, User
+
+# ====================================================
+# Faculty Listing
+# ====================================================
+FACULTY_RELATED = ["user_role", "chair_department", "dean_college", "vcaa_campus"]
+
+FACULTY_FILTERS = {
+    "user_role_id": "user_role_id",
+    "department_id": "department_id",
+    "college_id": "department__college_id",
+    "campus_id": "department__campus_id",
+}
+FACULTY_SEARCH_FIELDS = ("first_name", "middle_name", "last_name", "email")
+
+class FacultyCursorPagination(CursorPagination):
+    ordering = ("last_name", "user_id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+def faculty_queryset():
+    return (
+        User.objects
+        .exclude(user_role__user_role_type="Administrator")
+        .select_related(*FACULTY_RELATED)
+        .prefetch_related(
+            Prefetch("departments", queryset=Department.objects.only("department_id", "department_name"))
+        )
+    )
+
+def filter_faculty(queryset, params):
+    # Department filters go through the M2M table as a subquery so teaching in
+    # several matching departments never duplicates a row.
+    memberships = {}
+    for param, lookup in FACULTY_FILTERS.items():
+        value = params.get(param)
+        if value in (None, ""):
+            continue
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise ValidationError({param: "Must be an integer."})
+
+        if param == "user_role_id":
+            queryset = queryset.filter(user_role_id=value)
+        else:
+            memberships[lookup] = value
+
+    if memberships:
+        queryset = queryset.filter(
+            user_id__in=User.departments.through.objects.filter(**memberships).values("user_id")
+        )
+
+    search = (params.get("search") or "").strip()
+    if search:
+        condition = Q()
+        for field in FACULTY_SEARCH_FIELDS:
+            condition |= Q(**{f"{field}__icontains": search})
+        if search.isdigit():
+            condition |= Q(user_id=int(search))
+        queryset = queryset.filter(condition)
+
+    return queryset
+
+def paginate_faculty(request, serializer_class):
+    paginator = FacultyCursorPagination()
+    page = paginator.paginate_queryset(filter_faculty(faculty_queryset(), request.query_params), request)
+    return paginator.get_paginated_response(serializer_class(page, many=True).data)
@@ -0,0 +1,186 @@
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import TextIOWrapper
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models.functions import Lower
+from ucap_backend.models import Campus, College, Department, User, UserRole
+
+# ====================================================
+# Bulk Faculty Import
+# ====================================================
+FACULTY_IMPORT_COLUMNS = [
+    "user_id",
+    "first_name",
+    "middle_name",
+    "last_name",
+    "suffix",
+    "email",
+    "user_role",
+    "departments",
+    "chair_department",
+    "dean_college",
+    "vcaa_campus",
+]
+REQUIRED_COLUMNS = {"user_id", "last_name", "email", "user_role"}
+
+# Same designation rules CreateFacultySerializer.validate enforces.
+ROLE_DESIGNATIONS = {
+    "Department Chair": "chair_department",
+    "Dean": "dean_college",
+    "Vice Chancellor for Academic Affairs": "vcaa_campus",
+}
+
+HASH_WORKERS = int(os.environ.get("FACULTY_IMPORT_HASH_WORKERS", os.cpu_count() or 4))
+BATCH_SIZE = 500
+
+def read_faculty_csv(file):
+    reader = csv.DictReader(TextIOWrapper(file, encoding="utf-8-sig", errors="ignore"))
+    header = [(name or "").strip().lower() for name in reader.fieldnames or []]
+    missing = REQUIRED_COLUMNS - set(header)
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(sorted(missing))}.")
+
+    reader.fieldnames = header
+    return [
+        {column: (row.get(column) or "").strip() for column in FACULTY_IMPORT_COLUMNS}
+        for row in reader
+        if any((value or "").strip() for value in row.values() if isinstance(value, str))
+    ]
+
+class _Lookup:
+    # Resolves a CSV cell to a primary key by id or case-insensitive name.
+    def __init__(self, rows, pk, name):
+        self.labels = {}
+        self.names = {}
+        for row in rows:
+            self.labels[row[pk]] = row[name]
+            key = (row[name] or "").strip().lower()
+            self.names[key] = None if key in self.names else row[pk]
+
+    def resolve(self, value):
+        if value.isdigit() and int(value) in self.labels:
+            return int(value)
+        key = value.lower()
+        if key not in self.names:
+            raise ValueError(f"'{value}' was not found.")
+        if self.names[key] is None:
+            raise ValueError(f"'{value}' matches more than one record; use its ID.")
+        return self.names[key]
+
+def _lookups():
+    departments = _Lookup(Department.objects.values("department_id", "department_name"), "department_id", "department_name")
+    return {
+        "user_role": _Lookup(UserRole.objects.values("user_role_id", "user_role_type"), "user_role_id", "user_role_type"),
+        "departments": departments,
+        "chair_department": departments,
+        "dean_college": _Lookup(College.objects.values("college_id", "college_name"), "college_id", "college_name"),
+        "vcaa_campus": _Lookup(Campus.objects.values("campus_id", "campus_name"), "campus_id", "campus_name"),
+    }
+
+def validate_faculty_rows(rows):
+    lookups = _lookups()
+    role_types = lookups["user_role"].labels
+
+    # Two set-based queries instead of two existence checks per row.
+    taken_ids = set(
+        User.objects
+        .filter(user_id__in=[int(row["user_id"]) for row in rows if row["user_id"].isdigit()])
+        .values_list("user_id", flat=True)
+    )
+    # Compared lowercased, like the in-file duplicate check below.
+    taken_emails = set(
+        User.objects
+        .annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=[row["email"].lower() for row in rows if row["email"]])
+        .values_list("email_lower", flat=True)
+    )
+
+    seen_ids, seen_emails = set(), set()
+    records, errors = [], []
+
+    for line, row in enumerate(rows, start=2):
+        def fail(field, message):
+            errors.append({"row": line, "field": field, "message": message})
+
+        for column in sorted(REQUIRED_COLUMNS):
+            if not row[column]:
+                fail(column, "This field is required.")
+
+        record = {column: row[column] or None for column in ("first_name", "middle_name", "last_name", "suffix", "email")}
+
+        if row["user_id"]:
+            if not row["user_id"].isdigit():
+                fail("user_id", "User ID must be a number.")
+            else:
+                record["user_id"] = int(row["user_id"])
+                if record["user_id"] in taken_ids:
+                    fail("user_id", "User ID already exists.")
+                elif record["user_id"] in seen_ids:
+                    fail("user_id", "User ID appears more than once in the file.")
+                seen_ids.add(record["user_id"])
+
+        if row["email"]:
+            try:
+                validate_email(row["email"])
+            except DjangoValidationError:
+                fail("email", "Enter a valid email address.")
+            if row["email"].lower() in taken_emails:
+                fail("email", "Email already exists.")
+            elif row["email"].lower() in seen_emails:
+                fail("email", "Email appears more than once in the file.")
+            seen_emails.add(row["email"].lower())
+
+        for column in ("user_role", "chair_department", "dean_college", "vcaa_campus"):
+            record[f"{column}_id"] = None
+            if row[column]:
+                try:
+                    record[f"{column}_id"] = lookups[column].resolve(row[column])
+                except ValueError as e:
+                    fail(column, str(e))
+
+        record["departments"] = []
+        for value in filter(None, (part.strip() for part in row["departments"].split(";"))):
+            try:
+                record["departments"].append(lookups["departments"].resolve(value))
+            except ValueError as e:
+                fail("departments", str(e))
+
+        role_type = role_types.get(record["user_role_id"])
+        designation = ROLE_DESIGNATIONS.get(role_type)
+        if designation and not record[f"{designation}_id"]:
+            fail(designation, f"{role_type} must specify {designation}.")
+
+        records.append(record)
+
+    return records, errors
+
+def hash_initial_passwords(user_ids, workers=HASH_WORKERS):
+    # PBKDF2 runs inside OpenSSL with the GIL released, so threads scale with cores.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(executor.map(make_password, (str(user_id) for user_id in user_ids)))
+
+def import_faculty(rows, dry_run=False, workers=HASH_WORKERS):
+    records, errors = validate_faculty_rows(rows)
+    if errors or dry_run:
+        return {"created": 0, "validated": len(records), "errors": errors}
+
+    passwords = hash_initial_passwords([record["user_id"] for record in records], workers)
+    users = [
+        User(password=password, **{key: value for key, value in record.items() if key != "departments"})
+        for record, password in zip(records, passwords)
+    ]
+    memberships = [
+        User.departments.through(user_id=record["user_id"], department_id=department_id)
+        for record in records
+        for department_id in dict.fromkeys(record["departments"])
+    ]
+
+    with transaction.atomic():
+        User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+        User.departments.through.objects.bulk_create(memberships, batch_size=BATCH_SIZE)
+
+    return {"created": len(users), "validated": len(records), "errors": []}
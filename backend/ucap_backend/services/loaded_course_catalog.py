@@ -0,0 +1,70 @@
+from django.db import transaction
+from ucap_backend.models import LoadedCourse, LoadedCourseCatalog
+
+# ====================================================
+# Loaded Course Catalog
+# ====================================================
+CATALOG_FIELDS = [
+    field.name for field in LoadedCourseCatalog._meta.concrete_fields if field.name != "loaded_course"
+]
+
+CATALOG_RELATED = [
+    "course__program__department__college",
+    "course__program__department__campus",
+    "course__semester",
+    "course__year_level",
+    "academic_year",
+]
+
+def catalog_entry(loaded_course):
+    course = loaded_course.course
+    program = course.program
+    department = program.department
+    college = department.college
+    academic_year = loaded_course.academic_year
+
+    return LoadedCourseCatalog(
+        loaded_course_id=loaded_course.loaded_course_id,
+        course_code=course.course_code,
+        course_title=course.course_title,
+        program_id=program.program_id,
+        program_name=program.program_name,
+        department_id=department.department_id,
+        department_name=department.department_name,
+        college_id=college.college_id if college else None,
+        college_name=college.college_name if college else None,
+        campus_id=department.campus.campus_id,
+        campus_name=department.campus.campus_name,
+        academic_year_id=academic_year.academic_year_id,
+        academic_year_start=academic_year.academic_year_start,
+        academic_year_end=academic_year.academic_year_end,
+        semester_id=course.semester.semester_id,
+        semester_type=course.semester.semester_type,
+        year_level_id=course.year_level.year_level_id,
+        year_level_type=course.year_level.year_level_type,
+    )
+
+def refresh_catalog(loaded_courses=None, batch_size=1000):
+    if loaded_courses is None:
+        loaded_courses = LoadedCourse.objects.all()
+
+    entries = [
+        catalog_entry(loaded_course)
+        for loaded_course in loaded_courses.select_related(*CATALOG_RELATED).iterator(chunk_size=batch_size)
+    ]
+
+    LoadedCourseCatalog.objects.bulk_create(
+        entries,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["loaded_course"],
+        update_fields=CATALOG_FIELDS,
+    )
+    return len(entries)
+
+def rebuild_catalog():
+    with transaction.atomic():
+        LoadedCourseCatalog.objects.exclude(
+            loaded_course_id__in=LoadedCourse.objects.values("loaded_course_id")
+        ).delete()
+        return refresh_catalog()
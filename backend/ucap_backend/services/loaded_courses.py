@@ -0,0 +1,170 @@
+from django.db.models import Q
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.pagination import CursorPagination
+from ucap_backend.models import LoadedCourse, LoadedCourseCatalog, Section
+from ucap_backend.services.dashboard_stats import annotate_section_completeness
+from ucap_backend.services.user_context import get_user_context
+
+# ====================================================
+# Oversight Scope
+# ====================================================
+SCOPE_LOOKUPS = {
+    "department": "course__program__department_id",
+    "college": "course__program__department__college_id",
+    "campus": "course__program__department__campus_id",
+    "university": None,
+}
+
+SCOPE_ASSIGNMENTS = {
+    "department": "chair_department_id",
+    "college": "dean_college_id",
+    "campus": "vcaa_campus_id",
+}
+
+SCOPE_DENIED_MESSAGES = {
+    "department": "You are not assigned to this department.",
+    "college": "You are not assigned to this college.",
+    "campus": "You are not assigned to this campus.",
+    "university": "You are not allowed to access university-wide data.",
+}
+
+# Everything BaseCourseDetailsSerializer reads.
+LOADED_COURSE_RELATED = [
+    "course__program__department__college",
+    "course__program__department__campus",
+    "course__semester",
+    "course__year_level",
+    "academic_year",
+]
+
+# Role and scope come from the cached user context, which user and role saves
+# invalidate; gunicorn.conf.py only runs several workers on a shared cache, so
+# every worker sees the invalidation.
+def has_university_access(user):
+    return get_user_context(user)["university_access"]
+
+def assigned_scope_id(user, scope):
+    if scope == "university":
+        if not has_university_access(user):
+            raise PermissionDenied(SCOPE_DENIED_MESSAGES[scope])
+        return None
+
+    scope_id = getattr(user, SCOPE_ASSIGNMENTS[scope], None)
+    if scope_id is None:
+        raise PermissionDenied(SCOPE_DENIED_MESSAGES[scope])
+    return scope_id
+
+def user_scope(user):
+    scope = get_user_context(user)["user_role_scope"]
+    if scope in SCOPE_ASSIGNMENTS and getattr(user, SCOPE_ASSIGNMENTS[scope], None) is not None:
+        return scope, getattr(user, SCOPE_ASSIGNMENTS[scope])
+
+    if has_university_access(user):
+        return "university", None
+
+    for scope, attr in SCOPE_ASSIGNMENTS.items():
+        if getattr(user, attr, None) is not None:
+            return scope, getattr(user, attr)
+
+    return None, None
+
+def assert_scope_access(user, scope, scope_id=None):
+    assigned = assigned_scope_id(user, scope)
+    if scope != "university" and int(assigned) != int(scope_id):
+        raise PermissionDenied(SCOPE_DENIED_MESSAGES[scope])
+
+def _within_scope(queryset, scope, scope_id):
+    lookup = SCOPE_LOOKUPS[scope]
+    return queryset.filter(**{lookup: scope_id}) if lookup else queryset
+
+def scoped_loaded_courses(user, scope, scope_id=None):
+    assert_scope_access(user, scope, scope_id)
+    return _within_scope(LoadedCourse.objects.select_related(*LOADED_COURSE_RELATED), scope, scope_id)
+
+def scoped_loaded_course(user, scope, loaded_course_id):
+    scope_id = assigned_scope_id(user, scope)
+    return _within_scope(LoadedCourse.objects.select_related(*LOADED_COURSE_RELATED), scope, scope_id).get(
+        pk=loaded_course_id
+    )
+
+def loaded_course_page(loaded_course, details_serializer, section_serializer):
+    dummy_section = Section(
+        loaded_course=loaded_course,
+        instructor_assigned=None,
+        year_and_section=""
+    )
+
+    sections = annotate_section_completeness(
+        Section.objects
+        .select_related("instructor_assigned")
+        .filter(loaded_course_id=loaded_course.pk)
+        .order_by("section_id")
+    )
+
+    return {
+        "course_details": details_serializer(dummy_section).data,
+        "sections": section_serializer(sections, many=True).data,
+    }
+
+# ====================================================
+# Loaded Course Listing
+# ====================================================
+LOADED_COURSE_FILTERS = {
+    "academic_year_id": "academic_year_id",
+    "semester_id": "course__semester_id",
+    "year_level_id": "course__year_level_id",
+    "program_id": "course__program_id",
+    "department_id": "course__program__department_id",
+    "college_id": "course__program__department__college_id",
+}
+LOADED_COURSE_SEARCH_FIELDS = ("course__course_code", "course__course_title")
+
+CATALOG_SCOPE_LOOKUPS = {
+    "department": "department_id",
+    "college": "college_id",
+    "campus": "campus_id",
+    "university": None,
+}
+CATALOG_FILTERS = {param: param for param in LOADED_COURSE_FILTERS}
+CATALOG_SEARCH_FIELDS = ("course_code", "course_title")
+
+class LoadedCourseCursorPagination(CursorPagination):
+    ordering = ("course_code", "loaded_course_id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+def filter_loaded_courses(queryset, params, lookups=LOADED_COURSE_FILTERS, search_fields=LOADED_COURSE_SEARCH_FIELDS):
+    filters = {}
+    for param, lookup in lookups.items():
+        value = params.get(param)
+        if value in (None, ""):
+            continue
+        try:
+            filters[lookup] = int(value)
+        except (TypeError, ValueError):
+            raise ValidationError({param: "Must be an integer."})
+
+    queryset = queryset.filter(**filters)
+
+    search = (params.get("search") or "").strip()
+    if search:
+        condition = Q()
+        for field in search_fields:
+            condition |= Q(**{f"{field}__icontains": search})
+        queryset = queryset.filter(condition)
+
+    return queryset
+
+def scoped_catalog(user, scope, scope_id=None):
+    assert_scope_access(user, scope, scope_id)
+    lookup = CATALOG_SCOPE_LOOKUPS[scope]
+    queryset = LoadedCourseCatalog.objects.all()
+    return queryset.filter(**{lookup: scope_id}) if lookup else queryset
+
+def paginate_loaded_courses(request, catalog, serializer_class):
+    paginator = LoadedCourseCursorPagination()
+    catalog = filter_loaded_courses(catalog, request.query_params, CATALOG_FILTERS, CATALOG_SEARCH_FIELDS)
+    page = paginator.paginate_queryset(catalog, request)
+    serializer = serializer_class(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
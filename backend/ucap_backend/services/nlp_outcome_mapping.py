@@ -0,0 +1,628 @@
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import re
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import numpy as np
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from gradio_client import Client, handle_file
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from ucap_backend.models import CourseOutcome, NlpOutcomeMappingResult, ProgramOutcome, ProgramOutcomeIndex
+
+logger = logging.getLogger(__name__)
+
+# ====================================================
+# Remote Engine (Hugging Face Space)
+# ====================================================
+HF_API_NAME = "/process_json"
+
+MAX_HF_TRIES = 2
+RETRY_DELAY_SECONDS = 3
+
+class CircuitOpenError(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "The NLP service is temporarily unavailable. Please try again later."
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold, reset_seconds):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        with self._lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_seconds
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_seconds:
+                return False
+            # Half-open: let this call through as a trial and keep others out until it resolves.
+            self.opened_at = time.monotonic()
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+_client = None
+_client_lock = threading.Lock()
+_breaker = None
+_breaker_lock = threading.Lock()
+
+def get_circuit_breaker():
+    global _breaker
+    with _breaker_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker(
+                settings.NLP_CIRCUIT_FAILURE_THRESHOLD,
+                settings.NLP_CIRCUIT_RESET_SECONDS,
+            )
+        return _breaker
+
+def get_remote_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = Client(
+                settings.NLP_REMOTE_SPACE,
+                verbose=False,
+                httpx_kwargs={"timeout": settings.NLP_REMOTE_TIMEOUT_SECONDS},
+            )
+        return _client
+
+def reset_remote_client():
+    global _client
+    with _client_lock:
+        _client = None
+
+def _predict(payload, loaded_course_id):
+    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json") as f:
+        json.dump(payload, f)
+        f.flush()
+
+        job = None
+        try:
+            job = get_remote_client().submit(
+                file_obj=handle_file(f.name),
+                api_name=HF_API_NAME,
+            )
+            return job.result(timeout=settings.NLP_REMOTE_TIMEOUT_SECONDS)
+        except Exception:
+            if job is not None:
+                job.cancel()
+            reset_remote_client()
+            logger.exception("HF NLP call failed for loaded_course_id=%s", loaded_course_id)
+            raise
+
+def remote_outcome_mapping(payload, loaded_course_id=None):
+    breaker = get_circuit_breaker()
+    if not breaker.allow():
+        raise CircuitOpenError()
+
+    try:
+        result = _predict(payload, loaded_course_id)
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    breaker.record_success()
+    return result
+
+# ====================================================
+# Local Engine (TF-IDF cosine similarity)
+# ====================================================
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from", "in", "into", "is", "it",
+    "its", "of", "on", "or", "that", "the", "their", "these", "this", "to", "with", "within", "will",
+    "using", "use", "used", "able", "ability", "student", "students", "graduate", "graduates",
+    "course", "various", "well", "such", "both", "other", "based", "through",
+}
+
+SUFFIXES = ("ations", "ation", "ings", "ing", "ments", "ment", "ness", "ies", "ied", "ed", "es", "s")
+
+def _stem(word):
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[: -len(suffix)]
+    return word
+
+def tokenize(text):
+    words = [
+        _stem(w)
+        for w in re.findall(r"[a-z]+", (text or "").lower())
+        if len(w) > 2 and w not in STOPWORDS
+    ]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+class TfidfEncoder:
+    def __init__(self, vocabulary, idf, oov_idf):
+        self.vocabulary = vocabulary
+        self.index = {term: i for i, term in enumerate(vocabulary)}
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.oov_idf = float(oov_idf)
+
+    @classmethod
+    def fit(cls, documents):
+        token_lists = [tokenize(d) for d in documents]
+        df = Counter(term for tokens in token_lists for term in set(tokens))
+        n = len(documents)
+        vocabulary = sorted(df)
+        idf = [math.log((1 + n) / (1 + df[term])) + 1 for term in vocabulary]
+        return cls(vocabulary, idf, math.log(1 + n) + 1)
+
+    def encode(self, documents):
+        matrix = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        oov_sq = np.zeros(len(documents), dtype=np.float32)
+
+        for row, text in enumerate(documents):
+            for term, count in Counter(tokenize(text)).items():
+                col = self.index.get(term)
+                if col is None:
+                    oov_sq[row] += (count * self.oov_idf) ** 2
+                else:
+                    matrix[row, col] = count
+
+        matrix *= self.idf
+        norms = np.sqrt((matrix ** 2).sum(axis=1) + oov_sq)
+        norms[norms == 0] = 1.0
+        return matrix / norms[:, None]
+
+def similarity_matrix(co_texts, po_texts, encoder=None, po_matrix=None):
+    if encoder is None:
+        encoder = TfidfEncoder.fit(po_texts)
+    if po_matrix is None:
+        po_matrix = encoder.encode(po_texts)
+    return encoder.encode(co_texts) @ po_matrix.T
+
+def suggestions_from_scores(co_codes, po_codes, scores, min_similarity=None):
+    if min_similarity is None:
+        min_similarity = settings.NLP_LOCAL_MIN_SIMILARITY
+
+    suggested = scores >= min_similarity
+    if scores.size:
+        best = scores.argmax(axis=1)
+        rows = np.arange(scores.shape[0])
+        suggested[rows, best] |= scores[rows, best] > 0
+
+    return {
+        co_code: {po_code: int(suggested[i, j]) for j, po_code in enumerate(po_codes)}
+        for i, co_code in enumerate(co_codes)
+    }
+
+def local_outcome_mapping(payload, program_id=None):
+    cos = payload["CourseOutcome"]
+    co_texts = [co["course_outcome_description"] for co in cos]
+    co_codes = [co["course_outcome_code"] for co in cos]
+
+    index = get_program_outcome_index(program_id) if program_id is not None else None
+    if index is not None:
+        po_codes, encoder, po_matrix = index
+        scores = encoder.encode(co_texts) @ po_matrix.T
+        return suggestions_from_scores(co_codes, po_codes, scores)
+
+    pos = payload["ProgramOutcome"]
+    scores = similarity_matrix(co_texts, [po["program_outcome_description"] for po in pos])
+    return suggestions_from_scores(co_codes, [po["program_outcome_code"] for po in pos], scores)
+
+# ====================================================
+# Program Outcome Vector Index
+# ====================================================
+def build_program_outcome_index(program_id):
+    pos = list(
+        ProgramOutcome.objects
+        .filter(program_id=program_id)
+        .order_by("program_outcome_id")
+        .values_list("program_outcome_code", "program_outcome_description")
+    )
+    if not pos:
+        ProgramOutcomeIndex.objects.filter(program_id=program_id).delete()
+        return None
+
+    codes = [code for code, _ in pos]
+    texts = [text for _, text in pos]
+    encoder = TfidfEncoder.fit(texts)
+    matrix = encoder.encode(texts)
+
+    ProgramOutcomeIndex.objects.update_or_create(
+        program_id=program_id,
+        defaults={
+            "program_outcome_codes": codes,
+            "vocabulary": encoder.vocabulary,
+            "idf": encoder.idf.astype(np.float32).tobytes(),
+            "oov_idf": encoder.oov_idf,
+            "vectors": matrix.astype(np.float32).tobytes(),
+        },
+    )
+    return codes, encoder, matrix
+
+def get_program_outcome_index(program_id):
+    index = ProgramOutcomeIndex.objects.filter(program_id=program_id).first()
+    if index is None:
+        return build_program_outcome_index(program_id)
+
+    codes = index.program_outcome_codes
+    encoder = TfidfEncoder(
+        index.vocabulary,
+        np.frombuffer(bytes(index.idf), dtype=np.float32),
+        index.oov_idf,
+    )
+    matrix = np.frombuffer(bytes(index.vectors), dtype=np.float32).reshape(len(codes), len(encoder.vocabulary))
+    return codes, encoder, matrix
+
+def invalidate_program_outcome_index(program_id):
+    ProgramOutcomeIndex.objects.filter(program_id=program_id).delete()
+
+# ====================================================
+# Engine Selection
+# ====================================================
+def build_nlp_payload(course_outcomes, program_outcomes):
+    return {
+        "CourseOutcome": [
+            {
+                "course_outcome_code": co.course_outcome_code,
+                "course_outcome_description": co.course_outcome_description,
+            }
+            for co in course_outcomes
+        ],
+        "ProgramOutcome": [
+            {
+                "program_outcome_code": po.program_outcome_code,
+                "program_outcome_description": po.program_outcome_description,
+            }
+            for po in program_outcomes
+        ],
+    }
+
+def run_outcome_mapping(payload, loaded_course_id=None, program_id=None):
+    engine = settings.NLP_OUTCOME_MAPPING_ENGINE
+    if engine == "local":
+        return local_outcome_mapping(payload, program_id)
+    if engine == "remote":
+        return remote_outcome_mapping(payload, loaded_course_id)
+    raise ValueError(f"Unknown NLP outcome mapping engine: {engine}")
+
+# ====================================================
+# Result Cache
+# ====================================================
+def _normalize(text):
+    return " ".join((text or "").lower().split())
+
+def outcomes_hash(payload):
+    normalized = {
+        "engine": settings.NLP_OUTCOME_MAPPING_ENGINE,
+        "CourseOutcome": [
+            [_normalize(co["course_outcome_code"]), _normalize(co["course_outcome_description"])]
+            for co in payload["CourseOutcome"]
+        ],
+        "ProgramOutcome": [
+            [_normalize(po["program_outcome_code"]), _normalize(po["program_outcome_description"])]
+            for po in payload["ProgramOutcome"]
+        ],
+    }
+    encoded = json.dumps(normalized, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.NLP_MAX_WORKERS,
+                thread_name_prefix="nlp-outcome-mapping",
+            )
+        return _executor
+
+def _retry_later(attempt, error, job, *args):
+    # Failed calls are handed back to the executor after a delay rather than
+    # sleeping in a worker thread; once the breaker opens the job fails fast.
+    if attempt >= MAX_HF_TRIES or isinstance(error, CircuitOpenError) or get_circuit_breaker().is_open():
+        return False
+    timer = threading.Timer(RETRY_DELAY_SECONDS, lambda: _get_executor().submit(job, *args, attempt=attempt + 1))
+    timer.daemon = True
+    timer.start()
+    return True
+
+def _run_job(entry_id, digest, payload, loaded_course_id, program_id, attempt=1):
+    close_old_connections()
+    try:
+        result = run_outcome_mapping(payload, loaded_course_id, program_id=program_id)
+        NlpOutcomeMappingResult.objects.filter(pk=entry_id, outcomes_hash=digest).update(
+            status=NlpOutcomeMappingResult.STATUS_DONE,
+            result=result,
+            error=None,
+            updated_at=timezone.now(),
+        )
+    except Exception as e:
+        if _retry_later(attempt, e, _run_job, entry_id, digest, payload, loaded_course_id, program_id):
+            return
+        NlpOutcomeMappingResult.objects.filter(pk=entry_id, outcomes_hash=digest).update(
+            status=NlpOutcomeMappingResult.STATUS_FAILED,
+            error=str(e) or e.__class__.__name__,
+            updated_at=timezone.now(),
+        )
+    finally:
+        close_old_connections()
+
+def _is_stale(entry):
+    age = timezone.now() - entry.updated_at
+    return age > timedelta(seconds=settings.NLP_JOB_STALE_SECONDS)
+
+def request_outcome_mapping(loaded_course, instructor, payload, refresh=False):
+    digest = outcomes_hash(payload)
+    program_id = loaded_course.course.program_id
+
+    entry = NlpOutcomeMappingResult.objects.filter(
+        loaded_course=loaded_course,
+        instructor=instructor,
+    ).first()
+
+    if entry is not None and entry.outcomes_hash == digest:
+        # A refresh still waits for a job already in flight; clients poll with
+        # the same flag, and resubmitting would restart the job on every poll.
+        if entry.status == NlpOutcomeMappingResult.STATUS_PENDING and not _is_stale(entry):
+            return entry
+        if entry.status == NlpOutcomeMappingResult.STATUS_DONE and not refresh:
+            entry.cache_hit = True
+            return entry
+        if entry.status == NlpOutcomeMappingResult.STATUS_FAILED and not refresh:
+            # Report the failure once; the next request starts a fresh attempt.
+            entry.delete()
+            return entry
+
+    if settings.NLP_OUTCOME_MAPPING_ENGINE == "local":
+        result = run_outcome_mapping(payload, loaded_course.loaded_course_id, program_id=program_id)
+        entry, _ = NlpOutcomeMappingResult.objects.update_or_create(
+            loaded_course=loaded_course,
+            instructor=instructor,
+            defaults={
+                "outcomes_hash": digest,
+                "status": NlpOutcomeMappingResult.STATUS_DONE,
+                "result": result,
+                "error": None,
+            },
+        )
+        return entry
+
+    if get_circuit_breaker().is_open():
+        raise CircuitOpenError()
+
+    entry, _ = NlpOutcomeMappingResult.objects.update_or_create(
+        loaded_course=loaded_course,
+        instructor=instructor,
+        defaults={
+            "outcomes_hash": digest,
+            "status": NlpOutcomeMappingResult.STATUS_PENDING,
+            "result": None,
+            "error": None,
+        },
+    )
+    _get_executor().submit(
+        _run_job,
+        entry.pk,
+        digest,
+        payload,
+        loaded_course.loaded_course_id,
+        program_id,
+    )
+    return entry
+
+# Outcome signals fire once per row, so a cascade (deleting a loaded course,
+# program or the synthetic data) would issue a delete per outcome. They queue
+# their keys here instead and the first on_commit callback clears them all.
+_pending = threading.local()
+
+def _pending_invalidations():
+    if not hasattr(_pending, "course_outcomes"):
+        _pending.course_outcomes = set()
+        _pending.programs = set()
+    return _pending
+
+def _flush_outcome_mapping_invalidations():
+    pending = _pending_invalidations()
+    pairs, programs = pending.course_outcomes, pending.programs
+    pending.course_outcomes, pending.programs = set(), set()
+
+    instructors_by_course = defaultdict(set)
+    for loaded_course_id, instructor_id in pairs:
+        instructors_by_course[loaded_course_id].add(instructor_id)
+
+    condition = Q()
+    for loaded_course_id, instructor_ids in instructors_by_course.items():
+        condition |= Q(loaded_course_id=loaded_course_id, instructor_id__in=instructor_ids)
+    if programs:
+        condition |= Q(loaded_course__course__program_id__in=programs)
+    if condition:
+        NlpOutcomeMappingResult.objects.filter(condition).delete()
+
+def invalidate_course_outcome_mapping(loaded_course_id, instructor_id):
+    _pending_invalidations().course_outcomes.add((loaded_course_id, instructor_id))
+    transaction.on_commit(_flush_outcome_mapping_invalidations)
+
+def invalidate_program_outcome_mapping(program_id):
+    _pending_invalidations().programs.add(program_id)
+    transaction.on_commit(_flush_outcome_mapping_invalidations)
+
+# ====================================================
+# Long Polling
+# ====================================================
+def _long_poll_deadline(timeout):
+    return time.monotonic() + min(timeout, settings.NLP_LONG_POLL_MAX_SECONDS)
+
+async def await_outcome_mapping(entry, timeout):
+    # Waits on the async ORM so an ASGI worker can hold many waiting clients
+    # without parking a thread per request.
+    deadline = _long_poll_deadline(timeout)
+    while entry.status == NlpOutcomeMappingResult.STATUS_PENDING and time.monotonic() < deadline:
+        await asyncio.sleep(settings.NLP_LONG_POLL_INTERVAL_SECONDS)
+        try:
+            entry = await NlpOutcomeMappingResult.objects.aget(pk=entry.pk)
+        except NlpOutcomeMappingResult.DoesNotExist:
+            break
+    return entry
+
+# ====================================================
+# Program Batch
+# ====================================================
+BATCH_KEY_SEPARATOR = "::"
+
+def _batch_key(loaded_course_id, instructor_id, code):
+    return BATCH_KEY_SEPARATOR.join([str(loaded_course_id), str(instructor_id), code])
+
+def _split_batch_result(result):
+    grouped = defaultdict(dict)
+    for key, po_map in (result or {}).items():
+        loaded_course_id, instructor_id, code = key.split(BATCH_KEY_SEPARATOR, 2)
+        grouped[(int(loaded_course_id), int(instructor_id))][code] = po_map
+    return grouped
+
+def _run_batch_job(entries, payload, program_id, attempt=1):
+    close_old_connections()
+    try:
+        grouped = _split_batch_result(run_outcome_mapping(payload, program_id=program_id))
+        for group, (entry_id, digest) in entries.items():
+            NlpOutcomeMappingResult.objects.filter(pk=entry_id, outcomes_hash=digest).update(
+                status=NlpOutcomeMappingResult.STATUS_DONE,
+                result=grouped.get(group, {}),
+                error=None,
+                updated_at=timezone.now(),
+            )
+    except Exception as e:
+        if _retry_later(attempt, e, _run_batch_job, entries, payload, program_id):
+            return
+        for entry_id, digest in entries.values():
+            NlpOutcomeMappingResult.objects.filter(pk=entry_id, outcomes_hash=digest).update(
+                status=NlpOutcomeMappingResult.STATUS_FAILED,
+                error=str(e) or e.__class__.__name__,
+                updated_at=timezone.now(),
+            )
+    finally:
+        close_old_connections()
+
+def program_outcome_mapping_entries(program_id, academic_year_id):
+    return (
+        NlpOutcomeMappingResult.objects
+        .filter(
+            loaded_course__course__program_id=program_id,
+            loaded_course__academic_year_id=academic_year_id,
+        )
+        .select_related("loaded_course__course", "instructor")
+        .order_by("loaded_course__course__course_code", "instructor_id")
+    )
+
+def request_program_outcome_mapping(program_id, academic_year_id, refresh=False):
+    pos = list(ProgramOutcome.objects.filter(program_id=program_id).order_by("program_outcome_id"))
+    if not pos:
+        return []
+
+    groups = defaultdict(list)
+    for co in (
+        CourseOutcome.objects
+        .filter(
+            loaded_course__course__program_id=program_id,
+            loaded_course__academic_year_id=academic_year_id,
+            instructor__isnull=False,
+        )
+        .order_by("loaded_course_id", "instructor_id", "course_outcome_id")
+    ):
+        groups[(co.loaded_course_id, co.instructor_id)].append(co)
+
+    existing = {
+        (entry.loaded_course_id, entry.instructor_id): entry
+        for entry in NlpOutcomeMappingResult.objects.filter(
+            loaded_course__course__program_id=program_id,
+            loaded_course__academic_year_id=academic_year_id,
+        )
+    }
+
+    digests = {}
+    for group, cos in groups.items():
+        digest = outcomes_hash(build_nlp_payload(cos, pos))
+        entry = existing.get(group)
+        if entry is not None and entry.outcomes_hash == digest:
+            if entry.status == NlpOutcomeMappingResult.STATUS_PENDING and not _is_stale(entry):
+                continue
+            if entry.status == NlpOutcomeMappingResult.STATUS_DONE and not refresh:
+                continue
+        digests[group] = digest
+
+    if not digests:
+        return list(program_outcome_mapping_entries(program_id, academic_year_id))
+
+    payload = build_nlp_payload([], pos)
+    payload["CourseOutcome"] = [
+        {
+            "course_outcome_code": _batch_key(co.loaded_course_id, co.instructor_id, co.course_outcome_code),
+            "course_outcome_description": co.course_outcome_description,
+        }
+        for group in digests
+        for co in groups[group]
+    ]
+
+    is_local = settings.NLP_OUTCOME_MAPPING_ENGINE == "local"
+    if is_local:
+        grouped = _split_batch_result(run_outcome_mapping(payload, program_id=program_id))
+    elif get_circuit_breaker().is_open():
+        raise CircuitOpenError()
+
+    NlpOutcomeMappingResult.objects.bulk_create(
+        [
+            NlpOutcomeMappingResult(
+                loaded_course_id=loaded_course_id,
+                instructor_id=instructor_id,
+                outcomes_hash=digest,
+                status=NlpOutcomeMappingResult.STATUS_DONE if is_local else NlpOutcomeMappingResult.STATUS_PENDING,
+                result=grouped.get((loaded_course_id, instructor_id), {}) if is_local else None,
+                error=None,
+                updated_at=timezone.now(),
+            )
+            for (loaded_course_id, instructor_id), digest in digests.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["loaded_course", "instructor"],
+        update_fields=["outcomes_hash", "status", "result", "error", "updated_at"],
+    )
+
+    entries = list(program_outcome_mapping_entries(program_id, academic_year_id))
+
+    if not is_local:
+        pending = {
+            (entry.loaded_course_id, entry.instructor_id): (entry.pk, entry.outcomes_hash)
+            for entry in entries
+            if (entry.loaded_course_id, entry.instructor_id) in digests
+        }
+        _get_executor().submit(_run_batch_job, pending, payload, program_id)
+
+    return entries
+
+async def await_program_outcome_mapping(program_id, academic_year_id, entries, timeout):
+    deadline = _long_poll_deadline(timeout)
+    while any(e.status == NlpOutcomeMappingResult.STATUS_PENDING for e in entries) and time.monotonic() < deadline:
+        await asyncio.sleep(settings.NLP_LONG_POLL_INTERVAL_SECONDS)
+        entries = [e async for e in program_outcome_mapping_entries(program_id, academic_year_id)]
+    return entries
@@ -0,0 +1,149 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat, Greatest
+from ucap_backend.models import Course, Section, Student, User
+from ucap_backend.services.loaded_courses import SCOPE_LOOKUPS, user_scope
+
+# ====================================================
+# Search
+# ====================================================
+SEARCH_TYPES = ["courses", "sections", "instructors", "students"]
+MIN_QUERY_LENGTH = 2
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+# SCOPE_LOOKUPS are written from LoadedCourse; these prefixes re-root them on each searched model.
+SCOPE_PREFIXES = {
+    Section: "loaded_course__",
+    Student: "section__loaded_course__",
+}
+
+INSTRUCTOR_SCOPE_LOOKUPS = {
+    "department": "departments__department_id",
+    "college": "departments__college_id",
+    "campus": "departments__campus_id",
+}
+
+def _scope_filter(model, scope, scope_id, user):
+    if scope is None:
+        own_sections = {
+            Course: "loadedcourse__section__instructor_assigned",
+            Section: "instructor_assigned",
+            Student: "section__instructor_assigned",
+        }
+        return Q(**{own_sections[model]: user})
+
+    lookup = SCOPE_LOOKUPS[scope]
+    if lookup is None:
+        return Q()
+    if model is Course:
+        return Q(**{lookup.removeprefix("course__"): scope_id})
+    return Q(**{SCOPE_PREFIXES[model] + lookup: scope_id})
+
+def search_courses(term, scope, scope_id, user, limit):
+    query = SearchQuery(term, config="english", search_type="websearch")
+    return list(
+        Course.objects
+        .filter(_scope_filter(Course, scope, scope_id, user))
+        .annotate(document=SearchVector("course_title", config="english"))
+        .filter(
+            Q(document=query)
+            | Q(course_code__icontains=term)
+            | Q(course_title__icontains=term)
+            | Q(course_title__trigram_word_similar=term)
+        )
+        .annotate(
+            similarity=Greatest(TrigramSimilarity("course_code", term), TrigramSimilarity("course_title", term)),
+            rank=SearchRank(F("document"), query),
+        )
+        .distinct()
+        .order_by("-rank", "-similarity", "course_code")
+        .values("course_code", "course_title", "program_id", "program__program_name")[:limit]
+    )
+
+def search_sections(term, scope, scope_id, user, limit):
+    return list(
+        Section.objects
+        .filter(_scope_filter(Section, scope, scope_id, user))
+        .filter(
+            Q(year_and_section__icontains=term)
+            | Q(loaded_course__course__course_code__icontains=term)
+        )
+        .annotate(similarity=TrigramSimilarity("year_and_section", term))
+        .order_by("-similarity", "loaded_course__course__course_code", "year_and_section")
+        .values(
+            "section_id",
+            "year_and_section",
+            "loaded_course_id",
+            "loaded_course__course__course_code",
+            "loaded_course__course__course_title",
+            "instructor_assigned_id",
+        )[:limit]
+    )
+
+def search_instructors(term, scope, scope_id, user, limit):
+    if scope is None:
+        return []
+
+    users = User.objects.filter(is_active=True)
+    if scope in INSTRUCTOR_SCOPE_LOOKUPS:
+        users = users.filter(**{INSTRUCTOR_SCOPE_LOOKUPS[scope]: scope_id})
+
+    return list(
+        users
+        .filter(
+            Q(first_name__icontains=term)
+            | Q(last_name__icontains=term)
+            | Q(last_name__trigram_similar=term)
+            | Q(first_name__trigram_similar=term)
+        )
+        .annotate(
+            similarity=Greatest(
+                TrigramSimilarity(Concat("first_name", Value(" "), "last_name"), term),
+                TrigramSimilarity("last_name", term),
+            )
+        )
+        .distinct()
+        .order_by("-similarity", "last_name", "first_name")
+        .values("user_id", "first_name", "last_name", "email")[:limit]
+    )
+
+def search_students(term, scope, scope_id, user, limit):
+    condition = Q(student_name__icontains=term) | Q(student_name__trigram_similar=term)
+    if term.isdigit():
+        condition = Q(id_number=int(term)) | condition
+
+    return list(
+        Student.objects
+        .filter(_scope_filter(Student, scope, scope_id, user))
+        .filter(condition)
+        .annotate(similarity=TrigramSimilarity("student_name", term))
+        .order_by("-similarity", "student_name")
+        .values(
+            "student_id",
+            "id_number",
+            "student_name",
+            "section_id",
+            "section__year_and_section",
+            "section__loaded_course_id",
+            "section__loaded_course__course__course_code",
+        )[:limit]
+    )
+
+SEARCHES = {
+    "courses": search_courses,
+    "sections": search_sections,
+    "instructors": search_instructors,
+    "students": search_students,
+}
+
+def search(user, term, types=None, limit=DEFAULT_LIMIT):
+    term = (term or "").strip()
+    if len(term) < MIN_QUERY_LENGTH:
+        raise ValueError(f"Search term must be at least {MIN_QUERY_LENGTH} characters.")
+
+    types = [t for t in (types or SEARCH_TYPES) if t in SEARCHES]
+    limit = max(1, min(limit, MAX_LIMIT))
+    scope, scope_id = user_scope(user)
+
+    return {search_type: SEARCHES[search_type](term, scope, scope_id, user, limit) for search_type in types}
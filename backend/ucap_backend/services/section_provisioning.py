@@ -0,0 +1,121 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from ucap_backend.models import Section
+from ucap_backend.services.class_record_data_population import create_class_records_service
+from ucap_backend.services.dashboard_cache import invalidate_loaded_course_dashboards
+
+logger = logging.getLogger(__name__)
+
+# ====================================================
+# Section Provisioning
+# ====================================================
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.CLASS_RECORD_MAX_WORKERS,
+                thread_name_prefix="class-record-provisioning",
+            )
+        return _executor
+
+def provision_sections(section_ids):
+    # Rows are claimed under a lock so a section scheduled twice (or picked up
+    # by the recovery command meanwhile) is only built once.
+    try:
+        with transaction.atomic():
+            sections = list(
+                Section.objects
+                .select_for_update(skip_locked=True, of=("self",))
+                .select_related("loaded_course__course__credit")
+                .filter(pk__in=section_ids)
+                .exclude(provisioning_status=Section.PROVISIONING_READY)
+            )
+            create_class_records_service(sections)
+            Section.objects.filter(pk__in=[s.pk for s in sections]).update(
+                provisioning_status=Section.PROVISIONING_READY,
+                provisioning_error=None,
+            )
+    except Exception as e:
+        logger.exception("Class record provisioning failed for sections %s", section_ids)
+        Section.objects.filter(pk__in=section_ids).exclude(provisioning_status=Section.PROVISIONING_READY).update(
+            provisioning_status=Section.PROVISIONING_FAILED,
+            provisioning_error=str(e) or e.__class__.__name__,
+            provisioning_requested_at=timezone.now(),
+        )
+        return 0
+
+    for loaded_course_id in {s.loaded_course_id for s in sections}:
+        invalidate_loaded_course_dashboards(loaded_course_id)
+    return len(sections)
+
+def _run_provisioning(section_ids):
+    close_old_connections()
+    try:
+        provision_sections(section_ids)
+    finally:
+        close_old_connections()
+
+def schedule_provisioning(section_ids):
+    section_ids = list(section_ids)
+    if not section_ids:
+        return
+
+    if settings.CLASS_RECORD_PROVISIONING == "sync":
+        transaction.on_commit(lambda: provision_sections(section_ids))
+    else:
+        transaction.on_commit(lambda: _get_executor().submit(_run_provisioning, section_ids))
+
+def retry_provisioning(section):
+    # Sections are only re-queued once overdue: a pending job can be lost when
+    # the worker process restarts (deploys, gunicorn max_requests), and a
+    # failed one is retried at most once per interval instead of on every poll.
+    overdue = timezone.now() - timedelta(seconds=settings.CLASS_RECORD_STALE_SECONDS)
+    updated = Section.objects.filter(
+        pk=section.pk,
+        provisioning_status__in=[Section.PROVISIONING_PENDING, Section.PROVISIONING_FAILED],
+        provisioning_requested_at__lt=overdue,
+    ).update(
+        provisioning_status=Section.PROVISIONING_PENDING,
+        provisioning_error=None,
+        provisioning_requested_at=timezone.now(),
+    )
+    if updated:
+        section.provisioning_status = Section.PROVISIONING_PENDING
+        section.provisioning_error = None
+        schedule_provisioning([section.pk])
+
+def provisioning_progress(section_ids):
+    counts = Section.objects.filter(pk__in=list(section_ids)).aggregate(
+        total=Count("pk"),
+        provisioned=Count("pk", filter=Q(provisioning_status=Section.PROVISIONING_READY)),
+        failed=Count("pk", filter=Q(provisioning_status=Section.PROVISIONING_FAILED)),
+    )
+    counts["pending"] = counts["total"] - counts["provisioned"] - counts["failed"]
+    return counts
+
+def bulk_create_sections(loaded_course, entries):
+    # bulk_create skips post_save, so the new sections are scheduled here as
+    # one batch instead of one provisioning job per section.
+    with transaction.atomic():
+        sections = Section.objects.bulk_create([
+            Section(
+                loaded_course=loaded_course,
+                year_and_section=entry["year_and_section"],
+                instructor_assigned=entry.get("instructor_assigned"),
+            )
+            for entry in entries
+        ])
+        schedule_provisioning([section.pk for section in sections])
+        invalidate_loaded_course_dashboards(loaded_course.pk)
+
+    return sections
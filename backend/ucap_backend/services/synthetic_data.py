@@ -0,0 +1,390 @@
+import random
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from ucap_backend.models import AcademicYear, Assessment, BloomsClassification, Campus, College, Course, CourseComponent, CourseOutcome, CourseTerm, CourseUnit, Credit, Department, LoadedCourse, OutcomeMapping, Program, ProgramOutcome, RawScore, Section, Semester, Student, User, UserRole, YearLevel
+from ucap_backend.services.class_record_data_population import STUDENTS_PER_SECTION, create_class_records_service
+from ucap_backend.services.dashboard_cache import invalidate_all_dashboards
+from ucap_backend.services.loaded_course_catalog import refresh_catalog
+from ucap_backend.services.user_context import invalidate_all_user_contexts
+
+# ====================================================
+# Synthetic University Data
+# ====================================================
+SYNTHETIC_PREFIX = "Synthetic"
+COURSE_CODE_PREFIX = "SYN"
+USER_ID_BASE = 900000
+EMAIL_DOMAIN = "synthetic.example.edu"
+BATCH_SIZE = 2000
+SECTION_CHUNK = 50
+
+DEFAULT_COUNTS = {
+    "campuses": 2,
+    "colleges_per_campus": 3,
+    "departments_per_college": 2,
+    "programs_per_department": 1,
+    "courses_per_program": 20,
+    "academic_years": 2,
+    "sections_per_course": 2,
+    "instructors_per_department": 10,
+    "course_outcomes": 4,
+    "program_outcomes": 8,
+}
+
+FIRST_NAMES = [
+    "Maria", "Jose", "Juan", "Ana", "Mark", "Angelica", "John", "Kristine", "Michael", "Jasmine",
+    "Christian", "Nicole", "Carlo", "Patricia", "Miguel", "Camille", "Rafael", "Bea", "Paolo", "Andrea",
+    "Joshua", "Erika", "Gabriel", "Denise", "Adrian", "Samantha", "Vincent", "Louise", "Kenneth", "Rhea",
+]
+LAST_NAMES = [
+    "Santos", "Reyes", "Cruz", "Bautista", "Ocampo", "Garcia", "Mendoza", "Torres", "Tomas", "Andrada",
+    "Castillo", "Flores", "Villanueva", "Ramos", "Castro", "Rivera", "Aquino", "Navarro", "Salazar", "Mercado",
+    "Dela Cruz", "Gonzales", "Lopez", "Pascual", "Fernandez", "Domingo", "Soriano", "Valdez", "Manalo", "Lim",
+]
+FIELDS = [
+    "Civil Engineering", "Mechanical Engineering", "Electrical Engineering", "Computer Engineering",
+    "Information Technology", "Computer Science", "Data Science", "Architecture", "Mathematics",
+    "Applied Physics", "Chemistry", "Environmental Science", "Technology Communication Management",
+    "Food Technology", "Marine Biology", "Statistics",
+]
+TOPICS = [
+    "Circuit Analysis", "Thermodynamics", "Data Structures", "Structural Design", "Signal Processing",
+    "Fluid Mechanics", "Database Systems", "Numerical Methods", "Control Systems", "Software Engineering",
+    "Operating Systems", "Engineering Economics", "Materials Science", "Computer Networks", "Probability",
+    "Linear Algebra", "Surveying", "Machine Design", "Technical Writing", "Research Methods",
+    "Embedded Systems", "Hydraulics", "Web Development", "Statics of Rigid Bodies", "Dynamics",
+]
+LEVELS = ["1", "2", "3", "Fundamentals", "Laboratory", "Advanced Topics", "Design Project"]
+OUTCOME_VERBS = [
+    "Identify", "Explain", "Apply", "Analyze", "Evaluate", "Design", "Formulate", "Interpret", "Compute", "Communicate",
+]
+OUTCOME_OBJECTS = [
+    "the governing principles of {topic}",
+    "solutions to problems in {topic}",
+    "experiments and measurements related to {topic}",
+    "systems and components involving {topic}",
+    "results of {topic} investigations in written reports",
+    "the ethical and safety considerations of {topic}",
+    "tools and standards used in {topic}",
+]
+PROGRAM_OUTCOME_TEXTS = [
+    "Apply knowledge of mathematics, science and engineering to solve complex problems.",
+    "Design and conduct experiments, and analyze and interpret data.",
+    "Design a system, component or process to meet desired needs within realistic constraints.",
+    "Function effectively on multidisciplinary and multicultural teams.",
+    "Identify, formulate and solve complex engineering problems.",
+    "Understand professional and ethical responsibility.",
+    "Communicate effectively in oral and written form.",
+    "Understand the impact of solutions in a global, economic, environmental and societal context.",
+    "Engage in life-long learning and keep abreast of contemporary issues.",
+    "Use the techniques, skills and modern tools necessary for professional practice.",
+    "Apply knowledge of management principles to manage projects in multidisciplinary environments.",
+    "Preserve and promote Filipino historical and cultural heritage.",
+]
+MAPPING_LEVELS = ["I", "D", "E"]
+HIGHEST_SCORES = [10, 15, 20, 25, 30, 50, 100]
+YEAR_LEVELS = ["1st Year", "2nd Year", "3rd Year", "4th Year"]
+SEMESTERS = ["1st Semester", "2nd Semester"]
+
+def _person(rng):
+    return rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+def _email(first_name, last_name, user_id):
+    local = f"{first_name}.{last_name}".lower().replace(" ", "")
+    return f"{local}.{user_id}@{EMAIL_DOMAIN}"
+
+class _Generator:
+    def __init__(self, seed, counts, fill_rate, password):
+        self.rng = random.Random(seed)
+        self.counts = counts
+        self.fill_rate = fill_rate
+        self.password = make_password(password)
+        self.next_user_id = USER_ID_BASE
+        self.next_student_number = 0
+        self.created = {}
+
+    def _count(self, name, rows):
+        self._add(name, len(rows))
+        return rows
+
+    def _add(self, name, count):
+        self.created[name] = self.created.get(name, 0) + count
+
+    def _bulk(self, model, rows, name):
+        return self._count(name, model.objects.bulk_create(rows, batch_size=BATCH_SIZE))
+
+    def hierarchy(self):
+        c = self.counts
+        self.campuses = self._bulk(Campus, [
+            Campus(campus_name=f"{SYNTHETIC_PREFIX} Campus {i + 1:02d}")
+            for i in range(c["campuses"])
+        ], "campuses")
+
+        self.colleges = self._bulk(College, [
+            College(campus=campus, college_name=f"{SYNTHETIC_PREFIX} College of {self.rng.choice(FIELDS)} {i + 1:02d}")
+            for campus in self.campuses
+            for i in range(c["colleges_per_campus"])
+        ], "colleges")
+
+        self.departments = self._bulk(Department, [
+            Department(
+                college=college,
+                campus_id=college.campus_id,
+                department_name=f"{SYNTHETIC_PREFIX} Department of {self.rng.choice(FIELDS)} {n + 1:02d}-{i + 1:02d}",
+            )
+            for n, college in enumerate(self.colleges)
+            for i in range(c["departments_per_college"])
+        ], "departments")
+
+        self.programs = self._bulk(Program, [
+            Program(department=department, program_name=f"{SYNTHETIC_PREFIX} BS in {self.rng.choice(FIELDS)} {n + 1:02d}-{i + 1:02d}")
+            for n, department in enumerate(self.departments)
+            for i in range(c["programs_per_department"])
+        ], "programs")
+
+    def _user(self, role, **fields):
+        user_id = self.next_user_id
+        self.next_user_id += 1
+        first_name, last_name = _person(self.rng)
+        return User(
+            user_id=user_id,
+            password=self.password,
+            user_role=role,
+            first_name=first_name,
+            last_name=last_name,
+            email=_email(first_name, last_name, user_id),
+            **fields,
+        )
+
+    def users(self):
+        roles = {role.user_role_type: role for role in UserRole.objects.all()}
+        users = []
+        memberships = []
+        self.instructors = {}
+
+        for campus in self.campuses:
+            users.append(self._user(roles["Vice Chancellor for Academic Affairs"], vcaa_campus=campus))
+        for college in self.colleges:
+            users.append(self._user(roles["Dean"], dean_college=college))
+        for department in self.departments:
+            chair = self._user(roles["Department Chair"], chair_department=department)
+            faculty = [
+                self._user(roles["Instructor"])
+                for _ in range(self.counts["instructors_per_department"])
+            ]
+            users.append(chair)
+            users.extend(faculty)
+            self.instructors[department.pk] = [chair] + faculty
+            memberships.extend(
+                User.departments.through(user_id=user.user_id, department_id=department.pk)
+                for user in [chair] + faculty
+            )
+
+        taken = User.objects.filter(user_id__gte=USER_ID_BASE, user_id__lt=self.next_user_id).exists()
+        if taken:
+            raise ValueError(f"Synthetic user IDs from {USER_ID_BASE} are already in use; run with --reset first.")
+
+        self._bulk(User, users, "users")
+        self._count("department_memberships", User.departments.through.objects.bulk_create(memberships, batch_size=BATCH_SIZE))
+
+    def courses(self):
+        year_levels = {yl.year_level_type: yl for yl in YearLevel.objects.filter(year_level_type__in=YEAR_LEVELS)}
+        semesters = {sem.semester_type: sem for sem in Semester.objects.filter(semester_type__in=SEMESTERS)}
+        credits = list(Credit.objects.order_by("credit_id"))
+        if len(year_levels) < len(YEAR_LEVELS) or len(semesters) < len(SEMESTERS) or not credits:
+            raise ValueError("Reference data is missing; run migrations so populate_default_data seeds it.")
+
+        courses = []
+        self.course_topics = {}
+        for p, program in enumerate(self.programs):
+            for n in range(self.counts["courses_per_program"]):
+                topic = self.rng.choice(TOPICS)
+                code = f"{COURSE_CODE_PREFIX}{p + 1:04d}{n + 1:03d}"
+                self.course_topics[code] = topic
+                courses.append(Course(
+                    course_code=code,
+                    program=program,
+                    year_level=year_levels[YEAR_LEVELS[n * len(YEAR_LEVELS) // max(self.counts["courses_per_program"], 1)]],
+                    semester=semesters[SEMESTERS[n % len(SEMESTERS)]],
+                    credit=self.rng.choice(credits),
+                    course_title=f"{topic} {self.rng.choice(LEVELS)}",
+                ))
+        self.course_rows = self._bulk(Course, courses, "courses")
+
+        self._bulk(ProgramOutcome, [
+            ProgramOutcome(
+                program=program,
+                program_outcome_code=f"PO{i + 1}",
+                program_outcome_description=PROGRAM_OUTCOME_TEXTS[i % len(PROGRAM_OUTCOME_TEXTS)],
+            )
+            for program in self.programs
+            for i in range(self.counts["program_outcomes"])
+        ], "program_outcomes")
+
+    def loaded_courses(self):
+        latest = max(AcademicYear.objects.values_list("academic_year_start", flat=True), default=2025)
+        self.academic_years = [
+            AcademicYear.objects.get_or_create(academic_year_start=start, academic_year_end=start + 1)[0]
+            for start in range(latest - self.counts["academic_years"] + 1, latest + 1)
+        ]
+        self.loaded = self._bulk(LoadedCourse, [
+            LoadedCourse(course=course, academic_year=academic_year)
+            for academic_year in self.academic_years
+            for course in self.course_rows
+        ], "loaded_courses")
+        refresh_catalog(LoadedCourse.objects.filter(course__program__department__campus__in=self.campuses))
+
+    def sections(self):
+        department_of = {program.pk: program.department_id for program in self.programs}
+        course_by_code = {course.course_code: course for course in self.course_rows}
+        letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+        rows = []
+        instructors_of = {}
+        for loaded_course in self.loaded:
+            course = course_by_code[loaded_course.course_id]
+            faculty = self.instructors[department_of[course.program_id]]
+            year = course.year_level.year_level_type[0]
+            for i in range(self.counts["sections_per_course"]):
+                instructor = self.rng.choice(faculty)
+                instructors_of.setdefault(loaded_course.pk, {})[instructor.user_id] = None
+                rows.append(Section(
+                    loaded_course=loaded_course,
+                    instructor_assigned=instructor,
+                    year_and_section=f"{year}{letters[i % len(letters)]}",
+                    provisioning_status=Section.PROVISIONING_READY,
+                ))
+        self.section_rows = self._bulk(Section, rows, "sections")
+
+        pos_by_program = {}
+        for po in ProgramOutcome.objects.filter(program__in=self.programs).order_by("program_outcome_id"):
+            pos_by_program.setdefault(po.program_id, []).append(po)
+
+        outcomes = []
+        for loaded_course in self.loaded:
+            topic = self.course_topics[loaded_course.course_id]
+            for instructor_id in instructors_of.get(loaded_course.pk, {}):
+                for i in range(self.counts["course_outcomes"]):
+                    outcomes.append(CourseOutcome(
+                        loaded_course=loaded_course,
+                        instructor_id=instructor_id,
+                        course_outcome_code=f"CO{i + 1}",
+                        course_outcome_description=(
+                            f"{self.rng.choice(OUTCOME_VERBS)} {self.rng.choice(OUTCOME_OBJECTS).format(topic=topic.lower())}."
+                        ),
+                    ))
+        outcomes = self._bulk(CourseOutcome, outcomes, "course_outcomes")
+
+        self.outcomes = {}
+        for co in outcomes:
+            self.outcomes.setdefault((co.loaded_course_id, co.instructor_id), []).append(co)
+
+        program_of = {loaded_course.pk: course_by_code[loaded_course.course_id].program_id for loaded_course in self.loaded}
+        self._bulk(OutcomeMapping, [
+            OutcomeMapping(
+                course_outcome=co,
+                program_outcome=po,
+                outcome_mapping=self.rng.choice(MAPPING_LEVELS) if self.rng.random() < 0.35 else "",
+            )
+            for co in outcomes
+            for po in pos_by_program.get(program_of[co.loaded_course_id], [])
+        ], "outcome_mappings")
+
+    def _student_fields(self, section, index):
+        first_name, last_name = _person(self.rng)
+        self.next_student_number += 1
+        return {
+            "id_number": 2000000000 + self.next_student_number,
+            "student_name": f"{last_name}, {first_name}",
+            "remarks": None,
+        }
+
+    def _assessment_fields(self, section_id, title):
+        return {"assessment_highest_score": self.rng.choice(HIGHEST_SCORES)}
+
+    def _raw_score(self, student, assessment):
+        if self.rng.random() >= self.fill_rate:
+            return None
+        highest = assessment.assessment_highest_score
+        return max(0, min(highest, round(self.rng.gauss(0.78, 0.15) * highest)))
+
+    def class_records(self, progress=None):
+        blooms = list(BloomsClassification.objects.order_by("blooms_classification_id"))
+        co_through = Assessment.course_outcome.through
+        blooms_through = Assessment.blooms_classification.through
+
+        for start in range(0, len(self.section_rows), SECTION_CHUNK):
+            chunk = self.section_rows[start:start + SECTION_CHUNK]
+            with transaction.atomic():
+                create_class_records_service(
+                    chunk,
+                    student_fields=self._student_fields,
+                    assessment_fields=self._assessment_fields,
+                    raw_score=self._raw_score,
+                )
+
+                section_of = {section.pk: section for section in chunk}
+                assessments = list(
+                    Assessment.objects
+                    .filter(course_component__course_unit__course_term__section__in=chunk)
+                    .order_by("assessment_id")
+                    .values_list("assessment_id", "course_component__course_unit__course_term__section_id")
+                )
+                co_links, blooms_links = [], []
+                for assessment_id, section_id in assessments:
+                    section = section_of[section_id]
+                    cos = self.outcomes.get((section.loaded_course_id, section.instructor_assigned_id), [])
+                    if cos:
+                        co_links.append(co_through(assessment_id=assessment_id, courseoutcome_id=self.rng.choice(cos).pk))
+                    if blooms:
+                        blooms_links.append(blooms_through(
+                            assessment_id=assessment_id,
+                            bloomsclassification_id=self.rng.choice(blooms).pk,
+                        ))
+                co_through.objects.bulk_create(co_links, batch_size=BATCH_SIZE)
+                blooms_through.objects.bulk_create(blooms_links, batch_size=BATCH_SIZE)
+
+            self._add("students", len(chunk) * STUDENTS_PER_SECTION)
+            self._add("assessments", len(assessments))
+            self._add("raw_scores", len(assessments) * STUDENTS_PER_SECTION)
+            if progress:
+                progress(min(start + SECTION_CHUNK, len(self.section_rows)), len(self.section_rows))
+
+def generate_synthetic_data(seed=0, fill_rate=0.85, password="synthetic", progress=None, **counts):
+    counts = {**DEFAULT_COUNTS, **{key: value for key, value in counts.items() if value is not None}}
+    generator = _Generator(seed, counts, fill_rate, password)
+
+    with transaction.atomic():
+        generator.hierarchy()
+        generator.users()
+        generator.courses()
+        generator.loaded_courses()
+        generator.sections()
+
+    generator.class_records(progress)
+
+    invalidate_all_dashboards()
+    invalidate_all_user_contexts()
+    return generator.created
+
+def delete_synthetic_data():
+    # Bottom-up so each step is a plain filtered DELETE rather than one huge
+    # cascade collected in memory.
+    campuses = Campus.objects.filter(campus_name__startswith=f"{SYNTHETIC_PREFIX} Campus")
+    sections = Section.objects.filter(loaded_course__course__course_code__startswith=COURSE_CODE_PREFIX)
+    with transaction.atomic():
+        RawScore.objects.filter(student__section__in=sections).delete()
+        Assessment.objects.filter(course_component__course_unit__course_term__section__in=sections).delete()
+        CourseComponent.objects.filter(course_unit__course_term__section__in=sections).delete()
+        CourseUnit.objects.filter(course_term__section__in=sections).delete()
+        CourseTerm.objects.filter(section__in=sections).delete()
+        Student.objects.filter(section__in=sections).delete()
+        sections.delete()
+        CourseOutcome.objects.filter(loaded_course__course__course_code__startswith=COURSE_CODE_PREFIX).delete()
+        LoadedCourse.objects.filter(course__course_code__startswith=COURSE_CODE_PREFIX).delete()
+        Course.objects.filter(course_code__startswith=COURSE_CODE_PREFIX).delete()
+        User.objects.filter(user_id__gte=USER_ID_BASE, email__endswith=f"@{EMAIL_DOMAIN}").delete()
+        deleted, _ = campuses.delete()
+
+    invalidate_all_dashboards()
+    invalidate_all_user_contexts()
+    return deleted
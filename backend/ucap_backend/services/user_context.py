@@ -0,0 +1,121 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from ucap_backend.models import Department, User
+
+# ====================================================
+# Per-User Context
+# ====================================================
+CACHE_PREFIX = "user_context"
+VERSION_KEY = f"{CACHE_PREFIX}:version"
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+def _key(user_id):
+    return f"{CACHE_PREFIX}:{_version()}:{user_id}"
+
+def _department(d):
+    return {"department_id": d.department_id, "department_name": d.department_name}
+
+def _college(c):
+    return {"college_id": c.college_id, "college_name": c.college_name} if c else None
+
+def _campus(cp):
+    return {"campus_id": cp.campus_id, "campus_name": cp.campus_name} if cp else None
+
+def _leadership(user):
+    if user.chair_department:
+        return {"level": "department", "id": user.chair_department.department_id, "name": user.chair_department.department_name}
+    if user.dean_college:
+        return {"level": "college", "id": user.dean_college.college_id, "name": user.dean_college.college_name}
+    if user.vcaa_campus:
+        return {"level": "campus", "id": user.vcaa_campus.campus_id, "name": user.vcaa_campus.campus_name}
+    return None
+
+def role_scope(user):
+    return user.user_role.scope if user.user_role else None
+
+def university_access(user):
+    role_type = user.user_role.user_role_type if user.user_role else None
+    return (
+        role_scope(user) == "university"
+        or "vice president for academic affairs" in (role_type or "").lower()
+        or user.is_superuser
+        or user.is_staff
+    )
+
+def build_user_context(user_id):
+    user = (
+        User.objects
+        .select_related(
+            "user_role",
+            "chair_department__college",
+            "chair_department__campus",
+            "dean_college__campus",
+            "vcaa_campus",
+        )
+        .prefetch_related(
+            Prefetch(
+                "departments",
+                queryset=Department.objects.select_related("college", "campus").order_by("department_id"),
+            )
+        )
+        .get(pk=user_id)
+    )
+
+    role = user.user_role
+    role_type = role.user_role_type if role else None
+    departments = list(user.departments.all())
+
+    primary_department = user.chair_department or (departments[0] if departments else None)
+    primary_college = user.dean_college or (primary_department.college if primary_department else None)
+    if user.vcaa_campus:
+        primary_campus = user.vcaa_campus
+    elif user.dean_college:
+        primary_campus = user.dean_college.campus
+    else:
+        primary_campus = primary_department.campus if primary_department else None
+
+    return {
+        "user_id": user.user_id,
+        "first_name": user.first_name,
+        "middle_name": user.middle_name,
+        "last_name": user.last_name,
+        "suffix": user.suffix,
+        "email": user.email,
+        "user_role_id": role.user_role_id if role else None,
+        "user_role_type": role_type,
+        "user_role_scope": role_scope(user),
+        "university_access": university_access(user),
+        "chair_department_id": user.chair_department_id,
+        "dean_college_id": user.dean_college_id,
+        "vcaa_campus_id": user.vcaa_campus_id,
+        "department_ids": [d.department_id for d in departments],
+        "departments": [_department(d) for d in departments],
+        "leadership": _leadership(user),
+        "primary_department": _department(primary_department) if primary_department else None,
+        "primary_college": _college(primary_college),
+        "primary_campus": _campus(primary_campus),
+    }
+
+def get_user_context(user):
+    key = _key(user.pk)
+    context = cache.get(key)
+    if context is None:
+        context = build_user_context(user.pk)
+        cache.set(key, context, settings.USER_CONTEXT_CACHE_SECONDS)
+    return context
+
+def invalidate_user_context(*user_ids):
+    cache.delete_many([_key(user_id) for user_id in user_ids])
+
+def invalidate_all_user_contexts():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, 2, None)
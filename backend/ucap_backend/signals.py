@@ -1,8 +1,12 @@
-from django.db.models.signals import post_save, post_migrate
+from django.db.models.signals import m2m_changed, post_delete, post_save, post_migrate
 from django.dispatch import receiver
-from ucap_backend.models import Section
-from ucap_backend.services.class_record_data_population import create_class_record_service
+from ucap_backend.models import AcademicYear, Campus, College, Course, CourseOutcome, Department, LoadedCourse, Program, ProgramOutcome, Section, Semester, User, UserRole, YearLevel
+from ucap_backend.services.dashboard_cache import invalidate_all_dashboards, invalidate_course_dashboards, invalidate_loaded_course_dashboards
 from ucap_backend.services.data_population import populate_default_data
+from ucap_backend.services.loaded_course_catalog import refresh_catalog
+from ucap_backend.services.nlp_outcome_mapping import invalidate_course_outcome_mapping, invalidate_program_outcome_index, invalidate_program_outcome_mapping
+from ucap_backend.services.section_provisioning import schedule_provisioning
+from ucap_backend.services.user_context import invalidate_all_user_contexts, invalidate_user_context
 
 @receiver(post_migrate)
 def seed_defaults(sender, **kwargs):
@@ -14,6 +18,83 @@ def seed_defaults(sender, **kwargs):
         print("Seeding skipped:", e)
 
 @receiver(post_save, sender=Section)
-def initialize_class_record(sender, instance, created, **kwargs):
-    if created:
-        create_class_record_service(instance)
\ No newline at end of file
+def initialize_class_record(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and instance.provisioning_status == Section.PROVISIONING_PENDING:
+        schedule_provisioning([instance.pk])
+
+@receiver([post_save, post_delete], sender=CourseOutcome)
+def invalidate_nlp_for_course_outcome(sender, instance, **kwargs):
+    if instance.instructor_id is not None:
+        invalidate_course_outcome_mapping(instance.loaded_course_id, instance.instructor_id)
+
+@receiver([post_save, post_delete], sender=ProgramOutcome)
+def invalidate_nlp_for_program_outcome(sender, instance, **kwargs):
+    invalidate_program_outcome_index(instance.program_id)
+    invalidate_program_outcome_mapping(instance.program_id)
+
+CATALOG_SOURCES = {
+    LoadedCourse: "loaded_course_id",
+    Course: "course_id",
+    Program: "course__program_id",
+    Department: "course__program__department_id",
+    College: "course__program__department__college_id",
+    Campus: "course__program__department__campus_id",
+    AcademicYear: "academic_year_id",
+    Semester: "course__semester_id",
+    YearLevel: "course__year_level_id",
+}
+
+@receiver(post_save, sender=LoadedCourse)
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Program)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=College)
+@receiver(post_save, sender=Campus)
+@receiver(post_save, sender=AcademicYear)
+@receiver(post_save, sender=Semester)
+@receiver(post_save, sender=YearLevel)
+def refresh_loaded_course_catalog(sender, instance, created, raw=False, **kwargs):
+    if raw or (created and sender is not LoadedCourse):
+        return
+    refresh_catalog(LoadedCourse.objects.filter(**{CATALOG_SOURCES[sender]: instance.pk}))
+
+@receiver([post_save, post_delete], sender=LoadedCourse)
+def invalidate_dashboards_for_loaded_course(sender, instance, **kwargs):
+    invalidate_course_dashboards(instance.course_id)
+
+@receiver([post_save, post_delete], sender=Section)
+def invalidate_dashboards_for_section(sender, instance, **kwargs):
+    invalidate_loaded_course_dashboards(instance.loaded_course_id)
+
+@receiver([post_save, post_delete], sender=Course)
+@receiver([post_save, post_delete], sender=Program)
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=College)
+@receiver([post_save, post_delete], sender=Campus)
+@receiver([post_save, post_delete], sender=AcademicYear)
+@receiver([post_save, post_delete], sender=Semester)
+@receiver([post_save, post_delete], sender=YearLevel)
+def invalidate_dashboards_for_hierarchy(sender, instance, **kwargs):
+    invalidate_all_dashboards()
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_context_for_user(sender, instance, **kwargs):
+    invalidate_user_context(instance.pk)
+
+@receiver(m2m_changed, sender=User.departments.through)
+def invalidate_context_for_user_departments(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user_context(instance.pk)
+    elif pk_set:
+        invalidate_user_context(*pk_set)
+    else:
+        invalidate_all_user_contexts()
+
+@receiver([post_save, post_delete], sender=UserRole)
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=College)
+@receiver([post_save, post_delete], sender=Campus)
+def invalidate_context_for_hierarchy(sender, instance, **kwargs):
+    invalidate_all_user_contexts()
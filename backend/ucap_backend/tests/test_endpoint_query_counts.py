@@ -0,0 +1,421 @@
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, reset_queries, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import URLResolver, get_resolver, resolve
+from rest_framework.test import APIClient
+from ucap_backend.benchmarks.endpoints import build_dataset
+from ucap_backend.models import Assessment, CourseOutcome, OutcomeMapping, ProgramOutcome, Student, User
+from ucap_backend.services.synthetic_data import USER_ID_BASE
+from ucap_backend.services.user_context import get_user_context
+
+# ====================================================
+# Endpoint Query Counts
+# ====================================================
+# Both sizes have the same shape; "large" has more of every row a page lists
+# (campuses, departments, courses, academic years, sections, outcomes), so a
+# count that differs between the two is a query per row. Sections always hold
+# STUDENTS_PER_SECTION students, so per-section pages grow through the course
+# credit instead: a lecture-only section against a lecture and lab one.
+SIZES = {
+    "small": {
+        "seed": 0,
+        "campuses": 1,
+        "colleges_per_campus": 1,
+        "departments_per_college": 1,
+        "programs_per_department": 1,
+        "courses_per_program": 2,
+        "academic_years": 1,
+        "sections_per_course": 1,
+        "instructors_per_department": 2,
+        "course_outcomes": 2,
+        "program_outcomes": 3,
+        "section_filter": {"loaded_course__course__credit__laboratory_unit": 0},
+    },
+    "large": {
+        "seed": 0,
+        "campuses": 2,
+        "colleges_per_campus": 1,
+        "departments_per_college": 2,
+        "programs_per_department": 1,
+        "courses_per_program": 3,
+        "academic_years": 2,
+        "sections_per_course": 2,
+        "instructors_per_department": 3,
+        "course_outcomes": 4,
+        "program_outcomes": 6,
+        "section_filter": {
+            "loaded_course__course__credit__lecture_unit__gt": 0,
+            "loaded_course__course__credit__laboratory_unit__gt": 0,
+        },
+    },
+}
+
+# Exact queries per request on PostgreSQL, as (small, large). Other backends
+# differ (SQLite splits bulk inserts into batches, search needs pg_trgm), so
+# re-record these on PostgreSQL.
+QUERY_COUNTS = {
+    "csrf": (0, 0),
+    "login": (9, 9),
+    "logout": (4, 4),
+    "me": (4, 4),
+    "heartbeat": (2, 2),
+    "change_password": (12, 12),
+    "user_initial_info": (4, 4),
+    "user_management": (4, 4),
+    "user_import": (12, 12),
+    "user_detail": (4, 4),
+    "admin_root": (2, 2),
+    "college_list": (3, 3),
+    "college_detail": (3, 3),
+    "department_list": (3, 3),
+    "department_detail": (3, 3),
+    "program_list": (3, 3),
+    "program_detail": (3, 3),
+    "instructor_loaded_courses": (3, 3),
+    "instructor_sections": (6, 6),
+    "course_outcomes": (3, 3),
+    "course_outcome_detail": (6, 6),
+    "outcome_mapping": (30, 84),
+    "outcome_mapping_update": (6, 6),
+    "instructor_root": (2, 2),
+    "student_list": (1083, 1803),
+    "student_import": (11, 11),
+    "student_detail": (30, 48),
+    "assessment_list": (13, 13),
+    "assessment_infos": (5, 5),
+    "assessment_detail": (5, 5),
+    "course_component_list": (165, 3531),
+    "course_component_detail": (14, 14),
+    "course_unit_list": (171, 3675),
+    "course_unit_detail": (34, 34),
+    "class_record": (15, 15),
+    "raw_score_update": (6, 6),
+    "assessment_page": (90, 144),
+    "department_course_list": (9, 12),
+    "course_management": (11, 15),
+    "course_detail": (7, 7),
+    "department_course_management": (3, 3),
+    "department_course_delete": (29, 29),
+    "section_management": (4, 4),
+    "section_bulk_create": (22, 22),
+    "section_detail": (7, 7),
+    "program_outcomes": (3, 3),
+    "program_outcome_detail": (6, 6),
+    "program_nlp_outcome_mapping": (4, 4),
+    "department_summary": (6, 6),
+    "dean_loaded_courses": (3, 3),
+    "dean_course_page": (4, 4),
+    "dean_summary": (6, 6),
+    "vcaa_loaded_courses": (3, 3),
+    "vcaa_course_page": (4, 4),
+    "vcaa_summary": (6, 6),
+    "vpaa_loaded_courses": (5, 5),
+    "vpaa_course_page": (6, 6),
+    "vpaa_summary": (8, 8),
+    "user_roles": (3, 3),
+    "campuses": (3, 3),
+    "year_levels": (3, 3),
+    "semesters": (3, 3),
+    "credit_units": (3, 3),
+    "academic_years": (3, 3),
+    "instructors": (11, 26),
+    "blooms_classifications": (3, 3),
+    "course_outcome_dropdown": (3, 3),
+    "search": (7, 7),
+}
+
+# Endpoints whose count grows with the number of rows, and what they loop over.
+# Anything that grows and is not listed here fails test_growth_is_flagged.
+GROWS_WITH_ROWS = {
+    "outcome_mapping": "get_or_create per course outcome and program outcome pair",
+    "student_list": "a raw score query per student and an assessment query per raw score",
+    "student_detail": "an assessment query per raw score",
+    "course_component_list": "every component, with assessment and bloom/outcome queries per row",
+    "course_unit_list": "every unit, with component, assessment and bloom/outcome queries per row",
+    "assessment_page": "assessment, component and unit lookups per outcome-tagged assessment",
+    "department_course_list": "year level, semester and credit queries per course",
+    "course_management": "program, year level, semester and credit queries per course",
+    "instructors": "a department query per instructor",
+}
+
+# Routes without a case.
+UNCOVERED_ROUTES = {
+    "instructor/course_syllabus_data_extraction/<int:loaded_course_id>/": "parses an uploaded PDF syllabus",
+    "instructor/nlp_outcome_mapping/<int:loaded_course_id>/": "calls the remote NLP service",
+}
+
+def _routes(patterns, prefix=""):
+    # Joined the way resolve() reports ResolverMatch.route (regex anchors dropped).
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern).removeprefix("^")
+        if isinstance(pattern, URLResolver):
+            yield from _routes(pattern.url_patterns, route)
+            continue
+        # Format-suffix variants of router URLs map to the same views.
+        if "<format>" in route or "<drf_format_suffix:format>" in route:
+            continue
+        yield route
+
+def _faculty_csv(department):
+    lines = ["user_id,last_name,email,user_role,departments"]
+    for i in range(2):
+        user_id = USER_ID_BASE - 10 - i
+        lines.append(f"{user_id},Imported {i},imported{i}@test.local,Instructor,{department.pk}")
+    return "\n".join(lines).encode("utf-8")
+
+def _roster_csv(section):
+    lines = ["Student No,Full Name"]
+    for student in Student.objects.filter(section=section).order_by("student_id"):
+        lines.append(f"{student.id_number},{student.student_name}")
+    return "\n".join(lines).encode("utf-8")
+
+def endpoint_cases(data):
+    section = data["section"]
+    loaded_course = data["loaded_course"]
+    department = data["department"]
+    instructor = data["instructor"]
+    chair = data["chair"]
+    admin = data["admin"]
+    faculty = _faculty_csv(department)
+    roster = _roster_csv(section)
+
+    return {
+        # Login Authentication
+        "csrf": (None, "get", "/csrf/", {}),
+        "login": (None, "post", "/login/", {"data": {"user_id": instructor.pk, "password": "synthetic"}}),
+        "logout": (instructor, "post", "/logout/", {}),
+        "me": (instructor, "get", "/me/", {}),
+        "heartbeat": (instructor, "get", "/heartbeat/", {}),
+        "change_password": (
+            instructor, "post", "/change-password/",
+            {"data": {"old_password": "synthetic", "new_password": "Query-Count-42"}},
+        ),
+        "user_initial_info": (instructor, "get", "/user/initial-info/", {}),
+        # Admin
+        "user_management": (admin, "get", "/admin/user_management/", {}),
+        "user_import": (
+            admin, "post", "/admin/user_management/import/",
+            {"data": lambda: {"file": SimpleUploadedFile("faculty.csv", faculty, content_type="text/csv")}, "format": "multipart"},
+        ),
+        "user_detail": (admin, "get", f"/admin/user_management/{instructor.pk}", {}),
+        "admin_root": (admin, "get", "/admin/", {}),
+        "college_list": (admin, "get", "/admin/college/", {}),
+        "college_detail": (admin, "get", f"/admin/college/{data['college'].pk}/", {}),
+        "department_list": (admin, "get", "/admin/department/", {}),
+        "department_detail": (admin, "get", f"/admin/department/{department.pk}/", {}),
+        "program_list": (admin, "get", "/admin/program/", {}),
+        "program_detail": (admin, "get", f"/admin/program/{data['program'].pk}/", {}),
+        # Instructor
+        "instructor_loaded_courses": (instructor, "get", f"/instructor/{instructor.pk}/", {}),
+        "instructor_sections": (instructor, "get", f"/instructor/{instructor.pk}/{loaded_course.pk}", {}),
+        "course_outcomes": (instructor, "get", f"/instructor/course_outcomes_management/{loaded_course.pk}/", {}),
+        "course_outcome_detail": (
+            instructor, "put", f"/instructor/course_outcomes_management/detail/{data['course_outcome'].pk}/",
+            {"data": {"course_outcome_description": "Apply query budgets."}, "format": "json"},
+        ),
+        "outcome_mapping": (instructor, "get", f"/instructor/outcome_mapping_management/{loaded_course.pk}/", {}),
+        "outcome_mapping_update": (
+            instructor, "put", f"/instructor/outcome_mapping_management/update/{data['outcome_mapping'].pk}/",
+            {"data": {"outcome_mapping": "D"}, "format": "json"},
+        ),
+        "instructor_root": (instructor, "get", "/instructor/", {}),
+        "student_list": (instructor, "get", f"/instructor/students/?section={section.pk}", {}),
+        "student_import": (
+            instructor, "post", f"/instructor/students/import/?section={section.pk}&mode=override",
+            {"data": lambda: {"file": SimpleUploadedFile("roster.csv", roster, content_type="text/csv")}, "format": "multipart"},
+        ),
+        "student_detail": (instructor, "get", f"/instructor/students/{data['student'].pk}/", {}),
+        "assessment_list": (
+            instructor, "get", f"/instructor/assessments/?component={data['assessment'].course_component_id}", {},
+        ),
+        "assessment_infos": (
+            instructor, "post", "/instructor/assessments/infos/",
+            {"data": {"ids": data["assessment_ids"]}, "format": "json"},
+        ),
+        "assessment_detail": (instructor, "get", f"/instructor/assessments/{data['assessment'].pk}/", {}),
+        "course_component_list": (instructor, "get", "/instructor/course_components/", {}),
+        "course_component_detail": (
+            instructor, "get", f"/instructor/course_components/{data['assessment'].course_component_id}/", {},
+        ),
+        "course_unit_list": (instructor, "get", "/instructor/course_units/", {}),
+        "course_unit_detail": (
+            instructor, "get", f"/instructor/course_units/{data['assessment'].course_component.course_unit_id}/", {},
+        ),
+        "class_record": (instructor, "get", f"/instructor/class_record/{section.pk}/", {}),
+        "raw_score_update": (
+            instructor, "patch", f"/instructor/rawscores/{data['student'].pk}/{data['assessment'].pk}/",
+            {"data": {"value": 7}, "format": "json"},
+        ),
+        "assessment_page": (instructor, "get", f"/assessments/{section.pk}/", {}),
+        # Department Chair
+        "department_course_list": (chair, "get", f"/department_chair/department_course_list/{department.pk}/", {}),
+        "course_management": (chair, "get", f"/department_chair/course_management/{department.pk}/", {}),
+        "course_detail": (
+            chair, "get", f"/department_chair/course_management/{department.pk}/{loaded_course.course_id}", {},
+        ),
+        "department_course_management": (
+            chair, "get", f"/department_chair/department_course_management/{department.pk}/", {},
+        ),
+        "department_course_delete": (
+            chair, "delete", f"/department_chair/department_course_management/delete/{loaded_course.pk}/", {},
+        ),
+        "section_management": (
+            chair, "get", f"/department_chair/section_management/loaded_course/{loaded_course.pk}/", {},
+        ),
+        "section_bulk_create": (
+            chair, "post", f"/department_chair/section_management/loaded_course/{loaded_course.pk}/bulk/",
+            {
+                "data": {"sections": [
+                    {"year_and_section": "9Y", "instructor_assigned": instructor.pk},
+                    {"year_and_section": "9Z", "instructor_assigned": instructor.pk},
+                ]},
+                "format": "json",
+            },
+        ),
+        "section_detail": (
+            chair, "patch", f"/department_chair/section_management/section/{section.pk}/",
+            {"data": {"year_and_section": "9X", "loaded_course": loaded_course.pk}, "format": "json"},
+        ),
+        "program_outcomes": (chair, "get", f"/department_chair/program_outcomes_management/{data['program'].pk}/", {}),
+        "program_outcome_detail": (
+            chair, "put", f"/department_chair/program_outcomes_management/detail/{data['program_outcome'].pk}/",
+            {"data": {"program_outcome_description": "Keep query counts flat."}, "format": "json"},
+        ),
+        "program_nlp_outcome_mapping": (
+            chair, "get",
+            f"/department_chair/nlp_outcome_mapping/{data['program'].pk}/?academic_year_id={loaded_course.academic_year_id}",
+            {},
+        ),
+        "department_summary": (chair, "get", f"/department_chair/summary/{department.pk}/", {}),
+        # Dean
+        "dean_loaded_courses": (data["dean"], "get", f"/dean/{data['college'].pk}/", {}),
+        "dean_course_page": (data["dean"], "get", f"/dean/loaded_course/{loaded_course.pk}/", {}),
+        "dean_summary": (data["dean"], "get", f"/dean/{data['college'].pk}/summary/", {}),
+        # VCAA
+        "vcaa_loaded_courses": (data["vcaa"], "get", f"/campus/{data['campus'].pk}/", {}),
+        "vcaa_course_page": (data["vcaa"], "get", f"/campus/loaded_course/{loaded_course.pk}/", {}),
+        "vcaa_summary": (data["vcaa"], "get", f"/campus/{data['campus'].pk}/summary/", {}),
+        # VPAA
+        "vpaa_loaded_courses": (data["vpaa"], "get", "/university/", {}),
+        "vpaa_course_page": (data["vpaa"], "get", f"/university/loaded_course/{loaded_course.pk}/", {}),
+        "vpaa_summary": (data["vpaa"], "get", "/university/summary/", {}),
+        # Dropdowns
+        "user_roles": (instructor, "get", "/user_role/", {}),
+        "campuses": (instructor, "get", "/campus/", {}),
+        "year_levels": (instructor, "get", "/year_level/", {}),
+        "semesters": (instructor, "get", "/semester/", {}),
+        "credit_units": (instructor, "get", "/credit_unit/", {}),
+        "academic_years": (instructor, "get", "/academic_year/", {}),
+        "instructors": (chair, "get", "/instructors/", {}),
+        "blooms_classifications": (instructor, "get", "/blooms_classification/", {}),
+        "course_outcome_dropdown": (instructor, "get", f"/course_outcomes/{loaded_course.pk}", {}),
+        "search": (instructor, "get", "/search/?q=synthetic", {}),
+    }
+
+class EndpointQueryCountMixin:
+    size = None
+
+    @classmethod
+    def setUpTestData(cls):
+        dataset = dict(SIZES[cls.size])
+        data = build_dataset(dataset, section_filter=dataset.pop("section_filter"))
+        section = data["section"]
+        instructor = data["instructor"]
+
+        data["program"] = section.loaded_course.course.program
+        data["assessment"] = Assessment.objects.select_related("course_component").get(pk=data["assessment"].pk)
+        data["assessment_ids"] = list(
+            Assessment.objects
+            .filter(course_component__course_unit__course_term__section=section)
+            .order_by("assessment_id")
+            .values_list("assessment_id", flat=True)
+        )
+        data["course_outcome"] = (
+            CourseOutcome.objects
+            .filter(loaded_course=section.loaded_course, instructor=instructor)
+            .order_by("course_outcome_id")
+            .first()
+        )
+        data["outcome_mapping"] = OutcomeMapping.objects.filter(course_outcome=data["course_outcome"]).order_by("pk").first()
+        data["program_outcome"] = ProgramOutcome.objects.filter(program=data["program"]).order_by("program_outcome_id").first()
+        data["admin"] = User.objects.create_superuser(
+            user_id=USER_ID_BASE - 2,
+            last_name="Admin",
+            email="admin.query-counts@test.local",
+        )
+
+        cls.data = data
+
+    def setUp(self):
+        self.cases = endpoint_cases(self.data)
+
+    def client_for(self, user):
+        client = APIClient()
+        if user is not None:
+            # A real session, so the counts include what the session and user
+            # lookups cost on every request (and async views see the user).
+            # The first request stamps the session refresh; count later ones.
+            client.force_login(user)
+            client.get("/heartbeat/")
+        return client
+
+    def request(self, client, method, url, kwargs):
+        kwargs = {key: value() if callable(value) else value for key, value in kwargs.items()}
+        return getattr(client, method)(url, **kwargs)
+
+    def test_every_route_has_a_case(self):
+        covered = {resolve(url.split("?")[0]).route for _, _, url, _ in self.cases.values()}
+        missing = set(_routes(get_resolver().url_patterns)) - covered - set(UNCOVERED_ROUTES)
+        self.assertEqual(missing, set(), "Add a case (and its query counts) for every new route.")
+
+    def test_query_counts(self):
+        if connection.vendor != "postgresql":
+            self.skipTest("Query counts are recorded on PostgreSQL.")
+        index = list(SIZES).index(self.size)
+        for name, (user, method, url, kwargs) in self.cases.items():
+            with self.subTest(endpoint=name):
+                self.assertIn(name, QUERY_COUNTS, f"No query count recorded for {name}.")
+
+                # Each case runs in its own savepoint so writes do not leak into
+                # the next one; dashboards are cached, so count the uncached path.
+                with transaction.atomic():
+                    cache.clear()
+                    if user is not None:
+                        get_user_context(user)
+                    client = self.client_for(user)
+                    # The capped query log would stop counting after the
+                    # heavier endpoints; start every case from an empty one.
+                    reset_queries()
+                    # Work deferred to commit (cache invalidation, provisioning)
+                    # is part of the request's cost, so run it inside the count.
+                    with self.assertNumQueries(QUERY_COUNTS[name][index]):
+                        with self.captureOnCommitCallbacks(execute=True):
+                            response = self.request(client, method, url, kwargs)
+                    transaction.set_rollback(True)
+
+                self.assertLess(response.status_code, 300, response.content)
+
+# Provisioning runs in the request's commit rather than on a worker thread, so
+# section_bulk_create counts the class records it builds.
+@override_settings(CLASS_RECORD_PROVISIONING="sync")
+class SmallDatasetQueryCountTests(EndpointQueryCountMixin, TestCase):
+    size = "small"
+
+@override_settings(CLASS_RECORD_PROVISIONING="sync")
+class LargeDatasetQueryCountTests(EndpointQueryCountMixin, TestCase):
+    size = "large"
+
+class QueryCountGrowthTests(SimpleTestCase):
+    def test_growth_is_flagged(self):
+        for name, counts in QUERY_COUNTS.items():
+            with self.subTest(endpoint=name):
+                grows = len(set(counts)) > 1
+                if grows:
+                    self.assertIn(
+                        name, GROWS_WITH_ROWS,
+                        f"{name} runs {counts[0]} queries on the small dataset and {counts[-1]} on the large one; "
+                        "fix the per-row query or flag it in GROWS_WITH_ROWS.",
+                    )
+                else:
+                    self.assertNotIn(name, GROWS_WITH_ROWS, f"{name} no longer grows with rows; drop it from GROWS_WITH_ROWS.")
@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from ucap_backend.models import AcademicYear, Course, LoadedCourse, Program, Section, User, UserRole
+from ucap_backend.services.user_context import get_user_context
+
+# ====================================================
+# Scoped Loaded Course Query Counts
+# ====================================================
+class ScopedLoadedCourseQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        program = Program.objects.select_related("department__college").get(program_name="BS in Electronics Engineering")
+        department = program.department
+        college = department.college
+        academic_year = AcademicYear.objects.first()
+        roles = {role.user_role_type: role for role in UserRole.objects.all()}
+
+        instructors = [
+            User.objects.create_user(user_id=1000 + i, email=f"instructor{i}@test.local", last_name=f"Instructor {i}", user_role=roles["Instructor"])
+            for i in range(3)
+        ]
+
+        cls.loaded_courses = []
+        for course in Course.objects.filter(program=program).order_by("course_code")[:8]:
+            loaded_course = LoadedCourse.objects.create(course=course, academic_year=academic_year)
+            cls.loaded_courses.append(loaded_course)
+            for i, instructor in enumerate(instructors):
+                Section.objects.create(loaded_course=loaded_course, instructor_assigned=instructor, year_and_section=f"{i + 1}A")
+
+        cls.chair = User.objects.create_user(user_id=2001, email="chair@test.local", last_name="Chair", user_role=roles["Department Chair"], chair_department=department)
+        cls.dean = User.objects.create_user(user_id=2002, email="dean@test.local", last_name="Dean", user_role=roles["Dean"], dean_college=college)
+        cls.vcaa = User.objects.create_user(user_id=2003, email="vcaa@test.local", last_name="Vcaa", user_role=roles["Vice Chancellor for Academic Affairs"], vcaa_campus=college.campus)
+        cls.vpaa = User.objects.create_user(user_id=2004, email="vpaa@test.local", last_name="Vpaa", user_role=roles["Vice President for Academic Affairs"])
+
+        cls.department_id = department.department_id
+        cls.college_id = college.college_id
+        cls.campus_id = college.campus_id
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, user, url, queries):
+        client = APIClient()
+        client.force_authenticate(user)
+        # The cached user context is shared across requests; count the warm path.
+        get_user_context(user)
+        with self.assertNumQueries(queries):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_loaded_course_lists(self):
+        cases = [
+            (self.dean, f"/dean/{self.college_id}/"),
+            (self.vcaa, f"/campus/{self.campus_id}/"),
+            (self.vpaa, "/university/"),
+        ]
+        for user, url in cases:
+            with self.subTest(url=url):
+                data = self.get(user, url, 1)
+                self.assertEqual(len(data["results"]), len(self.loaded_courses))
+
+        data = self.get(self.chair, f"/department_chair/department_course_management/{self.department_id}/", 1)
+        self.assertEqual(len(data), len(self.loaded_courses))
+
+    def test_course_pages(self):
+        loaded_course_id = self.loaded_courses[0].loaded_course_id
+        cases = [
+            (self.chair, f"/department_chair/section_management/loaded_course/{loaded_course_id}/"),
+            (self.dean, f"/dean/loaded_course/{loaded_course_id}/"),
+            (self.vcaa, f"/campus/loaded_course/{loaded_course_id}/"),
+            (self.vpaa, f"/university/loaded_course/{loaded_course_id}/"),
+        ]
+        for user, url in cases:
+            with self.subTest(url=url):
+                data = self.get(user, url, 2)
+                self.assertEqual(len(data["sections"]), 3)
+                self.assertEqual(data["course_details"]["campus_name"], "USTP-CDO")
+
+    def test_out_of_scope_course_page(self):
+        template = self.loaded_courses[0].course
+        course = Course.objects.create(
+            course_code="IT999",
+            course_title="Out of Scope Course",
+            program=Program.objects.get(program_name="BS in Information Technology"),
+            year_level=template.year_level,
+            semester=template.semester,
+            credit=template.credit,
+        )
+        other = LoadedCourse.objects.create(course=course, academic_year=AcademicYear.objects.first())
+        client = APIClient()
+        client.force_authenticate(self.dean)
+        response = client.get(f"/dean/loaded_course/{other.loaded_course_id}/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_revoked_university_access(self):
+        get_user_context(self.vpaa)
+        # Saving the user drops the cached context, so the demotion applies to
+        # the next request rather than when the cached copy expires.
+        self.vpaa.user_role = UserRole.objects.get(user_role_type="Instructor")
+        self.vpaa.save()
+        client = APIClient()
+        client.force_authenticate(self.vpaa)
+        self.assertEqual(client.get("/university/").status_code, 403)
+        self.assertEqual(client.get("/user/initial-info/").json()["user_role_type"], "Instructor")
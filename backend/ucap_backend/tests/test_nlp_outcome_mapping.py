@@ -0,0 +1,61 @@
+from unittest import mock
+from django.test import TestCase, override_settings
+from ucap_backend.models import AcademicYear, Course, LoadedCourse, NlpOutcomeMappingResult, User, UserRole
+from ucap_backend.services import nlp_outcome_mapping
+
+# ====================================================
+# Remote Job Retries
+# ====================================================
+@override_settings(NLP_OUTCOME_MAPPING_ENGINE="remote", NLP_CIRCUIT_FAILURE_THRESHOLD=3)
+@mock.patch.object(nlp_outcome_mapping, "close_old_connections", lambda: None)
+@mock.patch.object(nlp_outcome_mapping.threading, "Timer")
+class RemoteJobRetryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        instructor = User.objects.create_user(
+            user_id=5001,
+            last_name="Instructor",
+            email="instructor@test.local",
+            user_role=UserRole.objects.get(user_role_type="Instructor"),
+        )
+        cls.loaded_course = LoadedCourse.objects.create(
+            course=Course.objects.order_by("course_code").first(),
+            academic_year=AcademicYear.objects.first(),
+        )
+        cls.entry = NlpOutcomeMappingResult.objects.create(
+            loaded_course=cls.loaded_course,
+            instructor=instructor,
+            outcomes_hash="digest",
+            status=NlpOutcomeMappingResult.STATUS_PENDING,
+        )
+
+    def setUp(self):
+        nlp_outcome_mapping._breaker = None
+
+    def run_job(self, attempt=1):
+        nlp_outcome_mapping._run_job(self.entry.pk, "digest", {}, self.loaded_course.pk, None, attempt=attempt)
+        return NlpOutcomeMappingResult.objects.get(pk=self.entry.pk)
+
+    def test_failure_is_resubmitted_after_a_delay(self, timer):
+        with mock.patch.object(nlp_outcome_mapping, "_predict", side_effect=ConnectionError("Space is asleep")), \
+                mock.patch.object(nlp_outcome_mapping.time, "sleep") as sleep:
+            entry = self.run_job()
+        sleep.assert_not_called()
+        timer.assert_called_once()
+        self.assertEqual(timer.call_args.args[0], nlp_outcome_mapping.RETRY_DELAY_SECONDS)
+        timer.return_value.start.assert_called_once()
+        self.assertEqual(entry.status, NlpOutcomeMappingResult.STATUS_PENDING)
+
+    def test_last_attempt_marks_the_job_failed(self, timer):
+        with mock.patch.object(nlp_outcome_mapping, "_predict", side_effect=ConnectionError("Space is asleep")):
+            entry = self.run_job(attempt=nlp_outcome_mapping.MAX_HF_TRIES)
+        timer.assert_not_called()
+        self.assertEqual(entry.status, NlpOutcomeMappingResult.STATUS_FAILED)
+        self.assertEqual(entry.error, "Space is asleep")
+
+    @override_settings(NLP_CIRCUIT_FAILURE_THRESHOLD=1)
+    def test_open_circuit_fails_without_retrying(self, timer):
+        with mock.patch.object(nlp_outcome_mapping, "_predict", side_effect=ConnectionError("Space is asleep")):
+            entry = self.run_job()
+        timer.assert_not_called()
+        self.assertEqual(entry.status, NlpOutcomeMappingResult.STATUS_FAILED)
@@ -0,0 +1,59 @@
+from datetime import timedelta
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from ucap_backend.models import AcademicYear, Course, LoadedCourse, Section, User, UserRole
+
+# ====================================================
+# Class Record Provisioning Retries
+# ====================================================
+@override_settings(CLASS_RECORD_STALE_SECONDS=300)
+class ProvisioningRetryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = User.objects.create_user(
+            user_id=4001,
+            last_name="Instructor",
+            email="instructor@test.local",
+            user_role=UserRole.objects.get(user_role_type="Instructor"),
+        )
+        loaded_course = LoadedCourse.objects.create(
+            course=Course.objects.order_by("course_code").first(),
+            academic_year=AcademicYear.objects.first(),
+        )
+        cls.section = Section.objects.create(loaded_course=loaded_course, instructor_assigned=cls.instructor, year_and_section="1A")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.instructor)
+
+    def fail_section(self, seconds_ago):
+        Section.objects.filter(pk=self.section.pk).update(
+            provisioning_status=Section.PROVISIONING_FAILED,
+            provisioning_error="Course has no outcomes",
+            provisioning_requested_at=timezone.now() - timedelta(seconds=seconds_ago),
+        )
+
+    def get(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.get(f"/instructor/class_record/{self.section.pk}/")
+        self.assertEqual(response.status_code, 202, response.content)
+        return response.json(), callbacks
+
+    def test_recent_failure_is_reported_without_requeueing(self):
+        self.fail_section(seconds_ago=10)
+        for _ in range(3):
+            data, callbacks = self.get()
+            self.assertEqual(data, {"status": Section.PROVISIONING_FAILED, "message": "Course has no outcomes"})
+            self.assertEqual(callbacks, [])
+        self.assertEqual(Section.objects.get(pk=self.section.pk).provisioning_status, Section.PROVISIONING_FAILED)
+
+    def test_overdue_failure_is_requeued_once(self):
+        self.fail_section(seconds_ago=600)
+        data, callbacks = self.get()
+        self.assertEqual(data, {"status": Section.PROVISIONING_PENDING})
+        self.assertEqual(len(callbacks), 1)
+
+        data, callbacks = self.get()
+        self.assertEqual(data, {"status": Section.PROVISIONING_PENDING})
+        self.assertEqual(callbacks, [])
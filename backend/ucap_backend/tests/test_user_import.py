@@ -0,0 +1,47 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from rest_framework.test import APIClient
+from ucap_backend.models import Department, User, UserRole
+
+# ====================================================
+# Faculty CSV Import
+# ====================================================
+class UserImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.order_by("department_id").first()
+        cls.admin = User.objects.create_superuser(user_id=3001, last_name="Admin", email="admin@test.local")
+        cls.instructor = User.objects.create_user(
+            user_id=3002,
+            last_name="Instructor",
+            email="Taken@Test.local",
+            user_role=UserRole.objects.get(user_role_type="Instructor"),
+        )
+
+    def post(self, user, rows):
+        lines = ["user_id,last_name,email,user_role,departments", *rows]
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.post(
+            "/admin/user_management/import/",
+            {"file": SimpleUploadedFile("faculty.csv", "\n".join(lines).encode("utf-8"), content_type="text/csv")},
+            format="multipart",
+        )
+
+    def test_non_admin_cannot_import(self):
+        response = self.post(self.instructor, [f"3003,Escalated,escalated@test.local,Vice President for Academic Affairs,{self.department.pk}"])
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(User.objects.filter(pk=3003).exists())
+
+    def test_existing_email_is_matched_case_insensitively(self):
+        response = self.post(self.admin, [f"3004,Duplicate,taken@test.local,Instructor,{self.department.pk}"])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [(error["field"], error["message"]) for error in response.json()["errors"]],
+            [("email", "Email already exists.")],
+        )
+
+    def test_admin_imports_faculty(self):
+        response = self.post(self.admin, [f"3005,Imported,imported@test.local,Instructor,{self.department.pk}"])
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(User.objects.get(pk=3005).check_password("3005"))
@@ -1,13 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from ucap_backend.views.admin import user_detail_view, user_management_view
-from ucap_backend.views.base import CollegeViewSet, DepartmentViewSet, ProgramViewSet, academic_year_list_view, blooms_classification_list_view, campus_list_view, course_outcome_list_view, credit_unit_list_view, instructor_list_view, semester_list_view, user_role_list_view, year_level_list_view
-from ucap_backend.views.dean import dean_course_page_view, dean_loaded_courses_view
-from ucap_backend.views.department_chair import dc_course_detail_view, dc_course_management_view, department_course_detail_view, department_course_list_view, department_course_management_view, department_section_detail_view, department_section_management_view, program_outcome_detail_view, program_outcome_list_create_view
+from ucap_backend.views.admin import user_detail_view, user_import_view, user_management_view
+from ucap_backend.views.base import CollegeViewSet, DepartmentViewSet, ProgramViewSet, academic_year_list_view, blooms_classification_list_view, campus_list_view, course_outcome_list_view, credit_unit_list_view, instructor_list_view, search_view, semester_list_view, user_role_list_view, year_level_list_view
+from ucap_backend.views.dean import dean_course_page_view, dean_loaded_courses_view, dean_summary_view
+from ucap_backend.views.department_chair import dc_course_detail_view, dc_course_management_view, department_course_detail_view, department_course_list_view, department_course_management_view, department_section_bulk_create_view, department_section_detail_view, department_section_management_view, department_summary_view, program_nlp_outcome_mapping_view, program_outcome_detail_view, program_outcome_list_create_view
 from ucap_backend.views.instructor import AssessmentPageAPIView, AssessmentViewSet, ClassRecordViewSet, CourseComponentViewSet, CourseUnitViewSet, RawScoreUpdateView, StudentViewSet, SyllabusExtractView, course_outcome_detail_view, course_outcome_list_create_view, instructor_assigned_sections_view, instructor_loaded_courses_view, nlp_outcome_mapping_view, outcome_mapping_view, update_outcome_mapping
 from ucap_backend.views.user import change_password_view, csrf_token_view, heartbeat_view, login_view, logout_view, me_view, user_initial_info_view
-from ucap_backend.views.vcaa import vcaa_course_page_view, vcaa_loaded_courses_view
-from ucap_backend.views.vpaa import vpaa_course_page_view, vpaa_loaded_courses_view
+from ucap_backend.views.vcaa import vcaa_course_page_view, vcaa_loaded_courses_view, vcaa_summary_view
+from ucap_backend.views.vpaa import vpaa_course_page_view, vpaa_loaded_courses_view, vpaa_summary_view
 
 instructor_router = DefaultRouter()
 instructor_router.register(r"students", StudentViewSet, basename="student")
@@ -39,6 +39,7 @@ urlpatterns = [
     # Admin
     # ====================================================
     path("admin/user_management/", user_management_view),
+    path("admin/user_management/import/", user_import_view),
     path("admin/user_management/<int:user_id>", user_detail_view),
     path("admin/", include(admin_router.urls)),
     # ====================================================
@@ -74,25 +75,33 @@ urlpatterns = [
     path("department_chair/department_course_management/delete/<int:loaded_course_id>/", department_course_detail_view),
 
     path("department_chair/section_management/loaded_course/<int:loaded_course_id>/", department_section_management_view),
+    path("department_chair/section_management/loaded_course/<int:loaded_course_id>/bulk/", department_section_bulk_create_view),
     path("department_chair/section_management/section/<int:section_id>/",department_section_detail_view),
 
     path("department_chair/program_outcomes_management/<int:program_id>/", program_outcome_list_create_view),
     path("department_chair/program_outcomes_management/detail/<int:outcome_id>/", program_outcome_detail_view),
+
+    path("department_chair/nlp_outcome_mapping/<int:program_id>/", program_nlp_outcome_mapping_view),
+
+    path("department_chair/summary/<int:department_id>/", department_summary_view),
     # ====================================================
     # Dean
     # ====================================================
     path("dean/<int:college_id>/", dean_loaded_courses_view),
     path("dean/loaded_course/<int:loaded_course_id>/", dean_course_page_view),
+    path("dean/<int:college_id>/summary/", dean_summary_view),
     # ====================================================
     # VCAA 
     # ====================================================
     path("campus/<int:campus_id>/", vcaa_loaded_courses_view),
     path("campus/loaded_course/<int:loaded_course_id>/", vcaa_course_page_view),
+    path("campus/<int:campus_id>/summary/", vcaa_summary_view),
     # ====================================================
     # VPAA
     # ====================================================
     path("university/", vpaa_loaded_courses_view),
     path("university/loaded_course/<int:loaded_course_id>/", vpaa_course_page_view),
+    path("university/summary/", vpaa_summary_view),
     # ====================================================
     # Dropdown
     # ====================================================
@@ -105,4 +114,8 @@ urlpatterns = [
     path("instructors/", instructor_list_view),
     path("blooms_classification/", blooms_classification_list_view),
     path("course_outcomes/<int:loaded_course_id>", course_outcome_list_view),
+    # ====================================================
+    # Search
+    # ====================================================
+    path("search/", search_view),
 ]
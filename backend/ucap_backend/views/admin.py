@@ -1,10 +1,13 @@
 from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from ucap_backend.models import User
 from ucap_backend.serializers.admin import CreateFacultySerializer, FacultySerializer, UpdateFacultySerializer
+from ucap_backend.services.faculty import FACULTY_RELATED, paginate_faculty
+from ucap_backend.services.faculty_import import import_faculty, read_faculty_csv
 
 # ====================================================
 # User Management
@@ -14,9 +17,9 @@ from ucap_backend.serializers.admin import CreateFacultySerializer, FacultySeria
 def user_management_view(request):
     if request.method == "GET":
         try:
-            faculty_excluded = User.objects.exclude(user_role__user_role_type="Administrator")
-            serializer = FacultySerializer(faculty_excluded, many=True)
-            return JsonResponse(serializer.data, safe=False)
+            return paginate_faculty(request, FacultySerializer)
+        except ValidationError as e:
+            return Response({"message": e.detail}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return JsonResponse({"message": "Validation failed", "errors": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -43,7 +46,7 @@ def user_management_view(request):
 @permission_classes([IsAuthenticated])
 def user_detail_view(request, user_id):
     try:
-        user = User.objects.get(user_id=user_id)
+        user = User.objects.select_related(*FACULTY_RELATED).prefetch_related("departments").get(user_id=user_id)
     except User.DoesNotExist:
         return Response({"message": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -62,4 +65,31 @@ def user_detail_view(request, user_id):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     user.delete()
-    return Response({"message": "User deleted successfully"}, status=status.HTTP_200_OK)
\ No newline at end of file
+    return Response({"message": "User deleted successfully"}, status=status.HTTP_200_OK)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated, IsAdminUser])
+def user_import_view(request):
+    file = request.FILES.get("file")
+    if file is None:
+        return Response({"message": "CSV file is required."}, status=status.HTTP_400_BAD_REQUEST)
+    if not file.name.lower().endswith(".csv"):
+        return Response({"message": "Invalid file format. Only .csv is allowed."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        rows = read_faculty_csv(file)
+        if not rows:
+            return Response({"message": "The CSV file has no faculty rows."}, status=status.HTTP_400_BAD_REQUEST)
+
+        dry_run = request.query_params.get("dry_run") in ("1", "true")
+        result = import_faculty(rows, dry_run=dry_run)
+        if result["errors"]:
+            return Response({"message": "Validation failed", **result}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(result, status=status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED)
+
+    except ValueError as e:
+        return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,12 +1,65 @@
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
 from django.http import JsonResponse
 from rest_framework import status, viewsets
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import MethodNotAllowed, NotAuthenticated, NotFound, PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
+from rest_framework.views import exception_handler
 from ucap_backend.models import AcademicYear, BloomsClassification, Campus, College, CourseOutcome, Credit, Department, Program, Semester, User, UserRole, YearLevel
 from ucap_backend.serializers.instructor import BloomsClassificationSerializer, CourseOutcomeSerializer
+from ucap_backend.services.search import search
 from ucap_backend.serializers.base import AcademicYearSerializer, CampusSerializer, CollegeSerializer, CreditSerializer, DepartmentSerializer, InstructorSerializer, ProgramSerializer, SemesterSerializer, UserRoleSerializer, YearLevelSerializer  
 
+# ====================================================
+# Async Views
+# ====================================================
+def async_exception_response(exc):
+    # DRF's exception handler, which api_view views get for free, with the
+    # {"message": ...} body the views return for their own errors.
+    if isinstance(exc, ObjectDoesNotExist):
+        exc = NotFound(str(exc))
+    response = exception_handler(exc, {})
+    if response is None:
+        return JsonResponse({"message": str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    message = response.data.get("detail", response.data) if isinstance(response.data, dict) else response.data
+    if isinstance(message, list) and len(message) == 1:
+        message = message[0]
+    json_response = JsonResponse({"message": message}, status=response.status_code)
+    for header, value in response.items():
+        json_response[header] = value
+    return json_response
+
+def async_api_view(methods):
+    # api_view only wraps sync functions; this gives async views the same
+    # session authentication and exception handling without a thread per request.
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            try:
+                if request.method not in methods:
+                    raise MethodNotAllowed(request.method)
+
+                user = await request.auser()
+                if not user.is_authenticated:
+                    # Session authentication answers 403, as api_view does.
+                    raise PermissionDenied(NotAuthenticated.default_detail)
+                request.user = user
+                return await view(request, *args, **kwargs)
+            except Exception as e:
+                return async_exception_response(e)
+        return wrapper
+    return decorator
+
+def wait_seconds(request):
+    try:
+        return max(0.0, float(request.GET.get("wait", 0)))
+    except ValueError:
+        return 0.0
+
 # ====================================================
 # Dropdown
 # ====================================================
@@ -145,3 +198,21 @@ def course_outcome_list_view(request, loaded_course_id):
         return JsonResponse(serializer.data, safe=False)
     except Exception as e:
         return JsonResponse({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+# ====================================================
+# Search
+# ====================================================
+@async_api_view(["GET"])
+async def search_view(request):
+    try:
+        types = [t for t in (request.GET.get("types") or "").split(",") if t]
+        try:
+            limit = int(request.GET.get("limit", 10))
+        except ValueError:
+            raise ValidationError("limit must be an integer.")
+
+        results = await sync_to_async(search)(request.user, request.GET.get("q"), types=types, limit=limit)
+        return JsonResponse(results, status=status.HTTP_200_OK)
+
+    except ValueError as e:
+        raise ValidationError(str(e))
@@ -1,12 +1,19 @@
+import json
+from asgiref.sync import sync_to_async
 from django.http import JsonResponse
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
-from ucap_backend.models import Course, LoadedCourse, Program, ProgramOutcome, Section
-from ucap_backend.serializers.department_chair import CourseSerializer, CreateCourseSerializer, CreateDepartmentLoadedCourseSerializer, DepartmentChairCourseDetailsSerializer, DepartmentChairSectionSerializer, DepartmentCourseSerializer, DepartmentLoadedCourseSerializer, SectionCreateUpdateSerializer, UpdateCourseSerializer
+from rest_framework.exceptions import NotFound, ParseError, PermissionDenied, ValidationError
+from ucap_backend.models import Course, LoadedCourse, NlpOutcomeMappingResult, Program, ProgramOutcome, Section
+from ucap_backend.serializers.department_chair import BulkSectionCreateSerializer, CourseSerializer, CreateCourseSerializer, CreateDepartmentLoadedCourseSerializer, DepartmentChairCourseDetailsSerializer, DepartmentChairSectionSerializer, DepartmentCourseSerializer, DepartmentLoadedCourseSerializer, ProgramNlpOutcomeMappingSerializer, SectionCreateUpdateSerializer, UpdateCourseSerializer
 from ucap_backend.serializers.instructor import ProgramOutcomeSerializer
+from ucap_backend.services.dashboard_stats import annotate_loaded_course_stats, scope_summary
+from ucap_backend.services.loaded_courses import assert_scope_access, filter_loaded_courses, loaded_course_page, scoped_catalog, scoped_loaded_course, scoped_loaded_courses
+from ucap_backend.services.section_provisioning import bulk_create_sections, provisioning_progress
+from ucap_backend.services.nlp_outcome_mapping import await_program_outcome_mapping, program_outcome_mapping_entries, request_program_outcome_mapping
+from ucap_backend.views.base import async_api_view, wait_seconds
 
 # ====================================================
 # Department Chair
@@ -19,9 +26,7 @@ def get_user_department_id(user):
     return None
 
 def assert_department_access(request, department_id: int):
-    user_dept_id = get_user_department_id(request.user)
-    if user_dept_id is None or int(user_dept_id) != int(department_id):
-        raise PermissionDenied("You are not assigned to this department.")
+    assert_scope_access(request.user, "department", department_id)
     
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
@@ -43,9 +48,7 @@ def department_course_management_view(request, department_id):
         assert_department_access(request, department_id)
 
         if request.method == "GET":
-            courses = LoadedCourse.objects.filter(
-                course__program__department__department_id=department_id
-            )
+            courses = annotate_loaded_course_stats(scoped_catalog(request.user, "department", department_id)).order_by("loaded_course_id")
             serializer = DepartmentLoadedCourseSerializer(courses, many=True)
             return JsonResponse(serializer.data, safe=False)
 
@@ -78,6 +81,8 @@ def department_course_management_view(request, department_id):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    except PermissionDenied as e:
+        return JsonResponse({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
     except Exception as e:
         return JsonResponse({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -98,56 +103,33 @@ def department_course_detail_view(request, loaded_course_id):
     except LoadedCourse.DoesNotExist:
         return JsonResponse({"message": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def department_summary_view(request, department_id):
+    try:
+        loaded_courses = scoped_loaded_courses(request.user, "department", department_id)
+        summary = scope_summary(filter_loaded_courses(loaded_courses, request.query_params))
+        return JsonResponse(summary, status=status.HTTP_200_OK)
+
+    except ValidationError as e:
+        return JsonResponse({"message": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+    except PermissionDenied as e:
+        return JsonResponse({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
+    except Exception as e:
+        return JsonResponse({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def department_section_management_view(request, loaded_course_id):
     try:
-        dept_id = get_user_department_id(request.user)
-        if dept_id is None:
-            raise PermissionDenied("You are not assigned to this department.")
-
-        loaded_course = (
-            LoadedCourse.objects
-            .select_related(
-                "course__program__department__college__campus",
-                "course__semester",
-                "course__year_level",
-                "academic_year",
-            )
-            .get(
-                pk=loaded_course_id,
-                course__program__department__department_id=dept_id
-            )
-        )
-
-        dummy_section = Section(
-            loaded_course=loaded_course,
-            instructor_assigned=None,
-            year_and_section=""
-        )
-        course_details = DepartmentChairCourseDetailsSerializer(dummy_section).data
+        loaded_course = scoped_loaded_course(request.user, "department", loaded_course_id)
 
         if request.method == "GET":
-            sections = (
-                Section.objects
-                .select_related(
-                    "loaded_course__course__program__department__college__campus",
-                    "loaded_course__course__semester",
-                    "loaded_course__course__year_level",
-                    "loaded_course__academic_year",
-                    "instructor_assigned",
-                )
-                .filter(loaded_course_id=loaded_course_id)
+            return JsonResponse(
+                loaded_course_page(loaded_course, DepartmentChairCourseDetailsSerializer, DepartmentChairSectionSerializer),
+                status=status.HTTP_200_OK
             )
 
-            section_data = DepartmentChairSectionSerializer(sections, many=True).data
-
-            return JsonResponse({
-                "course_details": course_details,
-                "sections": section_data
-            }, status=status.HTTP_200_OK)
-
         serializer = SectionCreateUpdateSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save()
@@ -174,6 +156,40 @@ def department_section_management_view(request, loaded_course_id):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def department_section_bulk_create_view(request, loaded_course_id):
+    try:
+        loaded_course = scoped_loaded_course(request.user, "department", loaded_course_id)
+
+        serializer = BulkSectionCreateSerializer(data=request.data, context={"loaded_course": loaded_course})
+        if not serializer.is_valid():
+            return JsonResponse({"message": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        sections = bulk_create_sections(loaded_course, serializer.validated_data["sections"])
+        section_ids = [section.section_id for section in sections]
+        return JsonResponse(
+            {
+                "message": f"{len(sections)} section(s) created successfully",
+                "section_ids": section_ids,
+                "provisioning": provisioning_progress(section_ids),
+            },
+            status=status.HTTP_201_CREATED
+        )
+
+    except LoadedCourse.DoesNotExist:
+        return JsonResponse(
+            {"message": "Loaded course not found"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    except PermissionDenied as e:
+        return JsonResponse({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
+    except Exception as e:
+        return JsonResponse(
+            {"message": str(e)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
 @api_view(["PUT", "PATCH", "DELETE"])
 @permission_classes([IsAuthenticated])
 def department_section_detail_view(request, section_id):
@@ -271,6 +287,48 @@ def program_outcome_list_create_view(request, program_id):
         traceback.print_exc()
         return Response({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+def _request_program_nlp_outcome_mapping(request, program_id, body):
+    try:
+        program = Program.objects.get(pk=program_id)
+    except Program.DoesNotExist:
+        raise NotFound("Program not found")
+    assert_department_access(request, program.department_id)
+
+    academic_year_id = request.GET.get("academic_year_id") or body.get("academic_year_id")
+    if not academic_year_id:
+        raise ValidationError("academic_year_id is required.")
+    try:
+        academic_year_id = int(academic_year_id)
+    except (TypeError, ValueError):
+        raise ValidationError("academic_year_id must be an integer.")
+
+    if request.method == "GET":
+        return academic_year_id, list(program_outcome_mapping_entries(program_id, academic_year_id))
+
+    refresh = str(body.get("refresh", "")).lower() in ("1", "true", "yes")
+    return academic_year_id, request_program_outcome_mapping(program_id, academic_year_id, refresh=refresh)
+
+@async_api_view(["GET", "POST"])
+async def program_nlp_outcome_mapping_view(request, program_id):
+    # Errors (validation, scope, missing program, open circuit) are rendered by async_api_view.
+    try:
+        body = json.loads(request.body or b"{}") if request.method == "POST" else {}
+    except json.JSONDecodeError:
+        raise ParseError("Invalid JSON body.")
+    if not isinstance(body, dict):
+        raise ValidationError("Request body must be a JSON object.")
+
+    academic_year_id, entries = await sync_to_async(_request_program_nlp_outcome_mapping)(request, program_id, body)
+    entries = await await_program_outcome_mapping(program_id, academic_year_id, entries, wait_seconds(request))
+
+    data = ProgramNlpOutcomeMappingSerializer(entries, many=True).data
+    pending = any(entry["status"] == NlpOutcomeMappingResult.STATUS_PENDING for entry in data)
+    return JsonResponse(
+        data,
+        safe=False,
+        status=status.HTTP_202_ACCEPTED if pending else status.HTTP_200_OK,
+    )
+
 # ====================================================
 # Course Management
 # ====================================================
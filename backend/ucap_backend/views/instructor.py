@@ -1,24 +1,25 @@
 from collections import defaultdict
-import json
 import csv
 from io import TextIOWrapper
-import logging
-import time
 import uuid
-import tempfile
-from gradio_client import Client, handle_file
+from asgiref.sync import sync_to_async
 from django.db.models import Prefetch
 from django.db.models.functions import Lower
 from django.shortcuts import get_object_or_404
 from django.core.files.storage import default_storage
+from django.http import JsonResponse
 from rest_framework import status, viewsets, serializers
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from ucap_backend.services.dashboard_cache import invalidate_section_dashboards
 from ucap_backend.services.data_extraction import apply_extracted_override, extract_co_po
-from ucap_backend.models import Assessment, CourseComponent, CourseOutcome, CourseTerm, CourseUnit, LoadedCourse, OutcomeMapping, ProgramOutcome, RawScore, Section, Student, User
+from ucap_backend.services.nlp_outcome_mapping import CircuitOpenError, await_outcome_mapping, build_nlp_payload, request_outcome_mapping
+from ucap_backend.services.section_provisioning import retry_provisioning
+from ucap_backend.models import Assessment, CourseComponent, CourseOutcome, CourseTerm, CourseUnit, LoadedCourse, NlpOutcomeMappingResult, OutcomeMapping, ProgramOutcome, RawScore, Section, Student, User
 from ucap_backend.serializers.instructor import AssessmentSerializer, ClassRecordSerializer, CourseComponentSerializer, CourseOutcomeSerializer, CourseUnitSerializer, InstructorCourseDetailsSerializer, InstructorLoadedCourseSerializer, InstructorSectionSerializer, OutcomeMappingSerializer, ProgramOutcomeSerializer, StudentSerializer
+from ucap_backend.views.base import async_api_view, wait_seconds
 
 # ====================================================
 # Instructor
@@ -172,6 +173,18 @@ class ClassRecordViewSet(viewsets.ViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        if section.provisioning_status != Section.PROVISIONING_READY:
+            retry_provisioning(section)
+            if section.provisioning_status == Section.PROVISIONING_FAILED:
+                return Response(
+                    {"status": Section.PROVISIONING_FAILED, "message": section.provisioning_error},
+                    status=status.HTTP_202_ACCEPTED,
+                )
+            return Response(
+                {"status": Section.PROVISIONING_PENDING},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
         serializer = ClassRecordSerializer(section)
         data = serializer.data
         data["canGenerateResultSheet"] = can_generate_result_sheet(section, request.user)
@@ -204,8 +217,14 @@ class StudentViewSet(viewsets.ModelViewSet):
             for assessment in assessments
         ]
         RawScore.objects.bulk_create(raw_scores)
+        invalidate_section_dashboards(section_id)
         return student
 
+    def perform_destroy(self, instance):
+        section_id = instance.section_id
+        instance.delete()
+        invalidate_section_dashboards(section_id)
+
     @action(detail=False, methods=["post"], url_path="import")
     def import_students(self, request):
         section_id = request.query_params.get("section")
@@ -243,12 +262,15 @@ class StudentViewSet(viewsets.ModelViewSet):
         existing = Student.objects.filter(section_id=section_id).order_by("student_id")
 
         if mode == "append":
-            return self._import_append(section_id, existing, filtered)
-
-        if mode == "override":
-            return self._import_override(section_id, existing, filtered)
+            response = self._import_append(section_id, existing, filtered)
+        elif mode == "override":
+            response = self._import_override(section_id, existing, filtered)
+        else:
+            return Response({"detail": "invalid mode"}, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response({"detail": "invalid mode"}, status=status.HTTP_400_BAD_REQUEST)
+        # The roster is bulk-created, which fires no signals.
+        invalidate_section_dashboards(section_id)
+        return response
 
 
     def _parse_grade_sheet_csv(self, file):
@@ -453,7 +475,18 @@ class AssessmentViewSet(viewsets.ModelViewSet):
             for student in students
         ]
         RawScore.objects.bulk_create(raw_scores)
+        invalidate_section_dashboards(section.pk)
         return assessment
+
+    def perform_destroy(self, instance):
+        section_id = (
+            Assessment.objects
+            .filter(pk=instance.pk)
+            .values_list("course_component__course_unit__course_term__section_id", flat=True)
+            .first()
+        )
+        instance.delete()
+        invalidate_section_dashboards(section_id)
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -1007,100 +1040,60 @@ class SyllabusExtractView(APIView):
 # ====================================================
 # NLP Outcome Mapping
 # ====================================================
-logger = logging.getLogger(__name__)
-
-HF_SPACE = "jestoniandales25/BERT_nlp"
-HF_API_NAME = "/process_json"
-
-MAX_HF_TRIES = 2
-RETRY_DELAY_SECONDS = 3
-
-
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def nlp_outcome_mapping_view(request, loaded_course_id: int):
+@async_api_view(["GET"])
+async def nlp_outcome_mapping_view(request, loaded_course_id: int):
     try:
-        loaded_course = (
+        loaded_course = await (
             LoadedCourse.objects
             .select_related("course__program")
-            .get(pk=loaded_course_id)
+            .aget(pk=loaded_course_id)
         )
     except LoadedCourse.DoesNotExist:
-        return Response(
+        return JsonResponse(
             {"message": "Loaded course not found."},
             status=status.HTTP_404_NOT_FOUND
         )
 
-    cos = CourseOutcome.objects.filter(
+    cos = [co async for co in CourseOutcome.objects.filter(
         loaded_course_id=loaded_course_id,
         instructor=request.user
-    ).order_by("course_outcome_id")
+    ).order_by("course_outcome_id")]
 
     program_id = loaded_course.course.program_id
-    pos = ProgramOutcome.objects.filter(
+    pos = [po async for po in ProgramOutcome.objects.filter(
         program_id=program_id
-    ).order_by("program_outcome_id")
+    ).order_by("program_outcome_id")]
 
-    if not cos.exists() or not pos.exists():
-        return Response(
+    if not cos or not pos:
+        return JsonResponse(
             {"message": "Cannot run NLP: missing course outcomes or program outcomes."},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    co_data = CourseOutcomeSerializer(cos, many=True).data
-    po_data = ProgramOutcomeSerializer(pos, many=True).data
-
-    payload = {
-        "CourseOutcome": [
-            {
-                "course_outcome_code": co["course_outcome_code"],
-                "course_outcome_description": co["course_outcome_description"],
-            }
-            for co in co_data
-        ],
-        "ProgramOutcome": [
-            {
-                "program_outcome_code": po["program_outcome_code"],
-                "program_outcome_description": po["program_outcome_description"],
-            }
-            for po in po_data
-        ],
-    }
-
-    client = Client(HF_SPACE)
+    payload = build_nlp_payload(cos, pos)
+    refresh = request.GET.get("refresh", "").lower() in ("1", "true", "yes")
 
     try:
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".json") as f:
-            json.dump(payload, f)
-            f.flush()
-
-            last_exc = None
-            result = None
-
-            for attempt in range(1, MAX_HF_TRIES + 1):
-                try:
-                    result = client.predict(
-                        file_obj=handle_file(f.name),
-                        api_name=HF_API_NAME,
-                    )
-                    break
-                except Exception as e:
-                    last_exc = e
-                    logger.exception(
-                        "HF NLP call failed on attempt %s for loaded_course_id=%s",
-                        attempt,
-                        loaded_course_id,
-                    )
-                    if attempt < MAX_HF_TRIES:
-                        time.sleep(RETRY_DELAY_SECONDS)
+        entry = await sync_to_async(request_outcome_mapping)(loaded_course, request.user, payload, refresh=refresh)
+    except CircuitOpenError:
+        raise
+    except Exception as e:
+        return JsonResponse(
+            {"message": f"NLP outcome mapping failed: {e}"},
+            status=status.HTTP_502_BAD_GATEWAY,
+        )
 
-            if result is None and last_exc is not None:
-                raise last_exc
+    entry = await await_outcome_mapping(entry, wait_seconds(request))
 
-    except Exception as e:
-        return Response(
-            {"message": f"HuggingFace NLP call failed: {e}"},
+    if entry.status == NlpOutcomeMappingResult.STATUS_PENDING:
+        return JsonResponse({"status": entry.status}, status=status.HTTP_202_ACCEPTED)
+
+    if entry.status == NlpOutcomeMappingResult.STATUS_FAILED:
+        return JsonResponse(
+            {"message": f"NLP outcome mapping failed: {entry.error}"},
             status=status.HTTP_502_BAD_GATEWAY,
         )
 
-    return Response(result, status=status.HTTP_200_OK)
\ No newline at end of file
+    response = JsonResponse(entry.result, safe=False, status=status.HTTP_200_OK)
+    response["X-NLP-Cache"] = "hit" if getattr(entry, "cache_hit", False) else "miss"
+    return response
@@ -5,7 +5,8 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from ucap_backend.serializers.user import ChangePasswordSerializer, CurrentUserSerializer, UserInitialInfoSerializer
+from ucap_backend.serializers.user import ChangePasswordSerializer
+from ucap_backend.services.user_context import get_user_context
 
 # ====================================================
 # Login Authentication
@@ -39,8 +40,18 @@ def logout_view(request):
 def me_view(request):
     if not request.user.is_authenticated:
         return Response(None, status=status.HTTP_200_OK)
-    serializer = CurrentUserSerializer(request.user)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    context = get_user_context(request.user)
+    return Response(
+        {
+            "user_id": context["user_id"],
+            "role_id": context["user_role_id"],
+            "department_ids": context["department_ids"],
+            "first_name": context["first_name"],
+            "last_name": context["last_name"],
+            "email": context["email"],
+        },
+        status=status.HTTP_200_OK
+    )
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
@@ -71,8 +82,25 @@ def change_password_view(request):
 # ====================================================
 # User Initial Info
 # ====================================================
+USER_INITIAL_INFO_FIELDS = [
+    "user_id",
+    "user_role_id",
+    "user_role_type",
+    "user_role_scope",
+    "departments",
+    "leadership",
+    "primary_department",
+    "primary_college",
+    "primary_campus",
+    "first_name",
+    "middle_name",
+    "last_name",
+    "suffix",
+    "email",
+]
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def user_initial_info_view(request):
-    serializer = UserInitialInfoSerializer(request.user)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    context = get_user_context(request.user)
+    return Response({field: context[field] for field in USER_INITIAL_INFO_FIELDS}, status=status.HTTP_200_OK)
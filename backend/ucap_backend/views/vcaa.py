@@ -2,9 +2,12 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
-from ucap_backend.models import LoadedCourse, Section
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from ucap_backend.models import LoadedCourse
 from ucap_backend.serializers.vcaa import VcaaCourseDetailsSerializer, VcaaLoadedCourseSerializer, VcaaSectionSerializer
+from ucap_backend.services.dashboard_cache import cached_dashboard_response
+from ucap_backend.services.dashboard_stats import annotate_loaded_course_stats, scope_summary
+from ucap_backend.services.loaded_courses import filter_loaded_courses, loaded_course_page, paginate_loaded_courses, scoped_catalog, scoped_loaded_course, scoped_loaded_courses
 
 # ====================================================
 # VCAA
@@ -13,26 +16,14 @@ from ucap_backend.serializers.vcaa import VcaaCourseDetailsSerializer, VcaaLoade
 @permission_classes([IsAuthenticated])
 def vcaa_loaded_courses_view(request, campus_id):
     try:
-        user_campus_id = getattr(request.user, "vcaa_campus_id", None)
-        if user_campus_id is None or int(user_campus_id) != int(campus_id):
-            raise PermissionDenied("You are not assigned to this campus.")
-
-        loaded_courses = (
-            LoadedCourse.objects
-            .select_related(
-                "course__program__department__college__campus",
-                "course__program",
-                "course__semester",
-                "course__year_level",
-                "academic_year",
-            )
-            .filter(course__program__department__college__campus_id=campus_id)
-            .order_by("course__course_code")
+        catalog = scoped_catalog(request.user, "campus", campus_id)
+        return cached_dashboard_response(
+            request, "campus", campus_id, "loaded_courses",
+            lambda: paginate_loaded_courses(request, annotate_loaded_course_stats(catalog), VcaaLoadedCourseSerializer).data,
         )
 
-        serializer = VcaaLoadedCourseSerializer(loaded_courses, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-
+    except ValidationError as e:
+        return Response({"message": e.detail}, status=status.HTTP_400_BAD_REQUEST)
     except PermissionDenied as e:
         return Response({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
     except Exception as e:
@@ -40,36 +31,34 @@ def vcaa_loaded_courses_view(request, campus_id):
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def vcaa_course_page_view(request, loaded_course_id):
+def vcaa_summary_view(request, campus_id):
     try:
-        loaded_course = (
-            LoadedCourse.objects
-            .select_related(
-                "course__program__department__college__campus",
-                "course__semester",
-                "course__year_level",
-                "academic_year",
-            )
-            .get(pk=loaded_course_id)
-        )
-
-        dummy_section = Section(
-            loaded_course=loaded_course,
-            instructor_assigned=None,
-            year_and_section=""
+        loaded_courses = scoped_loaded_courses(request.user, "campus", campus_id)
+        return cached_dashboard_response(
+            request, "campus", campus_id, "summary",
+            lambda: scope_summary(filter_loaded_courses(loaded_courses, request.query_params)),
         )
 
-        course_details = VcaaCourseDetailsSerializer(dummy_section).data
-
-        sections = Section.objects.filter(loaded_course_id=loaded_course_id).select_related("instructor_assigned")
-        sections_data = VcaaSectionSerializer(sections, many=True).data
+    except ValidationError as e:
+        return Response({"message": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+    except PermissionDenied as e:
+        return Response({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
+    except Exception as e:
+        return Response({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        return Response({
-            "course_details": course_details,
-            "sections": sections_data
-        }, status=status.HTTP_200_OK)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def vcaa_course_page_view(request, loaded_course_id):
+    try:
+        loaded_course = scoped_loaded_course(request.user, "campus", loaded_course_id)
+        return Response(
+            loaded_course_page(loaded_course, VcaaCourseDetailsSerializer, VcaaSectionSerializer),
+            status=status.HTTP_200_OK
+        )
 
     except LoadedCourse.DoesNotExist:
         return Response({"message": "Loaded course not found for this campus."}, status=status.HTTP_404_NOT_FOUND)
+    except PermissionDenied as e:
+        return Response({"message": str(e)}, status=status.HTTP_403_FORBIDDEN)
     except Exception as e:
-        return Response({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        return Response({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -9,11 +9,26 @@ import type {
   AssessmentInfo,
 } from "../types/classRecordTypes";
 
+const PROVISIONING_POLL_INTERVAL_MS = 1500;
+const PROVISIONING_MAX_POLLS = 40;
+
 export async function getClassRecord(sectionId: number) {
-  const { data } = await axiosClient.get<ClassRecord>(
-    `/instructor/class_record/${sectionId}/`
-  );
-  return data;
+  for (let attempt = 0; attempt < PROVISIONING_MAX_POLLS; attempt++) {
+    const res = await axiosClient.get<ClassRecord>(
+      `/instructor/class_record/${sectionId}/`
+    );
+    if (res.status !== 202) return res.data;
+    const progress = res.data as unknown as { status: string; message?: string };
+    if (progress.status === "failed") {
+      throw new Error(
+        `The class record could not be prepared${progress.message ? `: ${progress.message}.` : "."} It will be retried shortly.`
+      );
+    }
+    await new Promise((resolve) =>
+      setTimeout(resolve, PROVISIONING_POLL_INTERVAL_MS)
+    );
+  }
+  throw new Error("The class record is still being prepared. Please try again shortly.");
 }
 
 export async function createStudent(
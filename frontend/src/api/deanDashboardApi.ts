@@ -1,22 +1,28 @@
 import axiosClient from "./axiosClient";
 import type {
   BaseLoadedCourse,
+  CursorPage,
+  LoadedCourseQuery,
   BaseCoursePageResponse,
   BaseSection,
 } from "../types/baseTypes";
 
 export const fetchDeanLoadedCourses = async (
-  collegeId: number
-): Promise<BaseLoadedCourse[]> => {
-  const res = await axiosClient.get<BaseLoadedCourse[]>(
-    `/dean/${collegeId}/`
-  );
+  collegeId: number,
+  query: LoadedCourseQuery = {}
+): Promise<CursorPage<BaseLoadedCourse>> => {
+  const res = await axiosClient.get<CursorPage<BaseLoadedCourse>>(`/dean/${collegeId}/`, {
+    params: query,
+  });
 
-  return res.data.map((course) => ({
-    ...course,
-    id: course.loaded_course_id,
-    academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
-  }));
+  return {
+    ...res.data,
+    results: res.data.results.map((course) => ({
+      ...course,
+      id: course.loaded_course_id,
+      academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
+    })),
+  };
 };
 
 export const fetchDeanCoursePage = async (
@@ -3,16 +3,29 @@ import type { OutcomeMappingResponse } from "../types/outcomeMappingTypes";
 
 type RawNlpResult = Record<string, Record<string, number>>;
 
+// Each poll is held open server-side for up to NLP_LONG_POLL_SECONDS until the job finishes.
+const NLP_LONG_POLL_SECONDS = 20;
+const NLP_POLL_INTERVAL_MS = 2000;
+const NLP_MAX_POLLS = 9;
+
+async function pollNlpOutcomeMapping(loadedCourseId: number): Promise<RawNlpResult> {
+  for (let attempt = 0; attempt < NLP_MAX_POLLS; attempt++) {
+    const res = await axiosClient.get<RawNlpResult>(
+      `/instructor/nlp_outcome_mapping/${loadedCourseId}/`,
+      { params: { wait: NLP_LONG_POLL_SECONDS } }
+    );
+    if (res.status !== 202) return res.data;
+    await new Promise((resolve) => setTimeout(resolve, NLP_POLL_INTERVAL_MS));
+  }
+  throw new Error("NLP mapping is taking too long. Please try again later.");
+}
+
 export async function fetchNlpOutcomeMapping(
   loadedCourseId: number,
   courseOutcomes: OutcomeMappingResponse["course_outcomes"],
   programOutcomes: OutcomeMappingResponse["program_outcomes"]
 ): Promise<OutcomeMappingResponse> {
-  const res = await axiosClient.get<RawNlpResult>(
-    `/instructor/nlp_outcome_mapping/${loadedCourseId}/`
-  );
-
-  const raw = res.data;
+  const raw = await pollNlpOutcomeMapping(loadedCourseId);
 
   const coByCode = new Map(
     courseOutcomes.map((co) => [co.course_outcome_code, co])
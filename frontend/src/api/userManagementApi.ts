@@ -6,8 +6,10 @@ import type {
   FacultyInfo,
   FacultyInfoDisplay,
   FacultyPayload,
+  FacultyQuery,
   UserMutationResult,
 } from "../types/userManagementTypes";
+import type { CursorPage } from "../types/baseTypes";
 
 function mapUser(user: FacultyInfo): FacultyInfoDisplay {
   const roleType = (user.user_role_type ?? "").toLowerCase();
@@ -41,14 +43,14 @@ function mapUser(user: FacultyInfo): FacultyInfoDisplay {
   };
 }
 
-export async function getUsers(): Promise<FacultyInfoDisplay[]> {
-  try {
-    const res = await axiosClient.get<FacultyInfo[]>("/admin/user_management/");
-    return res.data.map(mapUser);
-  } catch (error) {
-    console.error("Error fetching users:", error);
-    return [];
-  }
+export async function getUsers(
+  query: FacultyQuery = {}
+): Promise<CursorPage<FacultyInfoDisplay>> {
+  const res = await axiosClient.get<CursorPage<FacultyInfo>>(
+    "/admin/user_management/",
+    { params: query }
+  );
+  return { ...res.data, results: res.data.results.map(mapUser) };
 }
 
 export async function getUser(id: number): Promise<FacultyInfo | null> {
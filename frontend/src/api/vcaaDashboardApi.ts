@@ -1,19 +1,27 @@
 import axiosClient from "./axiosClient";
 import type {
   BaseLoadedCourse,
+  CursorPage,
+  LoadedCourseQuery,
   BaseCoursePageResponse,
 } from "../types/baseTypes";
 
 export const fetchVcaaLoadedCourses = async (
-  campusId: number
-): Promise<BaseLoadedCourse[]> => {
-  const res = await axiosClient.get<BaseLoadedCourse[]>(`/campus/${campusId}/`);
+  campusId: number,
+  query: LoadedCourseQuery = {}
+): Promise<CursorPage<BaseLoadedCourse>> => {
+  const res = await axiosClient.get<CursorPage<BaseLoadedCourse>>(`/campus/${campusId}/`, {
+    params: query,
+  });
 
-  return res.data.map((course) => ({
-    ...course,
-    id: course.loaded_course_id,
-    academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
-  }));
+  return {
+    ...res.data,
+    results: res.data.results.map((course) => ({
+      ...course,
+      id: course.loaded_course_id,
+      academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
+    })),
+  };
 };
 
 export const fetchVcaaCoursePage = async (
@@ -1,17 +1,26 @@
 import axiosClient from "./axiosClient";
 import type {
   BaseLoadedCourse,
+  CursorPage,
+  LoadedCourseQuery,
   BaseCoursePageResponse,
 } from "../types/baseTypes";
 
-export const fetchVpaaLoadedCourses = async (): Promise<BaseLoadedCourse[]> => {
-  const res = await axiosClient.get<BaseLoadedCourse[]>("/university/");
+export const fetchVpaaLoadedCourses = async (
+  query: LoadedCourseQuery = {}
+): Promise<CursorPage<BaseLoadedCourse>> => {
+  const res = await axiosClient.get<CursorPage<BaseLoadedCourse>>("/university/", {
+    params: query,
+  });
 
-  return res.data.map((course) => ({
-    ...course,
-    id: course.loaded_course_id,
-    academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
-  }));
+  return {
+    ...res.data,
+    results: res.data.results.map((course) => ({
+      ...course,
+      id: course.loaded_course_id,
+      academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
+    })),
+  };
 };
 
 export const fetchVpaaCoursePage = async (
@@ -0,0 +1,27 @@
+interface LoadMoreProps {
+  hasMore: boolean;
+  loading: boolean;
+  onLoadMore: () => void;
+  label?: string;
+}
+
+export default function LoadMoreComponent({
+  hasMore,
+  loading,
+  onLoadMore,
+  label = "Load more courses",
+}: LoadMoreProps) {
+  if (!hasMore) return null;
+
+  return (
+    <div className="flex w-full justify-center mt-4">
+      <button
+        className="px-4 py-2 text-sm border border-[#E9E6E6] rounded disabled:opacity-50 enabled:cursor-pointer"
+        disabled={loading}
+        onClick={onLoadMore}
+      >
+        {loading ? "Loading..." : label}
+      </button>
+    </div>
+  );
+}
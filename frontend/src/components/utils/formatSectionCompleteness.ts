@@ -0,0 +1,13 @@
+import type { SectionCompleteness } from "../../types/baseTypes";
+
+export const formatSectionCompleteness = (c?: SectionCompleteness) => {
+  if (!c) return "";
+  if (c.assessment_count === 0) return "No assessments yet";
+
+  const parts = [`${Math.round(c.score_fill_rate * 100)}% scores encoded`];
+  if (c.assessments_missing_highest_score > 0) {
+    parts.push(`${c.assessments_missing_highest_score} missing highest score`);
+  }
+  if (!c.outcomes_mapped) parts.push("COs not fully mapped");
+  return parts.join(" | ");
+};
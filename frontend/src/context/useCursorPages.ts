@@ -0,0 +1,77 @@
+import { useCallback, useEffect, useState } from "react";
+import type { CursorPage } from "../types/baseTypes";
+
+const SEARCH_DELAY = 300;
+
+type PageQuery = { search?: string; cursor?: string };
+
+const cursorFrom = (url: string | null) =>
+  url ? new URL(url, window.location.origin).searchParams.get("cursor") : null;
+
+export const useCursorPages = <T>(
+  fetchPage: ((query: PageQuery) => Promise<CursorPage<T>>) | null,
+  searchQuery: string
+) => {
+  const [items, setItems] = useState<T[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const search = searchQuery.trim();
+
+  useEffect(() => {
+    if (!fetchPage) {
+      setItems([]);
+      setNextCursor(null);
+      setLoading(false);
+      return;
+    }
+
+    let active = true;
+    const timer = window.setTimeout(async () => {
+      try {
+        setLoading(true);
+        const page = await fetchPage(search ? { search } : {});
+        if (!active) return;
+
+        setItems(page.results);
+        setNextCursor(cursorFrom(page.next));
+      } catch (e) {
+        console.error("Failed to fetch page", e);
+      } finally {
+        if (active) setLoading(false);
+      }
+    }, search ? SEARCH_DELAY : 0);
+
+    return () => {
+      active = false;
+      clearTimeout(timer);
+    };
+  }, [fetchPage, search]);
+
+  const loadMore = useCallback(async () => {
+    if (!fetchPage || !nextCursor) return;
+
+    try {
+      setLoadingMore(true);
+      const page = await fetchPage(
+        search ? { search, cursor: nextCursor } : { cursor: nextCursor }
+      );
+      setItems((prev) => [...prev, ...page.results]);
+      setNextCursor(cursorFrom(page.next));
+    } catch (e) {
+      console.error("Failed to fetch next page", e);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [fetchPage, nextCursor, search]);
+
+  return {
+    items,
+    setItems,
+    loading,
+    loadingMore,
+    hasMore: nextCursor !== null,
+    loadMore,
+  };
+};
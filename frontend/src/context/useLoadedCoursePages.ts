@@ -0,0 +1,18 @@
+import type {
+  BaseLoadedCourse,
+  CursorPage,
+  LoadedCourseQuery,
+} from "../types/baseTypes";
+import { useCursorPages } from "./useCursorPages";
+
+export const useLoadedCoursePages = (
+  fetchPage: ((query: LoadedCourseQuery) => Promise<CursorPage<BaseLoadedCourse>>) | null,
+  searchQuery: string
+) => {
+  const { items, loading, loadingMore, hasMore, loadMore } = useCursorPages(
+    fetchPage,
+    searchQuery
+  );
+
+  return { courses: items, loading, loadingMore, hasMore, loadMore };
+};
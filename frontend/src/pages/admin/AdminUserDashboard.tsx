@@ -1,4 +1,4 @@
-import { useMemo, useState, useEffect } from "react";
+import { useState } from "react";
 import {
   getUsers,
   getUser,
@@ -34,6 +34,8 @@ import AppLayout from "../../layout/AppLayout";
 import { toast } from "react-toastify";
 import DepartmentSearchTagPicker from "../../components/DepartmentPickerComponent";
 import InfoComponent from "../../components/InfoComponent";
+import LoadMoreComponent from "../../components/LoadMoreComponent";
+import { useCursorPages } from "../../context/useCursorPages";
 import { getColleges, getDepartments } from "../../api/hierarchyManagementApi";
 
 const initialFormData = {
@@ -53,9 +55,15 @@ const initialFormData = {
 export default function AdminUserDashboard() {
   const [isPanelOpen, setIsPanelOpen] = useState(false);
   const [searchQuery, setSearchQuery] = useState("");
-  const [loading, setLoading] = useState(true);
   const [sidePanelLoading, setSidePanelLoading] = useState(false);
-  const [users, setUsers] = useState<FacultyInfoDisplay[]>([]);
+  const {
+    items: users,
+    setItems: setUsers,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+  } = useCursorPages<FacultyInfoDisplay>(getUsers, searchQuery);
   const [editingFaculty, setEditingFaculty] = useState<FacultyInfo | null>(
     null
   );
@@ -79,19 +87,6 @@ export default function AdminUserDashboard() {
 
   const [formData, setFormData] = useState(initialFormData);
 
-  useEffect(() => {
-    async function fetchUsers() {
-      setLoading(true);
-      try {
-        const usersData = await getUsers();
-        setUsers(usersData);
-      } finally {
-        setLoading(false);
-      }
-    }
-    fetchUsers();
-  }, []);
-
   async function ensureDropdownsLoaded() {
     if (dropdownsLoaded) return;
 
@@ -156,25 +151,6 @@ export default function AdminUserDashboard() {
     }
   };
 
-  const filteredUsers = useMemo(() => {
-    const q = searchQuery.trim().toLowerCase();
-    if (!q) return users;
-
-    return users.filter((u) => {
-      return Object.values(u).some((val) => {
-        if (val == null) return false;
-        if (
-          typeof val === "number" ||
-          typeof val === "string" ||
-          typeof val === "boolean"
-        ) {
-          return String(val).toLowerCase().includes(q);
-        }
-        return false;
-      });
-    });
-  }, [searchQuery, users]);
-
   const selectedRole = roles.find(
     (r) => String(r.user_role_id) === formData.user_role
   );
@@ -318,7 +294,7 @@ export default function AdminUserDashboard() {
         }}
       />
       <TableComponent
-        data={filteredUsers}
+        data={users}
         emptyImageSrc={emptyImage}
         emptyMessage="No Faculty Available!"
         columns={[
@@ -335,6 +311,12 @@ export default function AdminUserDashboard() {
         skeletonRows={5}
         showActions
       />
+      <LoadMoreComponent
+        hasMore={hasMore}
+        loading={loadingMore}
+        onLoadMore={loadMore}
+        label="Load more faculty"
+      />
       <SidePanelComponent
         isOpen={isPanelOpen}
         onClose={() => {
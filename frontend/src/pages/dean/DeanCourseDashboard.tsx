@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from "react";
+import { useMemo, useState } from "react";
 import { useNavigate } from "react-router-dom";
 
 import AppLayout from "../../layout/AppLayout";
@@ -10,8 +10,13 @@ import emptyImage from "../../assets/undraw_file-search.svg";
 import { useLayout } from "../../context/useLayout";
 import { fetchDeanLoadedCourses } from "../../api/deanDashboardApi";
 import InfoComponent from "../../components/InfoComponent";
-import type { BaseLoadedCourse } from "../../types/baseTypes";
+import type {
+  BaseLoadedCourse,
+  LoadedCourseQuery,
+} from "../../types/baseTypes";
+import LoadMoreComponent from "../../components/LoadMoreComponent";
 import { useInitialInfo } from "../../context/useInitialInfo";
+import { useLoadedCoursePages } from "../../context/useLoadedCoursePages";
 
 export default function DeanCourseDashboard() {
   const navigate = useNavigate();
@@ -19,9 +24,7 @@ export default function DeanCourseDashboard() {
 
   const { layout } = useLayout();
 
-  const [courses, setCourses] = useState<BaseLoadedCourse[]>([]);
   const [searchQuery, setSearchQuery] = useState("");
-  const [loading, setLoading] = useState(true);
 
   const collegeId =
     initialInfo?.primary_college?.college_id ??
@@ -41,52 +44,26 @@ export default function DeanCourseDashboard() {
       ? initialInfo.leadership.name
       : "");
 
-  useEffect(() => {
-    const load = async () => {
-      try {
-        if (!collegeId) {
-          setLoading(false);
-          return;
-        }
-
-        setLoading(true);
-
-        const data = await fetchDeanLoadedCourses(Number(collegeId));
-        const formatted = data.map((c) => ({
-          ...c,
-          id: c.loaded_course_id,
-          academic_year_and_semester: `${c.academic_year_start}-${c.academic_year_end} / ${c.semester_type}`,
-          year_level: c.year_level_type,
-        }));
-
-        setCourses(formatted);
-      } catch (e) {
-        console.error("Failed to fetch dean loaded courses", e);
-      } finally {
-        setLoading(false);
-      }
-    };
-
-    load();
-  }, [collegeId]);
-
-  const filteredLoadedCourses = useMemo(() => {
-    const q = searchQuery.trim().toLowerCase();
-    if (!q) return courses;
-
-    return courses.filter((course) =>
-      Object.values(course).some((val) => {
-        if (val == null) return false;
+  const fetchCollegePage = useMemo(
+    () =>
+      collegeId
+        ? (query: LoadedCourseQuery) =>
+            fetchDeanLoadedCourses(Number(collegeId), query)
+        : null,
+    [collegeId]
+  );
 
-        const t = typeof val;
-        if (t === "string" || t === "number" || t === "boolean") {
-          return String(val).toLowerCase().includes(q);
-        }
+  const { courses, loading, loadingMore, hasMore, loadMore } =
+    useLoadedCoursePages(fetchCollegePage, searchQuery);
 
-        return false;
-      })
-    );
-  }, [searchQuery, courses]);
+  const filteredLoadedCourses = useMemo(
+    () =>
+      courses.map((course) => ({
+        ...course,
+        year_level: course.year_level_type,
+      })),
+    [courses]
+  );
 
   const goToDeanCoursePage = (course: BaseLoadedCourse) => {
     navigate(`/college/${collegeId}/${course.loaded_course_id}`, {
@@ -148,6 +125,12 @@ export default function DeanCourseDashboard() {
           loading={loading}
         />
       )}
+
+      <LoadMoreComponent
+        hasMore={hasMore}
+        loading={loadingMore}
+        onLoadMore={loadMore}
+      />
     </AppLayout>
   );
 }
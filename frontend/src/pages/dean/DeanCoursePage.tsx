@@ -17,6 +17,7 @@ import type {
   BaseCoursePageResponse,
   BaseSection,
 } from "../../types/baseTypes";
+import { formatSectionCompleteness } from "../../components/utils/formatSectionCompleteness";
 
 export default function DeanCoursePage() {
   const { college_id, loaded_course_id } = useParams();
@@ -65,6 +66,7 @@ export default function DeanCoursePage() {
         course_and_section: courseCode
           ? `${courseCode} - ${s.year_and_section}`
           : s.year_and_section,
+        encoding_progress: formatSectionCompleteness(s.completeness),
       }));
   }, [courseData, searchQuery]);
 
@@ -132,6 +134,7 @@ export default function DeanCoursePage() {
           columns={[
             { key: "course_and_section", label: "Course & Section" },
             { key: "instructor_assigned", label: "Instructor Assigned" },
+            { key: "encoding_progress", label: "Encoding Progress" },
           ]}
         />
       )}
@@ -23,6 +23,7 @@ import {
 import type { SectionPayload } from "../../types/departmentChairSectionTypes";
 import InfoComponent from "../../components/InfoComponent";
 import type { BaseCourseDetails, BaseSection } from "../../types/baseTypes";
+import { formatSectionCompleteness } from "../../components/utils/formatSectionCompleteness";
 import { toast } from "react-toastify";
 
 export default function DepartmentChairCoursePage() {
@@ -88,6 +89,7 @@ export default function DepartmentChairCoursePage() {
           year_and_section: s.year_and_section,
           instructor_assigned: s.instructor_assigned,
           instructor_id: s.instructor_id ?? null,
+          completeness: s.completeness,
         }));
 
         setSections(mapAndSortSections(mapped));
@@ -161,9 +163,11 @@ export default function DepartmentChairCoursePage() {
         year_and_section: s.year_and_section,
         instructor_assigned: s.instructor_assigned,
         instructor_id: s.instructor_id ?? null,
+        completeness: s.completeness,
         course_and_section: courseCode
           ? `${courseCode} - ${s.year_and_section}`
           : s.year_and_section,
+        encoding_progress: formatSectionCompleteness(s.completeness),
       }));
   }, [sections, searchQuery, courseDetails?.course_code]);
 
@@ -359,6 +363,7 @@ export default function DepartmentChairCoursePage() {
           columns={[
             { key: "course_and_section", label: "Course & Section" },
             { key: "instructor_assigned", label: "Instructor Assigned" },
+            { key: "encoding_progress", label: "Encoding Progress" },
           ]}
           onEdit={(id) => {
             const section = sections.find((s) => s.section_id === Number(id));
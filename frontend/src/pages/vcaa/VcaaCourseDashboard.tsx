@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from "react";
+import { useMemo, useState } from "react";
 import { useNavigate } from "react-router-dom";
 
 import AppLayout from "../../layout/AppLayout";
@@ -10,17 +10,20 @@ import emptyImage from "../../assets/undraw_file-search.svg";
 import { useLayout } from "../../context/useLayout";
 
 import { fetchVcaaLoadedCourses } from "../../api/vcaaDashboardApi";
-import type { BaseLoadedCourse } from "../../types/baseTypes";
+import type {
+  BaseLoadedCourse,
+  LoadedCourseQuery,
+} from "../../types/baseTypes";
 import InfoComponent from "../../components/InfoComponent";
+import LoadMoreComponent from "../../components/LoadMoreComponent";
 import { useInitialInfo } from "../../context/useInitialInfo";
+import { useLoadedCoursePages } from "../../context/useLoadedCoursePages";
 
 export default function VcaaCourseDashboard() {
   const navigate = useNavigate();
   const { layout } = useLayout();
 
-  const [courses, setCourses] = useState<BaseLoadedCourse[]>([]);
   const [searchQuery, setSearchQuery] = useState("");
-  const [loading, setLoading] = useState(true);
 
   const { initialInfo, initialInfoLoading } = useInitialInfo();
 
@@ -36,63 +39,25 @@ export default function VcaaCourseDashboard() {
       ? initialInfo.leadership.name
       : "");
 
-  useEffect(() => {
-    if (initialInfoLoading || campusId == null) return;
-
-    let active = true;
-
-    (async () => {
-      try {
-        setLoading(true);
-        const data = await fetchVcaaLoadedCourses(campusId);
-
-        if (!active) return;
-
-        setCourses(
-          data.map((c) => ({
-            ...c,
-            id: c.loaded_course_id,
-            academic_year_and_semester: `${c.academic_year_start}-${c.academic_year_end} / ${c.semester_type}`,
-            year_level: c.year_level_type,
-          }))
-        );
-      } catch (e) {
-        console.error("Failed to fetch Campus loaded courses", e);
-      } finally {
-        if (active) setLoading(false);
-      }
-    })();
-
-    return () => {
-      active = false;
-    };
-  }, [initialInfoLoading, campusId]);
-
-  const filteredCourses = useMemo(() => {
-    const q = searchQuery.trim().toLowerCase();
-
-    const augmented = courses.map((course) => ({
-      ...course,
-      id: course.loaded_course_id,
-      academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
-      year_level: course.year_level_type,
-    }));
-
-    if (!q) return augmented;
-
-    return augmented.filter((course) =>
-      Object.values(course).some((val) => {
-        if (val == null) return false;
+  const fetchCampusPage = useMemo(
+    () =>
+      initialInfoLoading || campusId == null
+        ? null
+        : (query: LoadedCourseQuery) => fetchVcaaLoadedCourses(campusId, query),
+    [initialInfoLoading, campusId]
+  );
 
-        const t = typeof val;
-        if (t === "string" || t === "number" || t === "boolean") {
-          return String(val).toLowerCase().includes(q);
-        }
+  const { courses, loading, loadingMore, hasMore, loadMore } =
+    useLoadedCoursePages(fetchCampusPage, searchQuery);
 
-        return false;
-      })
-    );
-  }, [searchQuery, courses]);
+  const filteredCourses = useMemo(
+    () =>
+      courses.map((course) => ({
+        ...course,
+        year_level: course.year_level_type,
+      })),
+    [courses]
+  );
 
   const goToCampusCoursePage = (course: BaseLoadedCourse) => {
     navigate(`/campus/${campusId}/${course.loaded_course_id}`, {
@@ -152,6 +117,12 @@ export default function VcaaCourseDashboard() {
           ]}
         />
       )}
+
+      <LoadMoreComponent
+        hasMore={hasMore}
+        loading={loadingMore}
+        onLoadMore={loadMore}
+      />
     </AppLayout>
   );
 }
@@ -16,6 +16,7 @@ import type {
   BaseCoursePageResponse,
   BaseSection,
 } from "../../types/baseTypes";
+import { formatSectionCompleteness } from "../../components/utils/formatSectionCompleteness";
 
 export default function VcaaCoursePage() {
   const { campus_id, loaded_course_id } = useParams();
@@ -58,6 +59,7 @@ export default function VcaaCoursePage() {
       course_and_section: courseCode
         ? `${courseCode} - ${s.year_and_section}`
         : s.year_and_section,
+      encoding_progress: formatSectionCompleteness(s.completeness),
     }));
 
     if (!q) return augmented;
@@ -140,6 +142,7 @@ export default function VcaaCoursePage() {
           columns={[
             { key: "course_and_section", label: "Course & Section" },
             { key: "instructor_assigned", label: "Instructor Assigned" },
+            { key: "encoding_progress", label: "Encoding Progress" },
           ]}
         />
       )}
@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from "react";
+import { useMemo, useState } from "react";
 import { useNavigate } from "react-router-dom";
 
 import AppLayout from "../../layout/AppLayout";
@@ -11,70 +11,29 @@ import { useLayout } from "../../context/useLayout";
 import { fetchVpaaLoadedCourses } from "../../api/vpaaDashboardApi";
 import type { BaseLoadedCourse } from "../../types/baseTypes";
 import InfoComponent from "../../components/InfoComponent";
+import LoadMoreComponent from "../../components/LoadMoreComponent";
 import { useInitialInfo } from "../../context/useInitialInfo";
+import { useLoadedCoursePages } from "../../context/useLoadedCoursePages";
 
 export default function VpaaCourseDashboard() {
   const navigate = useNavigate();
   const { layout } = useLayout();
 
-  const [courses, setCourses] = useState<BaseLoadedCourse[]>([]);
   const [searchQuery, setSearchQuery] = useState("");
-  const [loading, setLoading] = useState(true);
 
   const { initialInfoLoading } = useInitialInfo();
 
-  useEffect(() => {
-    let active = true;
+  const { courses, loading, loadingMore, hasMore, loadMore } =
+    useLoadedCoursePages(fetchVpaaLoadedCourses, searchQuery);
 
-    (async () => {
-      try {
-        setLoading(true);
-        const data = await fetchVpaaLoadedCourses();
-        if (!active) return;
-
-        setCourses(
-          data.map((c) => ({
-            ...c,
-            id: c.loaded_course_id,
-            academic_year_and_semester: `${c.academic_year_start}-${c.academic_year_end} / ${c.semester_type}`,
-            year_level: c.year_level_type,
-          }))
-        );
-      } catch (e) {
-        console.error("Failed to fetch University loaded courses", e);
-      } finally {
-        if (active) setLoading(false);
-      }
-    })();
-
-    return () => {
-      active = false;
-    };
-  }, []);
-
-  const filteredCourses = useMemo(() => {
-    const q = searchQuery.trim().toLowerCase();
-
-    const augmented = courses.map((course) => ({
-      ...course,
-      id: course.loaded_course_id,
-      academic_year_and_semester: `${course.academic_year_start}-${course.academic_year_end} / ${course.semester_type}`,
-      year_level: course.year_level_type,
-    }));
-
-    if (!q) return augmented;
-
-    return augmented.filter((course) =>
-      Object.values(course).some((val) => {
-        if (val == null) return false;
-        const t = typeof val;
-        if (t === "string" || t === "number" || t === "boolean") {
-          return String(val).toLowerCase().includes(q);
-        }
-        return false;
-      })
-    );
-  }, [searchQuery, courses]);
+  const filteredCourses = useMemo(
+    () =>
+      courses.map((course) => ({
+        ...course,
+        year_level: course.year_level_type,
+      })),
+    [courses]
+  );
 
   const goToUniversityCoursePage = (course: BaseLoadedCourse) => {
     navigate(`/university/${course.loaded_course_id}`, {
@@ -136,6 +95,12 @@ export default function VpaaCourseDashboard() {
           ]}
         />
       )}
+
+      <LoadMoreComponent
+        hasMore={hasMore}
+        loading={loadingMore}
+        onLoadMore={loadMore}
+      />
     </AppLayout>
   );
 }
@@ -15,6 +15,7 @@ import type {
   BaseCoursePageResponse,
   BaseSection,
 } from "../../types/baseTypes";
+import { formatSectionCompleteness } from "../../components/utils/formatSectionCompleteness";
 
 export default function VpaaCoursePage() {
   const { loaded_course_id } = useParams();
@@ -62,6 +63,7 @@ export default function VpaaCoursePage() {
       course_and_section: courseCode
         ? `${courseCode} - ${s.year_and_section}`
         : s.year_and_section,
+      encoding_progress: formatSectionCompleteness(s.completeness),
     }));
 
     if (!q) return augmented;
@@ -143,6 +145,7 @@ export default function VpaaCoursePage() {
           columns={[
             { key: "course_and_section", label: "Course & Section" },
             { key: "instructor_assigned", label: "Instructor Assigned" },
+            { key: "encoding_progress", label: "Encoding Progress" },
           ]}
         />
       )}
@@ -26,15 +26,46 @@ export interface BaseCourseDetails {
   campus_name: string;
 }
 
+export interface SectionCompleteness {
+  student_count: number;
+  assessment_count: number;
+  assessments_missing_highest_score: number;
+  assessments_without_outcome: number;
+  score_cell_count: number;
+  filled_score_count: number;
+  score_fill_rate: number;
+  outcomes_mapped: boolean;
+}
+
 export interface BaseSection {
   id: number;
   section_id: number;
   year_and_section: string;
   instructor_assigned: string;
   instructor_id: number | null;
+  provisioning_status?: "provisioning" | "ready" | "failed";
+  completeness?: SectionCompleteness;
 }
 
 export interface BaseCoursePageResponse {
   course_details: BaseCourseDetails;
   sections: BaseSection[];
 }
+
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+export interface LoadedCourseQuery {
+  cursor?: string;
+  page_size?: number;
+  search?: string;
+  academic_year_id?: number;
+  semester_id?: number;
+  year_level_id?: number;
+  program_id?: number;
+  department_id?: number;
+  college_id?: number;
+}
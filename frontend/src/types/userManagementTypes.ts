@@ -70,4 +70,13 @@ export interface FacultyPayload {
   chair_department?: number | null;
   dean_college?: number | null;
   vcaa_campus?: number | null;
-}
\ No newline at end of file
+}
+export interface FacultyQuery {
+  cursor?: string;
+  page_size?: number;
+  search?: string;
+  user_role_id?: number;
+  department_id?: number;
+  college_id?: number;
+  campus_id?: number;
+}